@@ -24,3 +24,13 @@ class SearchResponseDTO:
     response: str
     total_candidates: int
     ranking: list[CandidateResultDTO]
+
+
+@dataclass(frozen=True, slots=True)
+class CandidatePreScoreDTO:
+    """Pré-triagem barata de um candidato (sem LLM)."""
+    arquivo: str
+    score: float  # 0-100, combinação de similaridade e palavras-chave
+    similarity: float  # cosseno entre a vaga e a média dos embeddings dos chunks
+    keyword_overlap: float  # fração das palavras-chave da vaga presentes nos chunks
+    matched_keywords: list[str]
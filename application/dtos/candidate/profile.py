@@ -0,0 +1,38 @@
+"""DTO do perfil compacto de um currículo, extraído uma vez na indexação."""
+from dataclasses import dataclass, field
+from typing import Optional, final
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ResumeProfileDTO:
+    """Resumo estruturado do currículo usado nos prompts de avaliação no lugar do texto bruto."""
+    file_name: str
+    candidate_name: str
+    skills: list[str] = field(default_factory=list)
+    seniority: Optional[str] = None
+    education: list[str] = field(default_factory=list)
+    location: Optional[str] = None
+    experience_years: Optional[int] = None
+
+    def as_prompt_text(self) -> str:
+        """Perfil em poucas linhas, sempre na mesma ordem (prompts reproduzíveis)"""
+        nao_informado = "não identificado"
+        anos = f"{self.experience_years} anos" if self.experience_years is not None else nao_informado
+        return "\n".join([
+            f"Nome: {self.candidate_name}",
+            f"Senioridade: {self.seniority or nao_informado}",
+            f"Experiência declarada: {anos}",
+            f"Formação: {'; '.join(self.education) or nao_informado}",
+            f"Localização: {self.location or nao_informado}",
+            f"Habilidades: {', '.join(self.skills) or nao_informado}",
+        ])
+
+    def as_evidence(self, chunks: list[str], excerpt_chunks: int) -> list[str]:
+        """Evidências do prompt: o perfil + os primeiros excerpt_chunks chunks (os mais relevantes)"""
+        evidence = [f"PERFIL (extraído do currículo):\n{self.as_prompt_text()}"]
+        trechos = chunks[:excerpt_chunks]
+        if trechos:
+            evidence.append(f"TRECHOS MAIS RELEVANTES PARA A VAGA:\n{trechos[0]}")
+            evidence.extend(trechos[1:])
+        return evidence
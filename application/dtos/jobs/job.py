@@ -68,4 +68,5 @@ class JobDTO:
 class JobListDTO:
     """DTO for job list response."""
     jobs: list[JobDTO]
-    total: int
\ No newline at end of file
+    total: int
+    next_cursor: Optional[str] = None
\ No newline at end of file
@@ -0,0 +1,73 @@
+"""Paginação por cursor (keyset) para as listagens."""
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Generic, TypeVar, final
+
+from application.exceptions import InvalidCursorError
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+
+
+def clamp_page_size(limit: int | None, cursor: str | None = None) -> int | None:
+    """
+    Aplica o tamanho padrão e o limite máximo de página.
+
+    Sem limit e sem cursor devolve None: a listagem vem inteira, como antes da
+    paginação (clientes que não leem next_cursor não perdem itens).
+    """
+    if limit is None:
+        return DEFAULT_PAGE_SIZE if cursor else None
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PageCursor:
+    """
+    Posição da última linha entregue: (timestamp de ordenação, id).
+
+    key guarda o valor do timestamp como está gravado no banco quando ele é texto
+    (SQLite), para comparar a coluna crua e usar o índice.
+    """
+    timestamp: datetime
+    id: str | int
+    key: str | None = None
+
+    def encode(self) -> str:
+        """Cursor opaco (base64 url-safe de um JSON) devolvido ao cliente"""
+        data = {"t": self.timestamp.isoformat(), "id": self.id}
+        if self.key is not None:
+            data["k"] = self.key
+        raw = json.dumps(data, separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: str) -> "PageCursor":
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            timestamp = datetime.fromisoformat(data["t"])
+            item_id = data["id"]
+            key = data.get("k")
+        except (binascii.Error, ValueError, TypeError, KeyError, AttributeError) as e:
+            raise InvalidCursorError(f"Cursor inválido: {cursor}") from e
+        if not isinstance(item_id, (str, int)) or isinstance(item_id, bool):
+            raise InvalidCursorError(f"Cursor inválido: {cursor}")
+        if key is not None and not isinstance(key, str):
+            raise InvalidCursorError(f"Cursor inválido: {cursor}")
+        return cls(timestamp=timestamp, id=item_id, key=key)
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PageDTO(Generic[T]):
+    """Uma página de resultados; next_cursor é None na última página."""
+    items: list[T]
+    next_cursor: str | None = None
+    total: int | None = None
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from typing import final
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class BudgetedPromptDTO:
+    """Prompt montado dentro do teto de tokens, com a contagem real de cada parte."""
+    prompt: str
+    total_tokens: int
+    rubric_tokens: int  # instruções fixas do prompt
+    job_tokens: int
+    evidence_tokens: int
+    evidence_used: int  # trechos do currículo que couberam (o último pode ter sido cortado)
+    evidence_total: int
+    truncated: bool  # vaga ou currículo perderam texto para caber no teto
+
+    def summary(self) -> str:
+        """Linha de log com a distribuição dos tokens"""
+        return (
+            f"{self.total_tokens} tokens (regras {self.rubric_tokens}, vaga {self.job_tokens}, "
+            f"currículo {self.evidence_tokens}; {self.evidence_used}/{self.evidence_total} trechos"
+            f"{', cortado' if self.truncated else ''})"
+        )
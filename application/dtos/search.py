@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+from typing import final
+
+JOB_DOCUMENT = "job"
+RESUME_DOCUMENT = "resume"
+
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SearchDocumentDTO:
+    """Documento do índice de texto completo (vaga ou currículo)."""
+    kind: str
+    doc_id: str
+    owner_id: str
+    title: str
+    body: str
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SearchHitDTO:
+    """Resultado de uma busca, do mais relevante para o menos relevante."""
+    doc_id: str
+    title: str
+    score: float
+    snippet: str
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class MetadataFilterDTO:
+    """
+    Filtros de metadados da busca vetorial, aplicados antes do top-k.
+
+    None não filtra; um conjunto vazio não deixa passar nenhum chunk.
+    """
+    file_names: frozenset[str] | None = None
+    sections: frozenset[str] | None = None  # metadata "section" do chunker (EXPERIENCE, SKILLS...)
+
+    @property
+    def is_empty(self) -> bool:
+        return self.file_names is None and self.sections is None
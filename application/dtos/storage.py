@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from typing import final
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class StorageItemResultDTO:
+    """Resultado de um item de uma operação em lote no storage (upload_many/download_many)."""
+    name: str
+    location: str | None = None
+    content: bytes | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
@@ -19,3 +19,23 @@ class FailedPublishArtifactMessageBrokerException(Exception):
 @final
 class BusinessRuleViolationError(Exception):
     """Exception raised when a business rule is violated."""
+
+
+@final
+class InvalidCursorError(Exception):
+    """Exception raised when a pagination cursor cannot be decoded."""
+
+
+@final
+class LLMTimeoutError(Exception):
+    """Exception raised when the LLM does not answer within the configured timeout."""
+
+
+@final
+class StorageBatchError(Exception):
+    """Exception raised when one or more files of a batch storage operation fail."""
+
+    def __init__(self, failures: dict[str, str]):
+        self.failures = failures
+        details = "; ".join(f"{name}: {error}" for name, error in failures.items())
+        super().__init__(f"Falha ao armazenar {len(failures)} arquivo(s): {details}")
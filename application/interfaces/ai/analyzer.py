@@ -1,11 +1,13 @@
-from typing import Protocol
+from typing import Optional, Protocol
 from application.dtos.candidate.candidate import CandidateAnalysisDTO  # ✅ candidate (sem 's')
+from application.dtos.candidate.profile import ResumeProfileDTO
 
 class AIAnalyzerProtocol(Protocol):
     async def analyze_candidate(
         self, 
         chunks: list[str], 
-        job_description: str
+        job_description: str,
+        profile: Optional[ResumeProfileDTO] = None
     ) -> CandidateAnalysisDTO:
-        """Analyze candidate resume against job description"""
+        """Analyze candidate resume against job description (profile + top chunks when a profile is given)"""
         ...
\ No newline at end of file
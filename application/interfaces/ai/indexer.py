@@ -1,16 +1,61 @@
-from typing import Protocol, TYPE_CHECKING
+from typing import Optional, Protocol, TYPE_CHECKING
 from pathlib import Path
 
+from application.dtos.candidate.profile import ResumeProfileDTO
+from application.dtos.search import MetadataFilterDTO
+
 if TYPE_CHECKING:
     from llama_index.core import VectorStoreIndex
+    from llama_index.core.retrievers import BaseRetriever
 
 class IndexerProtocol(Protocol):
     async def index_documents(self, file_paths: list[Path]) -> str:
         """Returns vector_index_id"""
         ...
     
-    async def search(self, index_id: str, query: str, top_k: int) -> list[dict]:
-        """Returns list of relevant chunks with metadata"""
+    async def search(
+        self, index_id: str, query: str, top_k: int, filters: Optional[MetadataFilterDTO] = None
+    ) -> list[dict]:
+        """Returns list of relevant chunks with metadata (filters applied before top_k)"""
+        ...
+    
+    async def search_many(
+        self,
+        index_ids: list[str],
+        query: str,
+        top_k: int,
+        filters: Optional[dict[str, MetadataFilterDTO]] = None,
+    ) -> list[dict]:
+        """Federated search: global top_k across indexes (filters per index_id); results carry index_id"""
+        ...
+    
+    async def get_retriever(
+        self, index_id: str, top_k: int, filters: Optional[MetadataFilterDTO] = None
+    ) -> "BaseRetriever":
+        """Retriever (hybrid dense + BM25 when available) returning top_k chunks matching filters"""
+        ...
+    
+    async def get_federated_retriever(
+        self,
+        index_ids: list[str],
+        top_k: int,
+        filters: Optional[dict[str, MetadataFilterDTO]] = None,
+    ) -> "BaseRetriever":
+        """Retriever over several indexes, queried concurrently and merged into a global top_k"""
+        ...
+    
+    async def get_node_embeddings(self, index_ids: list[str], node_ids: list[str]) -> dict[str, list[float]]:
+        """Stored chunk embeddings by node_id (no embedding model call); unknown ids are omitted"""
+        ...
+    
+    async def get_resume_profiles(
+        self, index_ids: list[str], file_names: list[str]
+    ) -> dict[str, ResumeProfileDTO]:
+        """Compact resume profiles extracted at index time, by file_name; files without one are omitted"""
+        ...
+    
+    async def delete_index(self, index_id: str) -> None:
+        """Drops an index no resume uses anymore (releases its archive in the blob store)"""
         ...
     
     async def load_index(self, index_id: str) -> "VectorStoreIndex":
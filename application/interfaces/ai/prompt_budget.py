@@ -0,0 +1,22 @@
+from typing import Callable, Optional, Protocol
+
+from application.dtos.prompt import BudgetedPromptDTO
+
+
+class PromptBudgetProtocol(Protocol):
+    def count_tokens(self, text: str) -> int:
+        """Tokens of text in the configured tokenizer"""
+        ...
+
+    def fit(
+        self,
+        render: Callable[[str, str], str],
+        job_description: str,
+        evidence: list[str],
+        max_tokens: Optional[int] = None,
+    ) -> BudgetedPromptDTO:
+        """
+        Builds render(job_description, evidence_text) within max_tokens (default: configured ceiling).
+        Evidence is filled in the given (relevance) order; the first item is always kept, truncated if needed.
+        """
+        ...
@@ -0,0 +1,14 @@
+from typing import Protocol
+
+from application.dtos.candidate.analysis import CandidatePreScoreDTO
+
+
+class CandidateShortlisterProtocol(Protocol):
+    async def pre_score(
+        self,
+        query: str,
+        index_ids: list[str],
+        candidates: dict[str, list[tuple[str, str]]],
+    ) -> list[CandidatePreScoreDTO]:
+        """Ranks candidates (file_name -> [(node_id, chunk text)]) best first, without LLM calls"""
+        ...
@@ -1,4 +1,5 @@
 from typing import Protocol, Optional
+from application.dtos.pagination import PageDTO
 from domain.entities.candidates.job_application import JobApplicationEntity
 
 
@@ -12,6 +13,11 @@ class JobApplicationRepositoryProtocol(Protocol):
     async def get_by_user_id(self, user_id: str) -> list[JobApplicationEntity]:
         ...
 
+    async def get_page_by_user_id(
+        self, user_id: str, limit: Optional[int], cursor: Optional[str] = None
+    ) -> PageDTO[JobApplicationEntity]:
+        ...
+
     async def update(self, entity: JobApplicationEntity) -> JobApplicationEntity:
         ...
 
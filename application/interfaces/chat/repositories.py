@@ -2,6 +2,7 @@ from abc import abstractmethod
 from typing import Protocol, List
 from uuid import UUID
 
+from application.dtos.pagination import PageDTO
 from domain.entities.chat.chat_session import ChatSessionEntity
 from domain.entities.chat.chat_message import ChatMessageEntity
 
@@ -12,6 +13,12 @@ class ChatRepositoryProtocol(Protocol):
         """Create a new chat session."""
         ...
 
+    @abstractmethod
+    async def create_session_with_retention(self, session: ChatSessionEntity, max_sessions: int) -> int:
+        """Create a chat session and, in the same transaction, delete all but the user's newest max_sessions.
+        Returns the number of sessions deleted."""
+        ...
+
     @abstractmethod
     async def get_sessions_by_user(self, user_id: UUID) -> List[ChatSessionEntity]:
         """Get all chat sessions for a user."""
@@ -32,6 +39,13 @@ class ChatRepositoryProtocol(Protocol):
         """Get all messages for a chat session."""
         ...
 
+    @abstractmethod
+    async def get_messages_page(
+        self, session_id: UUID, limit: int | None, cursor: str | None = None
+    ) -> PageDTO[ChatMessageEntity]:
+        """Get one page of a session's messages, oldest first."""
+        ...
+
     @abstractmethod
     async def delete_session(self, session_id: UUID) -> None:
         """Delete a chat session and its messages."""
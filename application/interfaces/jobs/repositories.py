@@ -3,6 +3,7 @@ from abc import abstractmethod
 from typing import Protocol
 from uuid import UUID
 
+from application.dtos.pagination import PageDTO
 from domain.entities.jobs.job import JobEntity, JobStatus, JobType
 
 
@@ -24,6 +25,18 @@ class JobRepositoryProtocol(Protocol):
         """Retrieves all active jobs."""
         ...
 
+    @abstractmethod
+    async def get_page_by_user_id(
+        self, user_id: UUID, limit: int | None, cursor: str | None = None
+    ) -> PageDTO[JobEntity]:
+        """Retrieves one page of a user's jobs, newest first."""
+        ...
+
+    @abstractmethod
+    async def get_active_page(self, limit: int | None, cursor: str | None = None) -> PageDTO[JobEntity]:
+        """Retrieves one page of active jobs, newest first."""
+        ...
+
     @abstractmethod
     async def save(self, job: JobEntity) -> None:
         """Saves a new job or updates an existing one."""
@@ -37,4 +50,9 @@ class JobRepositoryProtocol(Protocol):
     @abstractmethod
     async def count_by_user_id(self, user_id: UUID) -> int:
         """Counts the number of jobs created by a specific user."""
+        ...
+
+    @abstractmethod
+    async def count_active(self) -> int:
+        """Counts the number of active jobs."""
         ...
\ No newline at end of file
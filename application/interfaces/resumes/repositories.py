@@ -2,6 +2,7 @@
 from typing import Protocol
 from uuid import UUID
 
+from application.dtos.pagination import PageDTO
 from domain.entities.resumes.resume import ResumeEntity
 
 
@@ -12,26 +13,64 @@ class ResumeRepositoryProtocol(Protocol):
         """Adiciona um currículo ao repositório."""
         ...
     
+    async def add_many(self, resumes: list[ResumeEntity]) -> None:
+        """Adiciona vários currículos em uma única instrução."""
+        ...
+    
     async def get_by_id(self, resume_id: UUID) -> ResumeEntity | None:
         """Busca um currículo por ID."""
         ...
     
-    async def get_by_vector_index_id(self, index_id: str) -> list[ResumeEntity]:
-        """Busca todos os currículos de um índice vetorial."""
+    async def get_owned(self, resume_id: UUID, user_id: UUID) -> ResumeEntity | None:
+        """Busca um currículo por ID somente se pertencer ao usuário."""
+        ...
+    
+    async def get_by_ids(self, resume_ids: list[UUID], user_id: UUID | None = None) -> list[ResumeEntity]:
+        """Busca vários currículos em uma consulta (opcionalmente só os do usuário)."""
+        ...
+    
+    async def get_by_group_id(self, group_id: str, user_id: UUID) -> list[ResumeEntity]:
+        """Busca os currículos de um grupo do usuário em uma única consulta."""
+        ...
+    
+    async def get_index_summaries(self, user_id: UUID) -> list[dict]:
+        """Resumo agregado por índice do usuário: vector_index_id, resume_count, first_uploaded_at."""
+        ...
+    
+    async def get_by_vector_index_id(self, index_id: str, user_id: UUID | None = None) -> list[ResumeEntity]:
+        """Busca todos os currículos de um índice vetorial (opcionalmente só os do usuário)."""
+        ...
+    
+    async def get_by_vector_index_ids(self, index_ids: list[str], user_id: UUID | None = None) -> list[ResumeEntity]:
+        """Busca os currículos de vários índices vetoriais em uma consulta (opcionalmente só os do usuário)."""
         ...
     
     async def exists_by_file_name(self, file_name: str) -> bool:
         """Verifica se um currículo com esse nome de arquivo já existe."""
         ...
     
+    async def get_upload_conflicts(self, user_id: UUID, file_names: list[str]) -> tuple[int, list[str]]:
+        """Retorna, em uma consulta, o total de currículos do usuário e os nomes já existentes que colidem com file_names."""
+        ...
+    
     async def get_all_vector_index_ids(self) -> list[str]:
         """Busca todos os IDs únicos de índices vetoriais."""
         ...
     
+    async def get_all_file_paths(self) -> list[str]:
+        """Busca todos os file_path referenciados (usado pela coleta de lixo do storage)."""
+        ...
+    
     async def get_by_user_id(self, user_id: UUID) -> list[ResumeEntity]:
         """Busca todos os currículos de um usuário."""
         ...
     
+    async def get_page_by_user_id(
+        self, user_id: UUID, limit: int | None, cursor: str | None = None
+    ) -> PageDTO[ResumeEntity]:
+        """Busca uma página dos currículos de um usuário (mais recentes primeiro)."""
+        ...
+    
     async def count_by_user_id(self, user_id: UUID) -> int:
         """Conta o número de currículos de um usuário."""
         ...
@@ -40,6 +79,14 @@ class ResumeRepositoryProtocol(Protocol):
         """Busca todos os currículos."""
         ...
     
+    async def delete_owned(self, resume_id: UUID, user_id: UUID | None = None) -> tuple[str, str | None] | None:
+        """Remove um currículo (do usuário, se informado) e retorna (file_path, vector_index_id); None se nada foi removido."""
+        ...
+    
+    async def count_by_vector_index_id(self, index_id: str) -> int:
+        """Conta os currículos (de qualquer usuário) que estão em um índice vetorial."""
+        ...
+    
     async def delete(self, resume_id: UUID) -> bool:
         """Remove um currículo por ID. Retorna True se removido, False se não encontrado."""
         ...
\ No newline at end of file
@@ -0,0 +1,30 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from application.dtos.search import SearchDocumentDTO, SearchHitDTO
+
+
+class FullTextSearchProtocol(Protocol):
+    """Protocol for the keyword (full-text) index over jobs and resumes.
+
+    Writes run in the caller's transaction, so the index changes together with
+    the rows it describes.
+    """
+
+    @abstractmethod
+    async def upsert(self, documents: list[SearchDocumentDTO]) -> None:
+        """Insert or replace documents (keyed by kind + doc_id)."""
+        ...
+
+    @abstractmethod
+    async def delete(self, kind: str, doc_ids: list[str]) -> None:
+        """Remove documents; unknown ids are ignored."""
+        ...
+
+    @abstractmethod
+    async def search(self, kind: str, query: str, owner_id: str, limit: int) -> list[SearchHitDTO]:
+        """Ranked keyword search over one owner's documents of a kind.
+
+        Every term must match (prefix match, Portuguese stemming where available).
+        """
+        ...
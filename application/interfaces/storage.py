@@ -0,0 +1,112 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from application.dtos.storage import StorageItemResultDTO
+
+
+class BlobStoreProtocol(Protocol):
+    """Protocol for content-addressed blob storage.
+
+    Blobs are keyed by the SHA-256 of their (uncompressed) content, so identical
+    uploads share a single stored copy. Each ``put`` adds a reference and each
+    ``release`` drops one; the stored copy is removed when no references remain.
+    """
+
+    @abstractmethod
+    async def put(self, content: bytes, extension: str, compress: bool | None = None) -> str:
+        """Store content (or reuse an identical stored copy) and add a reference.
+
+        Args:
+            content: Raw file content
+            extension: File extension (e.g. 'pdf', '.docx', 'zip')
+            compress: Force (True) or disable (False) zstd compression;
+                None compresses only compressible extensions
+
+        Returns:
+            Location string to persist (e.g. resumes.file_path)
+        """
+        ...
+
+    @abstractmethod
+    async def put_many(self, files: list[tuple[str, bytes, str]]) -> list[StorageItemResultDTO]:
+        """Batch version of ``put``.
+
+        Args:
+            files: List of (name, content, extension)
+
+        Returns:
+            One result per file, in input order, with either ``location`` or ``error``
+        """
+        ...
+
+    @abstractmethod
+    async def get(self, location: str) -> bytes:
+        """Return the original (decompressed) content stored at a location.
+
+        Raises:
+            FileNotFoundError: If the blob does not exist
+        """
+        ...
+
+    @abstractmethod
+    async def get_many(self, locations: list[str]) -> list[StorageItemResultDTO]:
+        """Batch version of ``get``; one result per location with ``content`` or ``error``."""
+        ...
+
+    @abstractmethod
+    async def get_by_digest(self, digest: str) -> bytes:
+        """Return the content of a blob by its SHA-256 digest.
+
+        Raises:
+            FileNotFoundError: If no blob with this digest is registered
+        """
+        ...
+
+    @abstractmethod
+    async def list_blobs(self) -> list[dict]:
+        """List every stored object (including legacy name-keyed files).
+
+        Returns:
+            Dicts with ``location``, ``size`` and ``modified_at`` (datetime or None)
+
+        Raises:
+            NotImplementedError: If the backend cannot list its contents
+        """
+        ...
+
+    @abstractmethod
+    async def delete_many(self, locations: list[str]) -> list[StorageItemResultDTO]:
+        """Delete stored objects directly, ignoring reference counts (used by garbage collection)."""
+        ...
+
+    @abstractmethod
+    async def compact(self) -> None:
+        """Give freed space back to the backend after large deletions (no-op where not needed)."""
+        ...
+
+    @abstractmethod
+    def content_digest(self, location: str) -> str | None:
+        """Return the SHA-256 of a blob from its location, without fetching it.
+
+        Returns:
+            The hex digest, or None for locations not created by the blob store
+        """
+        ...
+
+    @abstractmethod
+    async def release(self, location: str) -> bool:
+        """Drop one reference; delete the stored copy when none remain.
+
+        Returns:
+            True if the stored copy was deleted, False if it is still referenced
+        """
+        ...
+
+    @abstractmethod
+    async def release_digest(self, digest: str) -> bool:
+        """Same as ``release`` for a blob known only by its SHA-256 (e.g. an index archive).
+
+        Returns:
+            True if the stored copy was deleted, False if still referenced or unknown
+        """
+        ...
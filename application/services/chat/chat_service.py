@@ -3,6 +3,7 @@ from typing import final, List
 from uuid import UUID, uuid4
 from datetime import datetime, UTC
 
+from application.dtos.pagination import PageDTO, clamp_page_size
 from application.interfaces.chat.repositories import ChatRepositoryProtocol
 from domain.entities.chat.chat_session import ChatSessionEntity
 from domain.entities.chat.chat_message import ChatMessageEntity
@@ -25,10 +26,7 @@ class ChatService:
             title=title,
             created_at=datetime.now(UTC),
         )
-        await self.chat_repository.create_session(session)
-        all_sessions = await self.chat_repository.get_sessions_by_user(user_id)
-        for old_session in all_sessions[self.MAX_SESSIONS_PER_USER:]:
-            await self.chat_repository.delete_session(old_session.session_id)
+        await self.chat_repository.create_session_with_retention(session, self.MAX_SESSIONS_PER_USER)
         return session
 
     async def get_user_sessions(self, user_id: UUID) -> List[ChatSessionEntity]:
@@ -55,6 +53,12 @@ class ChatService:
         """Get all messages for a chat session."""
         return await self.chat_repository.get_messages_by_session(session_id)
 
+    async def get_session_messages_page(
+        self, session_id: UUID, limit: int | None = None, cursor: str | None = None
+    ) -> PageDTO[ChatMessageEntity]:
+        """Get a session's messages, oldest first; all of them unless limit or cursor is given."""
+        return await self.chat_repository.get_messages_page(session_id, clamp_page_size(limit, cursor), cursor)
+
     async def delete_session(self, session_id: UUID, user_id: UUID) -> bool:
         """
         Delete a chat session if it belongs to the user. Returns True if deleted, False if not found or not owner.
@@ -3,14 +3,21 @@ import os
 import hashlib
 from dataclasses import dataclass
 from typing import final
+from uuid import UUID
 
 from llama_index.core import Settings
 
-from application.dtos.candidate.analysis import SearchResponseDTO, CandidateResultDTO
+from application.dtos.candidate.analysis import CandidatePreScoreDTO, SearchResponseDTO, CandidateResultDTO
+from application.dtos.search import MetadataFilterDTO
 from application.interfaces.ai.indexer import IndexerProtocol
 from application.interfaces.ai.location_analyzer import LocationAnalyzerProtocol
+from application.interfaces.ai.prompt_budget import PromptBudgetProtocol
+from application.interfaces.ai.shortlister import CandidateShortlisterProtocol
 from application.interfaces.resumes.repositories import ResumeRepositoryProtocol
 
+# Nota heurística fica abaixo da nota mínima de recomendação (60): sem o LLM ninguém é recomendado
+HEURISTIC_SCORE_CAP = 59
+
 
 @final
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -20,14 +27,41 @@ class SearchCandidatesUseCase:
     indexer: IndexerProtocol
     location_analyzer: LocationAnalyzerProtocol | None = None
     resume_repository: ResumeRepositoryProtocol
+    # Pré-triagem: só os llm_shortlist_size melhores (com nota heurística >= llm_shortlist_min_score)
+    # vão para o LLM; os demais recebem a nota heurística. None ou tamanho 0 = todos vão para o LLM
+    shortlister: CandidateShortlisterProtocol | None = None
+    llm_shortlist_size: int = 10
+    llm_shortlist_min_score: float = 0.0
+    # Prompt de avaliação com o perfil extraído na indexação + os chunks mais relevantes,
+    # no lugar de todos os chunks recuperados (currículos sem perfil usam o texto completo)
+    use_resume_profiles: bool = True
+    profile_excerpt_chunks: int = 3
+    # Teto de tokens do prompt de avaliação (regras + vaga + currículo); None = sem controle
+    prompt_budget: PromptBudgetProtocol | None = None
     
-    async def execute(self, query: str, index_id: str) -> SearchResponseDTO:
+    async def execute(
+        self,
+        query: str,
+        index_id: str | None = None,
+        group_id: str | None = None,
+        user_id: UUID | None = None,
+        sections: frozenset[str] | None = None,
+        index_ids: list[str] | None = None,
+    ) -> SearchResponseDTO:
         """
         Analisa candidatos baseado em uma descrição de vaga.
         
+        Com mais de um índice (index_ids, ou um grupo cujos currículos estão em vários
+        uploads) a busca é federada: top-k em cada índice em paralelo e ranking único.
+        
         Args:
             query: Descrição da vaga
             index_id: ID do índice vetorial
+            group_id: Restringe a análise aos currículos do grupo (exige user_id, dono do grupo);
+                sem índice informado, usa todos os índices dos currículos do grupo
+            user_id: Usuário logado
+            sections: Restringe a busca a chunks dessas seções do currículo
+            index_ids: IDs de vários índices vetoriais (somados ao index_id)
             
         Returns:
             SearchResponseDTO com ranking de candidatos
@@ -39,8 +73,20 @@ class SearchCandidatesUseCase:
                 "A descrição da vaga é muito longa. O limite máximo é de 5000 caracteres."
             )
         
+        target_index_ids = list(dict.fromkeys([*([index_id] if index_id else []), *(index_ids or [])]))
+        if group_id is not None:
+            resumes_in_index = [
+                r for r in await self.resume_repository.get_by_group_id(group_id, user_id)
+                if r.vector_index_id and (not target_index_ids or r.vector_index_id in target_index_ids)
+            ]
+            target_index_ids = list(dict.fromkeys(r.vector_index_id for r in resumes_in_index))
+        elif target_index_ids:
+            resumes_in_index = await self.resume_repository.get_by_vector_index_ids(target_index_ids)
+        else:
+            from application.exceptions import BusinessRuleViolationError
+            raise BusinessRuleViolationError("Informe o índice (index_id ou index_ids) ou o grupo a analisar.")
+        
         # Validação: verificar se há pelo menos 2 currículos indexados
-        resumes_in_index = await self.resume_repository.get_by_vector_index_id(index_id)
         if len(resumes_in_index) < 2:
             from application.exceptions import BusinessRuleViolationError
             raise BusinessRuleViolationError(
@@ -48,14 +94,27 @@ class SearchCandidatesUseCase:
                 f"Atualmente há {len(resumes_in_index)} currículo(s) neste índice."
             )
         
-        print(f"[DEBUG] Iniciando análise com index_id: {index_id}")
+        # Filtro aplicado em cada índice antes do top-k: com grupo, só os chunks dos currículos dele são pontuados
+        filters = {
+            target: MetadataFilterDTO(
+                file_names=(
+                    frozenset(r.file_name for r in resumes_in_index if r.vector_index_id == target)
+                    if group_id is not None else None
+                ),
+                sections=sections,
+            )
+            for target in target_index_ids
+        }
+        
+        print(f"[DEBUG] Iniciando análise com índices: {target_index_ids}")
         print(f"[DEBUG] Query: {query}")
         
         vaga_hash = hashlib.md5(query.lower().strip().encode()).hexdigest()[:8]
         print(f"[DEBUG] Hash da vaga para consistência: {vaga_hash}")
         
         try:
-            index = await self.indexer.load_index(index_id)
+            # Retriever híbrido (vetorial + BM25) com os 50 chunks mais relevantes entre todos os índices
+            retriever = await self.indexer.get_federated_retriever(target_index_ids, top_k=50, filters=filters)
             print(f"[DEBUG] Índice carregado com sucesso")
         except Exception as e:
             print(f"[ERROR] Falha ao carregar índice: {str(e)}")
@@ -108,7 +167,6 @@ class SearchCandidatesUseCase:
             )
 
         # 1. Recupera chunks relevantes (async para evitar "coroutine was never awaited" com instrumentação)
-        retriever = index.as_retriever(similarity_top_k=50)
         nodes = await retriever.aretrieve(query)
         
         print(f"[DEBUG] Total de nodes recuperados: {len(nodes)}")
@@ -116,23 +174,48 @@ class SearchCandidatesUseCase:
 
         # 2. Agrupa chunks por arquivo (candidato)
         candidatos_dict = {}
+        candidatos_nodes = {}
         for node in nodes:
             file_name = node.metadata.get("file_name", "Desconhecido")
             print(f"[DEBUG] Node metadata: {node.metadata}")
             if file_name not in candidatos_dict:
                 candidatos_dict[file_name] = []
+                candidatos_nodes[file_name] = []
             # Acessa o texto do node corretamente
             node_text = node.node.text if hasattr(node, 'node') else node.get_content()
             candidatos_dict[file_name].append(node_text)
+            candidatos_nodes[file_name].append((node.node.node_id, node_text))
         
         print(f"[DEBUG] Total de candidatos agrupados: {len(candidatos_dict)}")
         print(f"[DEBUG] Candidatos agrupados: {candidatos_dict}")
 
-        # 3. Loop de Avaliação Individual
+        # 3. Pré-triagem barata: limita quantos candidatos vão para o LLM
         resultados = []
-        
-        for file_name, chunks in candidatos_dict.items():
+        avaliar_com_llm = candidatos_dict
+        nao_avaliados: set[str] = set()  # arquivos só com nota heurística
+        if self.shortlister is not None and self.llm_shortlist_size > 0:
+            pre_scores = await self.shortlister.pre_score(query, target_index_ids, candidatos_nodes)
+            selecionados = {
+                p.arquivo for p in pre_scores[:self.llm_shortlist_size] if p.score >= self.llm_shortlist_min_score
+            }
+            avaliar_com_llm = {f: c for f, c in candidatos_dict.items() if f in selecionados}
+            nao_avaliados = {p.arquivo for p in pre_scores if p.arquivo not in selecionados}
+            resultados.extend(self._heuristic_result(p) for p in pre_scores if p.arquivo in nao_avaliados)
+            print(f"[DEBUG] Pré-triagem: {len(avaliar_com_llm)} de {len(candidatos_dict)} candidatos vão para o LLM")
+
+        perfis = {}
+        if self.use_resume_profiles and avaliar_com_llm:
+            perfis = await self.indexer.get_resume_profiles(target_index_ids, list(avaliar_com_llm))
+
+        # 4. Loop de Avaliação Individual
+        for file_name, chunks in avaliar_com_llm.items():
             texto_completo = "\n\n".join(chunks)
+            # Evidências em ordem de relevância (chunks já vêm ordenados pela busca)
+            perfil = perfis.get(file_name)
+            if perfil is not None:
+                evidencias = perfil.as_evidence(chunks, self.profile_excerpt_chunks)
+            else:
+                evidencias = list(chunks)
             
             # Análise de localização (se disponível)
             location_analysis = None
@@ -147,14 +230,15 @@ class SearchCandidatesUseCase:
                     print(f"[WARNING] Erro ao analisar localização para {file_name}: {str(e)}")
             
             # Prompt estruturado para MÁXIMA CONSISTÊNCIA
-            prompt = f"""
+            def montar_prompt(vaga: str, curriculo: str) -> str:
+                return f"""
 Você é um recrutador técnico experiente. Siga RIGOROSAMENTE os critérios padronizados abaixo.
 
 ID DA VAGA: {vaga_hash} (Use para manter consistência entre análises)
-VAGA: {query}
+VAGA: {vaga}
 
 CURRÍCULO DO CANDIDATO:
-{texto_completo}
+{curriculo}
 
 CRITÉRIOS DE AVALIAÇÃO PADRONIZADOS:
 
@@ -233,6 +317,13 @@ EXEMPLO DE ANALISE CORRETA:
 + CORRETO: "Tem ensino medio completo (cursando Engenharia de Software)"
 """
 
+            if self.prompt_budget is not None:
+                orcamento = self.prompt_budget.fit(montar_prompt, query, evidencias)
+                prompt = orcamento.prompt
+                print(f"[DEBUG] Prompt de avaliação de {file_name}: {orcamento.summary()}")
+            else:
+                prompt = montar_prompt(query, "\n\n".join(evidencias))
+
             try:
                 print(f"[DEBUG] Enviando prompt para LLM para candidato: {file_name}")
                 response = await llm_model.acomplete(prompt)
@@ -331,7 +422,7 @@ EXEMPLO DE ANALISE CORRETA:
                 
                 resultados.append(resultado_erro)
 
-        # 4. Ordena por score com critérios de desempate
+        # 5. Ordena por score com critérios de desempate
         def get_location_priority(resultado):
             """Retorna prioridade de localização (maior = melhor)"""
             if not resultado.location_analysis:
@@ -370,11 +461,14 @@ EXEMPLO DE ANALISE CORRETA:
         candidatos_validos = [r for r in resultados_ordenados if r.score > 0]
         candidatos_descartados = [r for r in resultados_ordenados if r.score == 0]
 
-        # 5. Monta resposta textual para o frontend
+        # 6. Monta resposta textual para o frontend
         if resultados_ordenados:
             NOTA_MINIMA_RECOMENDACAO = 60
             candidatos_adequados = [r for r in resultados_ordenados if r.score >= NOTA_MINIMA_RECOMENDACAO]
-            candidatos_inadequados = [r for r in resultados_ordenados if r.score < NOTA_MINIMA_RECOMENDACAO]
+            candidatos_inadequados = [
+                r for r in resultados_ordenados if r.score < NOTA_MINIMA_RECOMENDACAO and r.arquivo not in nao_avaliados
+            ]
+            candidatos_heuristicos = [r for r in resultados_ordenados if r.arquivo in nao_avaliados]
             
             candidatos_com_erro_api = [r for r in resultados_ordenados if "401 Unauthorized" in r.justificativa or "Erro de autenticação" in r.justificativa]
             
@@ -498,9 +592,16 @@ EXEMPLO DE ANALISE CORRETA:
                         elif r.score < 50:
                             motivo = "Experiência insuficiente"
                         resposta_texto += f"\n• {r.nome_candidato} ({r.score}/100) - {motivo}"
+                
+                if candidatos_heuristicos:
+                    resposta_texto += self._heuristic_section(candidatos_heuristicos)
             
             else:
-                melhor_inadequado = resultados_ordenados[0] if resultados_ordenados else None
+                # Prefere quem foi avaliado pelo LLM (a nota heurística não traz análise)
+                melhor_inadequado = next(
+                    (r for r in resultados_ordenados if r.arquivo not in nao_avaliados),
+                    resultados_ordenados[0],
+                )
                 
                 resposta_texto = f"NENHUM CANDIDATO ATENDE OS CRITÉRIOS MÍNIMOS\n\n"
                 
@@ -531,10 +632,14 @@ EXEMPLO DE ANALISE CORRETA:
                 resposta_texto += "• Amplie a busca ou revise requisitos\n"
                 resposta_texto += "• Nenhum candidato atual possui o perfil adequado para esta posição\n\n"
                 
-                resposta_texto += "TODOS OS CANDIDATOS ENCONTRADOS:"
-                for idx, r in enumerate(resultados_ordenados, 1):
+                resposta_texto += "TODOS OS CANDIDATOS AVALIADOS:"
+                avaliados = [r for r in resultados_ordenados if r.arquivo not in nao_avaliados]
+                for idx, r in enumerate(avaliados, 1):
                     resposta_texto += f"\n{idx}. {r.nome_candidato} - Nota: {r.score}/100"
                 
+                if candidatos_heuristicos:
+                    resposta_texto += self._heuristic_section(candidatos_heuristicos)
+                
                 if candidatos_descartados:
                     resposta_texto += "\n\nCANDIDATOS DESCARTADOS (localização incompatível):"
                     for r in candidatos_descartados:
@@ -549,3 +654,30 @@ EXEMPLO DE ANALISE CORRETA:
             total_candidates=len(resultados_ordenados),
             ranking=resultados_ordenados
         )
+    
+    @staticmethod
+    def _heuristic_section(candidatos: list[CandidateResultDTO]) -> str:
+        """Bloco da resposta para quem ficou fora da pré-triagem: só a nota, sem motivo do LLM"""
+        texto = "\n\nNÃO AVALIADOS PELO LLM (nota heurística da pré-triagem):"
+        for r in candidatos[:5]:  # Máximo 5 para não poluir
+            texto += f"\n• {r.nome_candidato} ({r.score}/100)"
+        if len(candidatos) > 5:
+            texto += f"\n• ... e mais {len(candidatos) - 5}"
+        return texto
+    
+    @staticmethod
+    def _heuristic_result(pre_score: CandidatePreScoreDTO) -> CandidateResultDTO:
+        """Resultado de quem ficou fora do corte da pré-triagem (não avaliado pelo LLM)"""
+        palavras = ", ".join(pre_score.matched_keywords) or "nenhuma"
+        return CandidateResultDTO(
+            arquivo=pre_score.arquivo,
+            nome_candidato=pre_score.arquivo.replace('.pdf', '').replace('-', ' ').title(),
+            score=min(HEURISTIC_SCORE_CAP, max(1, round(pre_score.score))),
+            pontos_fortes=[f"Palavras-chave da vaga no currículo: {palavras}"] if pre_score.matched_keywords else [],
+            pontos_fracos=["Não avaliado pelo LLM (abaixo do corte da pré-triagem)"],
+            justificativa=(
+                f"NOTA HEURÍSTICA (pré-triagem, sem análise do LLM): similaridade semântica "
+                f"{pre_score.similarity:.2f}, {pre_score.keyword_overlap:.0%} das palavras-chave da vaga "
+                f"presentes ({palavras})."
+            ),
+        )
@@ -38,12 +38,14 @@ class AnalyzeCandidatesUseCase:
         chunks = await self.indexer.search(index_id, job_description, top_k=50)
         
         candidates_map = self._group_by_candidate(chunks)
+        profiles = await self.indexer.get_resume_profiles([index_id], list(candidates_map))
         
         analyses = []
         for file_name, candidate_chunks in candidates_map.items():
             analysis = await self.analyzer.analyze_candidate(
                 chunks=candidate_chunks,
-                job_description=job_description
+                job_description=job_description,
+                profile=profiles.get(file_name)
             )
             analyses.append(analysis)
         
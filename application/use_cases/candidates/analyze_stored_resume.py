@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from typing import final
 from uuid import UUID
 
+from application.dtos.search import MetadataFilterDTO
 from application.interfaces.ai.indexer import IndexerProtocol
 from application.interfaces.ai.analyzer import AIAnalyzerProtocol
 from application.interfaces.candidates.repositories import JobApplicationRepositoryProtocol
@@ -48,7 +49,9 @@ class AnalyzeStoredResumeUseCase:
         search_results = await self.indexer.search(
             index_id=resume.vector_index_id,
             query=query,
-            top_k=10  # Buscar os 10 chunks mais relevantes
+            top_k=10,  # Buscar os 10 chunks mais relevantes
+            # O índice pode ter outros currículos do lote: pontua só os chunks deste
+            filters=MetadataFilterDTO(file_names=frozenset({resume.file_name})),
         )
 
         # 5. Extrair o texto dos chunks encontrados
@@ -63,10 +66,12 @@ class AnalyzeStoredResumeUseCase:
             # Fallback: se não encontrou chunks relevantes, usar uma mensagem padrão
             resume_chunks = [f"Currículo de {resume.candidate_name} - arquivo: {resume.file_name}"]
 
-        # 6. Analisar usando IA
+        # 6. Analisar usando IA (perfil extraído na indexação, se houver)
+        profiles = await self.indexer.get_resume_profiles([resume.vector_index_id], [resume.file_name])
         analysis_result = await self.analyzer.analyze_candidate(
             chunks=resume_chunks,
-            job_description=job_application.description
+            job_description=job_application.description,
+            profile=profiles.get(resume.file_name)
         )
 
         # 7. Retornar resultado
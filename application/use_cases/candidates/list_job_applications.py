@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import final
 from application.dtos.candidates.job_application import JobApplicationDTO
+from application.dtos.pagination import PageDTO, clamp_page_size
 from application.interfaces.candidates.repositories import JobApplicationRepositoryProtocol
 
 
@@ -9,9 +10,14 @@ from application.interfaces.candidates.repositories import JobApplicationReposit
 class ListJobApplicationsUseCase:
     repository: JobApplicationRepositoryProtocol
 
-    async def __call__(self, user_id: str) -> list[JobApplicationDTO]:
-        entities = await self.repository.get_by_user_id(user_id)
-        return [
+    async def __call__(
+        self,
+        user_id: str,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> PageDTO[JobApplicationDTO]:
+        page = await self.repository.get_page_by_user_id(user_id, clamp_page_size(limit, cursor), cursor)
+        items = [
             JobApplicationDTO(
                 id=e.id,
                 user_id=e.user_id,
@@ -23,5 +29,6 @@ class ListJobApplicationsUseCase:
                 created_at=e.created_at,
                 updated_at=e.updated_at,
             )
-            for e in entities
-        ]
\ No newline at end of file
+            for e in page.items
+        ]
+        return PageDTO(items=items, next_cursor=page.next_cursor)
\ No newline at end of file
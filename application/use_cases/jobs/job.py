@@ -5,11 +5,32 @@ from typing import final
 from uuid import uuid4, UUID
 
 from application.dtos.jobs.job import CreateJobDTO, UpdateJobDTO, JobDTO, JobListDTO
+from application.dtos.pagination import clamp_page_size
+from application.dtos.search import (
+    DEFAULT_SEARCH_LIMIT,
+    JOB_DOCUMENT,
+    MAX_SEARCH_LIMIT,
+    SearchDocumentDTO,
+    SearchHitDTO,
+)
 from application.interfaces.jobs.repositories import JobRepositoryProtocol
+from application.interfaces.search import FullTextSearchProtocol
 from application.interfaces.users.uow import UnitOfWorkProtocol
 from domain.entities.jobs.job import JobEntity, JobType, JobStatus
 
 
+def job_search_document(entity: JobEntity) -> SearchDocumentDTO:
+    """Documento de busca da vaga: título + descrição, requisitos e local"""
+    body = "\n".join(part for part in (entity.description, entity.requirements, entity.location) if part)
+    return SearchDocumentDTO(
+        kind=JOB_DOCUMENT,
+        doc_id=str(entity.job_id),
+        owner_id=str(entity.created_by_user_id),
+        title=entity.title,
+        body=body,
+    )
+
+
 @final
 @dataclass(frozen=True, slots=True, kw_only=True)
 class CreateJobUseCase:
@@ -17,6 +38,7 @@ class CreateJobUseCase:
 
     repository: JobRepositoryProtocol
     uow: UnitOfWorkProtocol
+    search_index: FullTextSearchProtocol
 
     async def __call__(self, dto: CreateJobDTO, user_id: UUID) -> JobDTO:
         # Verificar limite de 30 vagas por usuário
@@ -54,6 +76,7 @@ class CreateJobUseCase:
 
         async with self.uow:
             await self.repository.save(job_entity)
+            await self.search_index.upsert([job_search_document(job_entity)])
 
         return self._entity_to_dto(job_entity)
 
@@ -93,17 +116,25 @@ class ListJobsUseCase:
 
     repository: JobRepositoryProtocol
 
-    async def __call__(self, user_id: UUID | None = None) -> JobListDTO:
+    async def __call__(
+        self,
+        user_id: UUID | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> JobListDTO:
+        """Lists jobs newest first: all of them, or one page when limit/cursor is given."""
+        limit = clamp_page_size(limit, cursor)
         if user_id:
-            jobs = await self.repository.get_all_by_user_id(user_id)
+            page = await self.repository.get_page_by_user_id(user_id, limit, cursor)
+            total = await self.repository.count_by_user_id(user_id)
         else:
-            jobs = await self.repository.get_all_active()
-
-        job_dtos = [self._entity_to_dto(job) for job in jobs]
+            page = await self.repository.get_active_page(limit, cursor)
+            total = await self.repository.count_active()
 
         return JobListDTO(
-            jobs=job_dtos,
-            total=len(job_dtos)
+            jobs=[self._entity_to_dto(job) for job in page.items],
+            total=total,
+            next_cursor=page.next_cursor,
         )
 
     def _entity_to_dto(self, entity: JobEntity) -> JobDTO:
@@ -135,6 +166,19 @@ class ListJobsUseCase:
         )
 
 
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SearchJobsUseCase:
+    """Use case for keyword search over the user's jobs."""
+
+    search_index: FullTextSearchProtocol
+
+    async def __call__(self, user_id: UUID, query: str, limit: int | None = None) -> list[SearchHitDTO]:
+        """Ranked results (title matches weigh more); every term must match."""
+        limit = max(1, min(limit or DEFAULT_SEARCH_LIMIT, MAX_SEARCH_LIMIT))
+        return await self.search_index.search(JOB_DOCUMENT, query, str(user_id), limit)
+
+
 @final
 @dataclass(frozen=True, slots=True, kw_only=True)
 class GetJobUseCase:
@@ -185,6 +229,7 @@ class UpdateJobUseCase:
 
     repository: JobRepositoryProtocol
     uow: UnitOfWorkProtocol
+    search_index: FullTextSearchProtocol
 
     async def __call__(self, job_id: UUID, dto: UpdateJobDTO) -> JobDTO | None:
         job = await self.repository.get_by_job_id(job_id)
@@ -221,6 +266,7 @@ class UpdateJobUseCase:
 
         async with self.uow:
             await self.repository.save(updated_job)
+            await self.search_index.upsert([job_search_document(updated_job)])
 
         return self._entity_to_dto(updated_job)
 
@@ -260,6 +306,7 @@ class DeleteJobUseCase:
 
     repository: JobRepositoryProtocol
     uow: UnitOfWorkProtocol
+    search_index: FullTextSearchProtocol
 
     async def __call__(self, job_id: UUID) -> bool:
         job = await self.repository.get_by_job_id(job_id)
@@ -268,6 +315,7 @@ class DeleteJobUseCase:
 
         async with self.uow:
             await self.repository.delete(job_id)
+            await self.search_index.delete(JOB_DOCUMENT, [str(job_id)])
 
         return True
 
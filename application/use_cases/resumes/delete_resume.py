@@ -3,7 +3,11 @@ from dataclasses import dataclass
 from typing import final
 from uuid import UUID
 
+from application.dtos.search import RESUME_DOCUMENT
+from application.interfaces.ai.indexer import IndexerProtocol
 from application.interfaces.resumes.repositories import ResumeRepositoryProtocol
+from application.interfaces.search import FullTextSearchProtocol
+from application.interfaces.storage import BlobStoreProtocol
 from application.interfaces.users.uow import UnitOfWorkProtocol
 
 
@@ -14,6 +18,9 @@ class DeleteResumeUseCase:
     
     uow: UnitOfWorkProtocol
     repository: ResumeRepositoryProtocol
+    blob_store: BlobStoreProtocol
+    search_index: FullTextSearchProtocol
+    indexer: IndexerProtocol
     
     async def execute(self, resume_id: UUID, user_id: UUID | None = None) -> bool:
         """
@@ -26,11 +33,30 @@ class DeleteResumeUseCase:
         Returns:
             True se deletado, False se não encontrado
         """
-        # Se user_id fornecido, verificar se o currículo pertence ao usuário
-        if user_id:
-            resume = await self.repository.get_by_id(resume_id)
-            if resume and resume.uploaded_by_user_id != user_id:
-                return False  # Não autorizado
-        
+        # Um único DELETE filtrado pelo dono (não encontrado e não autorizado dão o mesmo resultado)
+        index_orphaned = False
         async with self.uow:
-            return await self.repository.delete(resume_id)
\ No newline at end of file
+            deleted = await self.repository.delete_owned(resume_id, user_id)
+            if deleted is not None:
+                await self.search_index.delete(RESUME_DOCUMENT, [str(resume_id)])
+                file_path, vector_index_id = deleted
+                if vector_index_id:
+                    index_orphaned = await self.repository.count_by_vector_index_id(vector_index_id) == 0
+        
+        if deleted is None:
+            return False
+        
+        # Remove a referência ao arquivo; o blob só é apagado quando ninguém mais o usa
+        try:
+            await self.blob_store.release(file_path)
+        except Exception as e:
+            print(f"⚠️  Erro ao liberar arquivo {file_path}: {e}")
+        
+        # Último currículo do índice: libera o índice vetorial também
+        if index_orphaned:
+            try:
+                await self.indexer.delete_index(vector_index_id)
+            except Exception as e:
+                print(f"⚠️  Erro ao remover índice {vector_index_id}: {e}")
+        
+        return True
\ No newline at end of file
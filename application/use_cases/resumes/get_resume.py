@@ -0,0 +1,36 @@
+"""Use case para buscar um currículo do usuário."""
+from dataclasses import dataclass
+from typing import final
+from uuid import UUID
+
+from application.dtos.resumes.resume import ResumeDTO
+from application.interfaces.resumes.repositories import ResumeRepositoryProtocol
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class GetResumeUseCase:
+    """Use case para buscar um currículo que pertence ao usuário."""
+    
+    repository: ResumeRepositoryProtocol
+    
+    async def execute(self, resume_id: UUID, user_id: UUID) -> ResumeDTO | None:
+        """
+        Busca um currículo pelo ID, restrito ao dono.
+        
+        Returns:
+            DTO do currículo, ou None se não existir ou não pertencer ao usuário
+        """
+        resume = await self.repository.get_owned(resume_id, user_id)
+        if resume is None:
+            return None
+        
+        return ResumeDTO(
+            resume_id=resume.resume_id,
+            candidate_name=resume.candidate_name,
+            file_name=resume.file_name,
+            file_path=resume.file_path,
+            uploaded_at=resume.uploaded_at,
+            is_indexed=resume.is_indexed,
+            vector_index_id=resume.vector_index_id
+        )
@@ -3,8 +3,8 @@ from dataclasses import dataclass
 from typing import final
 from uuid import UUID
 
-from application.dtos.resumes.resume import ResumeDTO
 from application.interfaces.resumes.repositories import ResumeRepositoryProtocol
+from domain.entities.resumes.resume import ResumeEntity
 
 
 @final
@@ -14,12 +14,14 @@ class ListIndexesUseCase:
     
     repository: ResumeRepositoryProtocol
     
-    async def execute(self, user_id: UUID | None = None) -> dict[str, dict]:
+    async def execute(self, user_id: UUID | None = None, include_resumes: bool = False) -> dict[str, dict]:
         """
         Lista todos os índices vetoriais agrupados para o usuário específico.
         
         Args:
             user_id: ID do usuário para filtrar os currículos
+            include_resumes: Se True, inclui a lista de currículos de cada índice
+                (por padrão só contagem e data, agregadas no banco)
             
         Returns:
             Dict com vector_index_id como chave e informações do índice
@@ -27,37 +29,36 @@ class ListIndexesUseCase:
         if not user_id:
             return {} 
         
-        user_resumes = await self.repository.get_by_user_id(user_id)
+        summaries = await self.repository.get_index_summaries(user_id)
         
-        if not user_resumes:
-            return {}  
+        indexes_info = {
+            s["vector_index_id"]: {
+                "vector_index_id": s["vector_index_id"],
+                "resume_count": s["resume_count"],
+                "first_uploaded_at": s["first_uploaded_at"].isoformat(),
+                "resumes": []
+            }
+            for s in summaries
+        }
         
-        indexes_info = {}
-        
-        for resume in user_resumes:
-            index_id = resume.vector_index_id
-            if not index_id:
-                continue 
-            
-            if index_id not in indexes_info:
-                indexes_info[index_id] = {
-                    "vector_index_id": index_id,
-                    "resume_count": 0,
-                    "first_uploaded_at": None,
-                    "resumes": []
-                }
-            
-            indexes_info[index_id]["resume_count"] += 1
-            indexes_info[index_id]["resumes"].append({
-                "resume_id": str(resume.resume_id),
-                "candidate_name": resume.candidate_name,
-                "file_name": resume.file_name,
-                "uploaded_at": resume.uploaded_at.isoformat(),
-                "is_indexed": resume.is_indexed
-            })
-            
-            if (indexes_info[index_id]["first_uploaded_at"] is None or 
-                resume.uploaded_at.isoformat() < indexes_info[index_id]["first_uploaded_at"]):
-                indexes_info[index_id]["first_uploaded_at"] = resume.uploaded_at.isoformat()
+        if include_resumes and indexes_info:
+            for resume in await self.repository.get_by_user_id(user_id):
+                if resume.vector_index_id in indexes_info:
+                    indexes_info[resume.vector_index_id]["resumes"].append(self._resume_info(resume))
         
         return indexes_info
+    
+    async def list_index_resumes(self, index_id: str, user_id: UUID) -> list[dict]:
+        """Lista os currículos de um único índice do usuário (expansão sob demanda)."""
+        resumes = await self.repository.get_by_vector_index_id(index_id, user_id)
+        return [self._resume_info(resume) for resume in resumes]
+    
+    @staticmethod
+    def _resume_info(resume: ResumeEntity) -> dict:
+        return {
+            "resume_id": str(resume.resume_id),
+            "candidate_name": resume.candidate_name,
+            "file_name": resume.file_name,
+            "uploaded_at": resume.uploaded_at.isoformat(),
+            "is_indexed": resume.is_indexed
+        }
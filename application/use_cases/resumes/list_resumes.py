@@ -3,8 +3,10 @@ from dataclasses import dataclass
 from typing import final
 from uuid import UUID
 
+from application.dtos.pagination import PageDTO, clamp_page_size
 from application.dtos.resumes.resume import ResumeDTO
 from application.interfaces.resumes.repositories import ResumeRepositoryProtocol
+from domain.entities.resumes.resume import ResumeEntity
 
 
 @final
@@ -29,15 +31,37 @@ class ListResumesUseCase:
         else:
             resumes = await self.repository.get_all()
         
-        return [
-            ResumeDTO(
-                resume_id=r.resume_id,
-                candidate_name=r.candidate_name,
-                file_name=r.file_name,
-                file_path=r.file_path,
-                uploaded_at=r.uploaded_at,
-                is_indexed=r.is_indexed,
-                vector_index_id=r.vector_index_id
-            )
-            for r in resumes
-        ]
+        return [self._to_dto(r) for r in resumes]
+    
+    async def execute_page(
+        self,
+        user_id: UUID,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> PageDTO[ResumeDTO]:
+        """
+        Lista uma página dos currículos do usuário, mais recentes primeiro.
+        
+        Args:
+            limit: Tamanho da página (padrão e máximo em application.dtos.pagination)
+            cursor: next_cursor da página anterior
+        """
+        page = await self.repository.get_page_by_user_id(user_id, clamp_page_size(limit, cursor), cursor)
+        total = await self.repository.count_by_user_id(user_id)
+        return PageDTO(
+            items=[self._to_dto(r) for r in page.items],
+            next_cursor=page.next_cursor,
+            total=total,
+        )
+    
+    @staticmethod
+    def _to_dto(r: ResumeEntity) -> ResumeDTO:
+        return ResumeDTO(
+            resume_id=r.resume_id,
+            candidate_name=r.candidate_name,
+            file_name=r.file_name,
+            file_path=r.file_path,
+            uploaded_at=r.uploaded_at,
+            is_indexed=r.is_indexed,
+            vector_index_id=r.vector_index_id
+        )
@@ -0,0 +1,25 @@
+"""Use case para busca por palavras-chave nos currículos do usuário."""
+from dataclasses import dataclass
+from typing import final
+from uuid import UUID
+
+from application.dtos.search import DEFAULT_SEARCH_LIMIT, MAX_SEARCH_LIMIT, RESUME_DOCUMENT, SearchHitDTO
+from application.interfaces.search import FullTextSearchProtocol
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SearchResumesUseCase:
+    """Busca de texto completo no conteúdo dos currículos (sem embeddings nem LLM)."""
+    
+    search_index: FullTextSearchProtocol
+    
+    async def execute(self, user_id: UUID, query: str, limit: int | None = None) -> list[SearchHitDTO]:
+        """
+        Busca currículos do usuário que contêm todos os termos.
+        
+        Returns:
+            Resultados ordenados por relevância (doc_id = resume_id, title = nome do candidato)
+        """
+        limit = max(1, min(limit or DEFAULT_SEARCH_LIMIT, MAX_SEARCH_LIMIT))
+        return await self.search_index.search(RESUME_DOCUMENT, query, str(user_id), limit)
@@ -1,15 +1,18 @@
 from dataclasses import dataclass
 from pathlib import Path
-from typing import final, Optional
+from typing import final
 from uuid import UUID, uuid4
 import tempfile
 import shutil
 
 from application.dtos.resumes.resume import UploadResultDTO, ResumeDTO
+from application.dtos.search import RESUME_DOCUMENT, SearchDocumentDTO
 from application.interfaces.ai.indexer import IndexerProtocol
 from application.interfaces.ai.validator import ResumeValidatorProtocol
 from application.interfaces.users.uow import UnitOfWorkProtocol
 from application.interfaces.resumes.repositories import ResumeRepositoryProtocol
+from application.interfaces.search import FullTextSearchProtocol
+from application.interfaces.storage import BlobStoreProtocol
 from domain.entities.resumes.resume import ResumeEntity
 from infrastructures.ai.text_extractor import extract_text_from_bytes
 
@@ -20,9 +23,8 @@ class UploadResumesUseCase:
     repository: ResumeRepositoryProtocol
     indexer: IndexerProtocol
     validator: ResumeValidatorProtocol
-    storage_dir: Path
-    s3_storage: Optional[object] = None  # S3StorageService
-    sqlite_storage: Optional[object] = None  # SQLiteFileStorageService
+    blob_store: BlobStoreProtocol
+    search_index: FullTextSearchProtocol
     
     async def execute(
         self, 
@@ -30,24 +32,28 @@ class UploadResumesUseCase:
         user_id: UUID
     ) -> UploadResultDTO:
         """
-        1. Salva arquivos no storage
+        1. Valida os arquivos
         2. Indexa no vector store
-        3. Persiste metadados no DB
+        3. Salva arquivos no blob store (endereçado por conteúdo)
+        4. Persiste metadados no DB
         """
+        # Limite de currículos e nomes já existentes em uma única consulta
+        existing_resumes_count, colliding_names = await self.repository.get_upload_conflicts(
+            user_id, [filename for filename, _ in files]
+        )
+        
         # Verificar limite de 50 currículos por usuário
-        existing_resumes_count = await self.repository.count_by_user_id(user_id)
         if existing_resumes_count >= 50:
             from application.exceptions import BusinessRuleViolationError
             raise BusinessRuleViolationError("Limite máximo de 50 currículos por usuário atingido")
 
         # Não permitir currículos com o mesmo nome de arquivo (por usuário)
-        existing_resumes = await self.repository.get_by_user_id(user_id)
-        existing_names = {r.file_name.lower().strip() for r in existing_resumes}
+        existing_names = {name.strip().casefold() for name in colliding_names}
         seen_in_request: set[str] = set()
         for filename, _ in files:
             if not (filename and filename.strip()):
                 continue
-            key = filename.strip().lower()
+            key = filename.strip().casefold()
             if key in seen_in_request:
                 from application.exceptions import BusinessRuleViolationError
                 raise BusinessRuleViolationError(
@@ -62,70 +68,42 @@ class UploadResumesUseCase:
                     "Renomeie o arquivo ou exclua o currículo existente."
                 )
         
-        saved_paths = []
-        
-        # 1. Salva arquivos
+        # 1. Valida se são currículos (antes de gravar qualquer coisa no storage)
+        texts: list[str] = []
         for filename, content in files:
-            file_path = await self._save_file(filename, content)
-            saved_paths.append(file_path)
-        
-        # 1.5. Valida se são currículos
-        validated_files = []
-        for (filename, content), file_path in zip(files, saved_paths):
             text = extract_text_from_bytes(content, filename)
             if text is None:
-                # Remove arquivo inválido
-                if file_path.exists():
-                    file_path.unlink()
                 from application.exceptions import BusinessRuleViolationError
                 raise BusinessRuleViolationError(f"Não foi possível extrair texto do arquivo '{filename}'. Verifique se é um PDF, DOCX ou TXT válido.")
             
             is_resume = await self.validator.is_resume(text)
             if not is_resume:
-                # Remove arquivo que não é currículo
-                if file_path.exists():
-                    file_path.unlink()
                 from application.exceptions import BusinessRuleViolationError
                 raise BusinessRuleViolationError(f"O arquivo '{filename}' não parece ser um currículo válido. Por favor, envie apenas currículos profissionais.")
-            
-            validated_files.append(file_path)
-        
-        saved_paths = validated_files
-        
-        # 2. Prepara arquivos para indexação (baixa do SQLite se necessário)
-        print(f"🔍 Preparando {len(saved_paths)} arquivos para indexação...")
-        print(f"   Paths salvos: {[str(p) for p in saved_paths]}")
-        files_for_indexing, temp_dir = await self._prepare_files_for_indexing(saved_paths)
-        print(f"   Paths para indexação: {[str(p) for p in files_for_indexing]}")
+            texts.append(text)
         
+        # 2. Indexa a partir de cópias temporárias com os nomes originais
+        # (o metadata file_name dos chunks continua sendo o nome enviado)
+        temp_dir = Path(tempfile.mkdtemp(prefix="resume_index_"))
         try:
-            # 3. Indexa documentos
+            files_for_indexing = []
+            for filename, content in files:
+                local_path = temp_dir / Path(filename).name
+                local_path.write_bytes(content)
+                files_for_indexing.append(local_path)
+            
             vector_index_id = await self.indexer.index_documents(files_for_indexing)
         finally:
-            # Limpa arquivos temporários se foram criados
-            if temp_dir and temp_dir.exists():
-                print(f"🧹 Limpando diretório temporário: {temp_dir}")
-                shutil.rmtree(temp_dir, ignore_errors=True)
-        
-        # 3. Cria entidades e persiste
-        resume_entities = []
-        for path in saved_paths:
-            entity = ResumeEntity(
-                resume_id=uuid4(),
-                candidate_name=self._extract_name(path),
-                file_name=path.name,
-                file_path=str(path),
-                uploaded_by_user_id=user_id,
-                vector_index_id=vector_index_id,
-                is_indexed=True
-            )
-            resume_entities.append(entity)
+            shutil.rmtree(temp_dir, ignore_errors=True)
         
-        async with self.uow:
-            for entity in resume_entities:
-                await self.repository.add(entity)
+        try:
+            resume_entities = await self._store(files, texts, user_id, vector_index_id)
+        except Exception:
+            # Nenhum currículo aponta para o índice: libera o zip gravado na indexação
+            await self.indexer.delete_index(vector_index_id)
+            raise
         
-        # 4. Retorna DTO
+        # 5. Retorna DTO
         resume_dtos = [
             ResumeDTO(
                 resume_id=e.resume_id,
@@ -145,79 +123,61 @@ class UploadResumesUseCase:
             resumes=resume_dtos
         )
     
-    async def _save_file(self, filename: str, content: bytes) -> Path:
-        """Salva arquivo usando SQLite, S3 se disponível, senão usa armazenamento local"""
-        ext = Path(filename).suffix.lower()
-        
-        if self.sqlite_storage:
-            # Upload para SQLite (PythonAnywhere)
-            print(f"📤 Fazendo upload para SQLite: {filename} ({len(content)} bytes)")
-            sqlite_path = await self.sqlite_storage.upload_file(filename, content, ext)
-            print(f"✅ Upload concluído: {sqlite_path}")
-            return Path(sqlite_path)
-            
-        elif self.s3_storage:
-            # Upload para S3/DigitalOcean Spaces
-            s3_key = self.s3_storage.upload_file(filename, content, ext)
-            # Retorna um Path "virtual" com a chave S3
-            return Path(f"s3://{s3_key}")
-        else:
-            # Armazenamento local (fallback)
-            subdir = self.storage_dir / ext.replace('.', '')
-            subdir.mkdir(parents=True, exist_ok=True)
-            file_path = subdir / filename
-            file_path.write_bytes(content)
-            return file_path
-    
-    async def _prepare_files_for_indexing(self, saved_paths: list[Path]) -> tuple[list[Path], Optional[Path]]:
-        """
-        Prepara arquivos para indexação. Se os arquivos estão no SQLite,
-        baixa para um diretório temporário local.
+    async def _store(
+        self,
+        files: list[tuple[str, bytes]],
+        texts: list[str],
+        user_id: UUID,
+        vector_index_id: str,
+    ) -> list[ResumeEntity]:
+        # 3. Salva arquivos no blob store em lote (conteúdo idêntico não é regravado)
+        results = await self.blob_store.put_many(
+            [(filename, content, Path(filename).suffix) for filename, content in files]
+        )
+        failures = {r.name: r.error for r in results if not r.ok}
+        if failures:
+            for r in results:
+                if r.ok:
+                    await self.blob_store.release(r.location)
+            from application.exceptions import StorageBatchError
+            raise StorageBatchError(failures)
+        locations = [r.location for r in results]
         
-        Returns:
-            tuple: (lista de paths locais para indexação, diretório temporário ou None)
-        """
-        temp_dir = None
-        local_paths = []
+        # 4. Cria entidades e persiste
+        resume_entities = []
+        for (filename, _), location in zip(files, locations):
+            entity = ResumeEntity(
+                resume_id=uuid4(),
+                candidate_name=self._extract_name(Path(filename)),
+                file_name=Path(filename).name,
+                file_path=location,
+                uploaded_by_user_id=user_id,
+                vector_index_id=vector_index_id,
+                is_indexed=True
+            )
+            resume_entities.append(entity)
         
-        for path in saved_paths:
-            path_str = str(path)
-            # No Windows, Path("sqlite://pdf/x.pdf") vira "sqlite:\pdf\x.pdf"; normalizar para detectar
-            path_str_norm = path_str.replace("\\", "/")
-            print(f"🔍 Verificando path: {path_str_norm} (tipo: {type(path)})")
-            
-            # Se é um arquivo SQLite (local ou HTTP), precisa baixar para temp para indexar
-            if path_str_norm.startswith("sqlite://") or path_str_norm.startswith("sqlite:/"):
-                if not self.sqlite_storage:
-                    raise ValueError("SQLite storage não disponível para baixar arquivos")
-                
-                # Cria diretório temporário na primeira vez
-                if temp_dir is None:
-                    temp_dir = Path(tempfile.mkdtemp(prefix="sqlite_index_"))
-                    print(f"📁 Criado diretório temporário para indexação: {temp_dir}")
-                
-                # Chave para download: sempre no formato sqlite://ext/filename
-                if path_str_norm.startswith("sqlite:/") and not path_str_norm.startswith("sqlite://"):
-                    path_str_norm = "sqlite://" + path_str_norm[len("sqlite:"):].lstrip("/")
-                
-                # Baixa o arquivo do SQLite (ou via HTTP PythonAnywhere)
-                print(f"📥 Baixando {path_str_norm} do storage para indexação...")
-                file_content = await self.sqlite_storage.download_file(path_str_norm)
-                
-                # Extrai o nome do arquivo: sqlite://pdf/arquivo.pdf -> arquivo.pdf
-                file_key = path_str_norm.replace("sqlite://", "").replace("sqlite:/", "").lstrip("/")
-                filename = file_key.split("/")[-1] if "/" in file_key else file_key
-                
-                # Salva no diretório temporário
-                local_path = temp_dir / filename
-                local_path.write_bytes(file_content)
-                local_paths.append(local_path)
-                print(f"✅ Arquivo baixado: {local_path} ({len(file_content)} bytes)")
-            else:
-                # Arquivo já está local, usa diretamente
-                local_paths.append(path)
+        try:
+            async with self.uow:
+                await self.repository.add_many(resume_entities)
+                # Índice de texto completo na mesma transação
+                await self.search_index.upsert([
+                    SearchDocumentDTO(
+                        kind=RESUME_DOCUMENT,
+                        doc_id=str(e.resume_id),
+                        owner_id=str(user_id),
+                        title=e.candidate_name,
+                        body=text,
+                    )
+                    for e, text in zip(resume_entities, texts)
+                ])
+        except Exception:
+            # Desfaz as referências criadas para não deixar blobs órfãos
+            for location in locations:
+                await self.blob_store.release(location)
+            raise
         
-        return local_paths, temp_dir
+        return resume_entities
     
     def _extract_name(self, path: Path) -> str:
         # Implementar extração de nome do PDF/DOCX
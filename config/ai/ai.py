@@ -32,10 +32,47 @@ class AISettings(BaseSettings):
     
     vector_store_dir: str = Field(default="./vector_stores/resumes")
     storage_dir: str = Field(default="./uploaded_files")  # fallback local
-    vector_store_type: str = Field(default="faiss")
+    vector_store_type: str = Field(default="faiss")  # simple, faiss (HNSW), faiss_hnsw, faiss_ivf, faiss_flat, hnswlib
+    ann_min_vectors: int = Field(default=2000)  # abaixo disso a busca vetorial é exaustiva
+    ann_ef_search: int = Field(default=128)  # HNSW: candidatos visitados por busca
+    ann_ivf_nprobe: int = Field(default=16)  # IVF: listas visitadas por busca
+    # Armazenamento dos embeddings nos índices: float32 (JSON), float16 ou int8 (escala por vetor)
+    embedding_storage: str = Field(default="float32")
+    embedding_rescore: bool = Field(default=False)  # salva também float32 binário para reordenar candidatos
+    embedding_rescore_factor: int = Field(default=4)  # candidatos reordenados = top_k * fator
+    # Pré-triagem antes do LLM: só os N melhores (nota heurística 0-100 >= mínimo) são avaliados pelo LLM
+    llm_shortlist_size: int = Field(default=10)  # 0 = todos vão para o LLM
+    llm_shortlist_min_score: float = Field(default=0.0)
+    shortlist_similarity_weight: float = Field(default=0.7)  # restante = palavras-chave
+    # Avaliação com o perfil compacto do currículo (extraído na indexação) + poucos trechos
+    scoring_use_resume_profiles: bool = Field(default=True)
+    scoring_profile_excerpt_chunks: int = Field(default=3)
+    # Teto de tokens dos prompts do LLM (regras + vaga + currículo); o currículo entra por relevância
+    llm_prompt_max_tokens: int = Field(default=6000)
+    llm_prompt_job_max_share: float = Field(default=0.35)  # fração máxima do espaço livre para a vaga
+    llm_tokenizer: str = Field(default="")  # tokenizer HuggingFace do modelo (requer transformers); vazio = tiktoken
+    resume_validator_max_tokens: int = Field(default=800)
+    
+    # Coleta de lixo do storage (arquivos/índices sem currículo que os referencie)
+    storage_gc_interval_hours: float = Field(default=0)  # 0 = agendamento desativado
+    storage_gc_min_age_hours: float = Field(default=1)  # nunca remove objetos mais novos que isso
+    storage_gc_batch_size: int = Field(default=100)
     
     # Processing Settings
     similarity_top_k: int = Field(default=50)
+    
+    # Busca híbrida (vetorial + BM25, fundidas por reciprocal rank fusion)
+    hybrid_search: bool = Field(default=True)
+    hybrid_vector_weight: float = Field(default=1.0)
+    hybrid_bm25_weight: float = Field(default=1.0)
+    hybrid_rrf_k: int = Field(default=60)
+    bm25_k1: float = Field(default=1.5)
+    bm25_b: float = Field(default=0.75)
+    index_cache_size: int = Field(default=8)  # índices mantidos em memória entre buscas (0 = sem cache)
+    # Cache de embeddings das consultas: em memória (LRU) e, opcionalmente, no Redis
+    query_embedding_cache_size: int = Field(default=1024)  # 0 = sem cache em memória
+    query_embedding_cache_redis: bool = Field(default=False)
+    query_embedding_cache_ttl: int = Field(default=86400)  # segundos no Redis
     llm_timeout: int = Field(default=120)
     chunk_size_tokens: int = Field(default=512)
     chunk_overlap_tokens: int = Field(default=50)
@@ -3,6 +3,11 @@ from pydantic import Field
 from pydantic_settings import BaseSettings
 
 
+def _split_urls(raw: str | None) -> list[str]:
+    """Lista de URLs separadas por vírgula (réplicas), já no formato async."""
+    return [_to_async_pg_url(u.strip()) for u in (raw or "").split(",") if u.strip()]
+
+
 def _to_async_pg_url(url: str) -> str:
     """Converte URL postgresql:// para postgresql+asyncpg:// (uso com SQLAlchemy async)."""
     if url.startswith("postgresql://"):
@@ -35,6 +40,16 @@ class DatabaseSettings(BaseSettings):
 
     # Chat em Supabase: quando definido, histórico de conversas usa este banco (ex.: connection string do Supabase)
     chat_database_url: str | None = Field(default=None, alias="CHAT_DATABASE_URL")
+    # Réplicas de leitura (opcional, URLs separadas por vírgula): GETs leem delas, escritas vão ao primário
+    database_replica_urls_raw: str | None = Field(default=None, alias="DATABASE_REPLICA_URLS")
+    chat_database_replica_urls_raw: str | None = Field(default=None, alias="CHAT_DATABASE_REPLICA_URLS")
+
+    # Pool de conexões (por engine)
+    pool_size: int = Field(default=20, alias="DB_POOL_SIZE")
+    max_overflow: int = Field(default=30, alias="DB_MAX_OVERFLOW")
+    replica_pool_size: int = Field(default=10, alias="DB_REPLICA_POOL_SIZE")
+    replica_max_overflow: int = Field(default=20, alias="DB_REPLICA_MAX_OVERFLOW")
+
     postgres_user: str = Field(default="postgres", alias="POSTGRES_USER")
     postgres_password: str = Field(default="", alias="POSTGRES_PASSWORD")
     postgres_server: str = Field(default="localhost", alias="POSTGRES_SERVER")
@@ -79,6 +94,16 @@ class DatabaseSettings(BaseSettings):
             return _to_async_pg_url(url)
         return url
 
+    @property
+    def database_replica_urls(self) -> list[str]:
+        """URLs async das réplicas de leitura do banco principal (vazio = sem réplicas)."""
+        return _split_urls(self.database_replica_urls_raw)
+
+    @property
+    def chat_database_replica_urls(self) -> list[str]:
+        """URLs async das réplicas de leitura do banco de chat (só usadas com CHAT_DATABASE_URL)."""
+        return _split_urls(self.chat_database_replica_urls_raw)
+
     def database_display(self) -> str:
         """
         Retorna uma string segura para log/terminal (senha mascarada).
@@ -1,4 +1,5 @@
 from dishka import Provider, Scope, provide
+from dishka.integrations.fastapi import FastapiProvider
 
 from config.ioc.providers import (
     CacheProvider,
@@ -11,6 +12,7 @@ from config.ioc.providers import (
     UseCaseProvider,
     UnitOfWorkProvider,
     ServiceProvider,
+    StorageProvider,
     AIProvider,
     ResumeUseCaseProvider,
     JobUseCaseProvider,
@@ -33,10 +35,12 @@ def get_providers() -> list[Provider]:
         UnitOfWorkProvider,
         SecurityProvider,
         ServiceProvider,
+        StorageProvider,
         AIProvider,
         ResumeUseCaseProvider,
         JobUseCaseProvider,
         AISettingsProvider,  # <--- adicione aqui
+        FastapiProvider,  # Request no escopo REQUEST (roteamento para réplicas)
     ]:
         result = ProviderClass()
         if isinstance(result, list):
@@ -2,9 +2,11 @@ from collections.abc import AsyncIterator
 from typing import Any, Optional
 
 from dishka import Provider, Scope, provide
+from fastapi import Request
 from httpx import AsyncClient
 import redis.asyncio as redis
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
 )
@@ -28,6 +30,7 @@ from application.use_cases.jobs.job import (
     UpdateJobUseCase,
     DeleteJobUseCase,
     UpdateJobStatusUseCase,
+    SearchJobsUseCase,
 )
 from application.services.users.auth import AuthenticationService
 from application.services.chat.chat_service import ChatService
@@ -44,7 +47,8 @@ from infrastructures.db.repositories.jobs.job import JobRepositorySQLAlchemy
 from infrastructures.repositories.chat_repository_sqlalchemy import ChatRepositorySqlAlchemy
 from infrastructures.repositories.chat_repository_supabase import ChatRepositorySupabase
 from infrastructures.repositories.job_application_repository_sqlalchemy import JobApplicationRepository
-from infrastructures.db.session import create_engine, get_session_factory
+from infrastructures.repositories.full_text_search_sqlalchemy import FullTextSearchSqlAlchemy
+from infrastructures.db.session import READ_ONLY_KEY, create_engine, get_session_factory
 from infrastructures.db.uow import UnitOfWorkSQLAlchemy
 from application.interfaces.cache import CacheProtocol
 from application.services.security.password_hasher import PasswordHasher
@@ -71,22 +75,35 @@ from application.interfaces.ai.analyzer import AIAnalyzerProtocol
 from application.interfaces.ai.transformer import TransformerProtocol
 from application.interfaces.ai.location_analyzer import LocationAnalyzerProtocol
 from application.interfaces.ai.validator import ResumeValidatorProtocol
+from application.interfaces.ai.shortlister import CandidateShortlisterProtocol
+from application.interfaces.ai.prompt_budget import PromptBudgetProtocol
 from application.interfaces.resumes.repositories import ResumeRepositoryProtocol
 from application.interfaces.resumes.resume_group_repository import ResumeGroupRepositoryProtocol
+from application.interfaces.storage import BlobStoreProtocol
+from application.interfaces.search import FullTextSearchProtocol
 
 # Implementações
 from infrastructures.ai.llama_indexer import LlamaIndexer
+from infrastructures.ai.candidate_shortlister import CandidateShortlister
 from infrastructures.ai.chunking_service import create_chunking_pipeline
+from infrastructures.ai.prompt_budget import TokenBudgeter, load_tokenizer
+from infrastructures.ai.embedding_cache import CachedQueryEmbedding
 from infrastructures.ai.ingestion_service import DocumentIngestor
 from infrastructures.ai.ollama_analyzer import OllamaAnalyzer
 from infrastructures.ai.transformer import DocumentTransformer
+from infrastructures.storage.blob_store import ContentAddressedBlobStore
+from infrastructures.storage.garbage_collector import StorageGarbageCollector
+from infrastructures.search.reindexer import FullTextReindexer
+from infrastructures.repositories.blob_ref_repository_sqlalchemy import BlobRefRepositorySqlAlchemy
 
 # ===== IMPORTS PARA RESUMES =====
 from application.use_cases.resumes.upload_resumes import UploadResumesUseCase
 from application.use_cases.resumes.ensure_upload_user import EnsureResumeUploadUserUseCase
 from application.use_cases.resumes.list_indexes import ListIndexesUseCase
 from application.use_cases.resumes.list_resumes import ListResumesUseCase
+from application.use_cases.resumes.get_resume import GetResumeUseCase
 from application.use_cases.resumes.delete_resume import DeleteResumeUseCase
+from application.use_cases.resumes.search_resumes import SearchResumesUseCase
 from application.use_cases.resumes.list_resume_groups import ListResumeGroupsUseCase
 from application.use_cases.resumes.create_resume_group import CreateResumeGroupUseCase
 from application.use_cases.resumes.delete_resume_group import DeleteResumeGroupUseCase
@@ -106,6 +123,7 @@ from infrastructures.repositories.resume_repository_sqlalchemy import ResumeRepo
 from infrastructures.repositories.resume_group_repository_sqlalchemy import ResumeGroupRepositorySqlAlchemy
 from infrastructures.db.models.candidates.job_application import JobApplicationModel  # Import to register the model
 from infrastructures.db.models.resumes.resume_group import ResumeGroupModel, ResumeGroupMemberModel  # Register models
+from infrastructures.db.models.storage.blob_ref import BlobRefModel  # Register model
 
 
 class SettingsProvider(Provider):
@@ -121,6 +139,23 @@ class SettingsProvider(Provider):
         return Settings()
 
 
+def _create_engines(settings: Settings, url: str, replica_urls: list[str]) -> list[AsyncEngine]:
+    """Engine primário seguido das réplicas de leitura, com tamanhos de pool vindos das settings"""
+    db = settings.database
+    return [
+        create_engine(url, is_echo=settings.debug, pool_size=db.pool_size, max_overflow=db.max_overflow),
+        *(
+            create_engine(replica_url, is_echo=settings.debug, pool_size=db.replica_pool_size, max_overflow=db.replica_max_overflow)
+            for replica_url in replica_urls
+        ),
+    ]
+
+
+def _is_read_only_request(request: Request) -> bool:
+    """GET/HEAD (listagens, histórico, downloads) podem ler das réplicas"""
+    return request.method in ("GET", "HEAD")
+
+
 class DatabaseProvider(Provider):
     """
     Provides database-related dependencies, such as session factory and sessions.
@@ -131,23 +166,26 @@ class DatabaseProvider(Provider):
         self, settings: Settings
     ) -> AsyncIterator[async_sessionmaker[AsyncSession]]:
         """
-        Provides an asynchronous session factory for SQLAlchemy.
+        Provides an asynchronous session factory for SQLAlchemy (primary + optional read replicas).
         """
-        engine = create_engine(str(settings.database_url), is_echo=settings.debug)
-        session_factory = get_session_factory(engine)
+        engine, *replicas = _create_engines(
+            settings, str(settings.database_url), settings.database.database_replica_urls
+        )
         try:
-            yield session_factory
+            yield get_session_factory(engine, replicas)
         finally:
-            await engine.dispose()
+            for e in (engine, *replicas):
+                await e.dispose()
 
     @provide(scope=Scope.REQUEST)
     async def get_session(
-        self, factory: async_sessionmaker[AsyncSession]
+        self, factory: async_sessionmaker[AsyncSession], request: Request
     ) -> AsyncIterator[AsyncSession]:
         """
         Provides an asynchronous SQLAlchemy session.
+        Read-only requests read from a replica until their first write (then stick to the primary).
         """
-        async with factory() as session:
+        async with factory(info={READ_ONLY_KEY: _is_read_only_request(request)}) as session:
             yield session
 
 
@@ -165,12 +203,12 @@ class ChatDatabaseProvider(Provider):
         if not url:
             yield None
             return
-        engine = create_engine(str(url), is_echo=settings.debug)
-        session_factory = get_session_factory(engine)
+        engine, *replicas = _create_engines(settings, str(url), settings.database.chat_database_replica_urls)
         try:
-            yield session_factory
+            yield get_session_factory(engine, replicas)
         finally:
-            await engine.dispose()
+            for e in (engine, *replicas):
+                await e.dispose()
 
 
 class RepositoryProvider(Provider):
@@ -201,13 +239,24 @@ class RepositoryProvider(Provider):
         self,
         session: AsyncSession,
         chat_session_factory: Optional[async_sessionmaker[AsyncSession]],
+        request: Request,
     ) -> ChatRepositoryProtocol:
         """
         Chat no Supabase quando CHAT_DATABASE_URL está definido; senão usa o banco principal (SQLite).
         """
         if chat_session_factory is not None:
-            return ChatRepositorySupabase(session_factory=chat_session_factory)
+            return ChatRepositorySupabase(
+                session_factory=chat_session_factory,
+                read_from_replica=_is_read_only_request(request),
+            )
         return ChatRepositorySqlAlchemy(session=session)
+
+    @provide(scope=Scope.REQUEST)
+    def get_full_text_search(self, session: AsyncSession) -> FullTextSearchProtocol:
+        """
+        Provides the full-text index (same session/transaction as the repositories).
+        """
+        return FullTextSearchSqlAlchemy(session=session)
     
     @provide(scope=Scope.APP)
     def get_email_verification_repository(self) -> EmailVerificationRepositoryProtocol:
@@ -382,11 +431,12 @@ class JobUseCaseProvider(Provider):
         self,
         repository: JobRepositoryProtocol,
         uow: UnitOfWorkProtocol,
+        search_index: FullTextSearchProtocol,
     ) -> CreateJobUseCase:
         """
         Provides a CreateJobUseCase instance.
         """
-        return CreateJobUseCase(repository=repository, uow=uow)
+        return CreateJobUseCase(repository=repository, uow=uow, search_index=search_index)
 
     @provide(scope=Scope.REQUEST)
     def get_list_jobs_use_case(
@@ -413,22 +463,24 @@ class JobUseCaseProvider(Provider):
         self,
         repository: JobRepositoryProtocol,
         uow: UnitOfWorkProtocol,
+        search_index: FullTextSearchProtocol,
     ) -> UpdateJobUseCase:
         """
         Provides an UpdateJobUseCase instance.
         """
-        return UpdateJobUseCase(repository=repository, uow=uow)
+        return UpdateJobUseCase(repository=repository, uow=uow, search_index=search_index)
 
     @provide(scope=Scope.REQUEST)
     def get_delete_job_use_case(
         self,
         repository: JobRepositoryProtocol,
         uow: UnitOfWorkProtocol,
+        search_index: FullTextSearchProtocol,
     ) -> DeleteJobUseCase:
         """
         Provides a DeleteJobUseCase instance.
         """
-        return DeleteJobUseCase(repository=repository, uow=uow)
+        return DeleteJobUseCase(repository=repository, uow=uow, search_index=search_index)
 
     @provide(scope=Scope.REQUEST)
     def get_update_job_status_use_case(
@@ -441,6 +493,16 @@ class JobUseCaseProvider(Provider):
         """
         return UpdateJobStatusUseCase(repository=repository, uow=uow)
 
+    @provide(scope=Scope.REQUEST)
+    def get_search_jobs_use_case(
+        self,
+        search_index: FullTextSearchProtocol,
+    ) -> SearchJobsUseCase:
+        """
+        Provides a SearchJobsUseCase instance.
+        """
+        return SearchJobsUseCase(search_index=search_index)
+
 
 class SecurityProvider(Provider):
     """
@@ -489,6 +551,99 @@ class ServiceProvider(Provider):
         )
 
 
+# ===== STORAGE =====
+
+class StorageProvider(Provider):
+    """Blob store endereçado por conteúdo sobre o backend configurado (SQLite/HTTP, S3 ou local)"""
+
+    @provide(scope=Scope.APP)
+    def get_blob_store(
+        self,
+        ai_settings: AISettings,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> BlobStoreProtocol:
+        from pathlib import Path
+        from infrastructures.storage.local_storage import LocalFileStorageService
+
+        backend = None
+        location_prefix = ""
+
+        if ai_settings.use_sqlite_storage:
+            try:
+                storage_url = ai_settings.sqlite_storage_url.strip()
+
+                if storage_url.startswith(('http://', 'https://')):
+                    from infrastructures.storage.sqlite_storage import HTTPFileStorageService
+                    backend = HTTPFileStorageService(storage_url)
+                    print("=" * 60)
+                    print("✅ SQLite HTTP Storage (PythonAnywhere) CONFIGURADO")
+                    print(f"   URL: {storage_url}")
+                    print("=" * 60)
+                else:
+                    from infrastructures.storage.sqlite_storage import SQLiteFileStorageService
+                    backend = SQLiteFileStorageService(storage_url)
+                    print("=" * 60)
+                    print("✅ SQLite File Storage (Local) CONFIGURADO")
+                    print(f"   Caminho: {storage_url}")
+                    print("=" * 60)
+            except Exception as e:
+                print("=" * 60)
+                print("❌ ERRO ao configurar SQLite storage")
+                print(f"   Erro: {e}")
+                print("   Usando armazenamento local como fallback")
+                print("=" * 60)
+
+        elif ai_settings.use_s3_storage:
+            try:
+                from infrastructures.storage.s3_storage import S3StorageService
+                backend = S3StorageService(
+                    endpoint_url=ai_settings.s3_endpoint_url,
+                    region=ai_settings.s3_region,
+                    access_key=ai_settings.s3_access_key,
+                    secret_key=ai_settings.s3_secret_key,
+                    bucket_name=ai_settings.s3_bucket_name,
+                    folder_prefix=ai_settings.s3_folder_prefix
+                )
+                location_prefix = "s3://"
+            except Exception as e:
+                print(f"Erro ao configurar S3, usando armazenamento local: {e}")
+
+        if backend is None:
+            backend = LocalFileStorageService(Path(ai_settings.storage_dir))
+
+        return ContentAddressedBlobStore(
+            backend=backend,
+            refs=BlobRefRepositorySqlAlchemy(session_factory=session_factory),
+            location_prefix=location_prefix,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_garbage_collector(
+        self,
+        ai_settings: AISettings,
+        session_factory: async_sessionmaker[AsyncSession],
+        blob_store: BlobStoreProtocol,
+    ) -> StorageGarbageCollector:
+        from datetime import timedelta
+        from pathlib import Path
+
+        return StorageGarbageCollector(
+            session_factory=session_factory,
+            blob_store=blob_store,
+            vector_store_dir=Path(ai_settings.vector_store_dir),
+            batch_size=ai_settings.storage_gc_batch_size,
+            min_age=timedelta(hours=ai_settings.storage_gc_min_age_hours),
+        )
+
+    @provide(scope=Scope.APP)
+    def get_full_text_reindexer(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        blob_store: BlobStoreProtocol,
+    ) -> FullTextReindexer:
+        return FullTextReindexer(session_factory=session_factory, blob_store=blob_store)
+
+
 # ===== NOVOS PROVIDERS PARA IA E CURRÍCULOS =====
 
 class AIProvider(Provider):
@@ -500,9 +655,14 @@ class AIProvider(Provider):
         return LlamaSettings.llm  # <--- usa LlamaSettings
 
     @provide(scope=Scope.APP)
-    def get_embed_model(self) -> BaseEmbedding:
-        # Sempre retorna o modelo de embedding global
-        return LlamaSettings.embed_model  # <--- usa LlamaSettings
+    def get_embed_model(self, ai_settings: AISettings, cache: CacheProtocol) -> BaseEmbedding:
+        # Sempre usa o modelo de embedding global, com cache dos embeddings de consulta
+        return CachedQueryEmbedding(
+            LlamaSettings.embed_model,  # <--- usa LlamaSettings
+            max_entries=ai_settings.query_embedding_cache_size,
+            redis=cache if ai_settings.query_embedding_cache_redis else None,
+            redis_ttl=ai_settings.query_embedding_cache_ttl,
+        )
 
     @provide(scope=Scope.APP)
     def get_transformer(self) -> TransformerProtocol:
@@ -528,59 +688,85 @@ class AIProvider(Provider):
         embed_model: BaseEmbedding,
         ai_settings: AISettings,
         chunker: ChunkerProtocol,
-        ingestor: IngestionProtocol
+        ingestor: IngestionProtocol,
+        blob_store: BlobStoreProtocol,
     ) -> IndexerProtocol:
         from pathlib import Path
-        
-        sqlite_storage = None
-        
-        if ai_settings.use_sqlite_storage:
-            try:
-                storage_url = ai_settings.sqlite_storage_url.strip()
-                
-                if storage_url.startswith(('http://', 'https://')):
-                    from infrastructures.storage.sqlite_storage import HTTPFileStorageService
-                    sqlite_storage = HTTPFileStorageService(storage_url)
-                    print("=" * 60)
-                    print("✅ Indexer: SQLite HTTP Storage (PythonAnywhere) CONFIGURADO")
-                    print(f"   URL: {storage_url}")
-                    print(f"   Índices serão salvos remotamente")
-                    print("=" * 60)
-                else:
-                    from infrastructures.storage.sqlite_storage import SQLiteFileStorageService
-                    sqlite_storage = SQLiteFileStorageService(storage_url)
-                    print("=" * 60)
-                    print("✅ Indexer: SQLite File Storage (Local) CONFIGURADO")
-                    print(f"   Caminho: {storage_url}")
-                    print("=" * 60)
-            except Exception as e:
-                print("=" * 60)
-                print("❌ ERRO ao configurar SQLite storage para indexer")
-                print(f"   Erro: {e}")
-                print("   Usando armazenamento local como fallback")
-                print("=" * 60)
-        
+
+        # Índices só vão para o blob store quando há storage remoto; localmente
+        # continuam como diretórios em vector_store_dir (carregados sem descompactar)
+        remote_storage = ai_settings.use_sqlite_storage or ai_settings.use_s3_storage
+        if remote_storage:
+            print("✅ Indexer: índices serão salvos no blob store remoto")
+
         return LlamaIndexer(
             embed_model=embed_model,
             vector_store_dir=Path(ai_settings.vector_store_dir),
             chunker=chunker,
             ingestor=ingestor,
-            sqlite_storage=sqlite_storage
+            blob_store=blob_store if remote_storage else None,
+            hybrid_search=ai_settings.hybrid_search,
+            vector_weight=ai_settings.hybrid_vector_weight,
+            bm25_weight=ai_settings.hybrid_bm25_weight,
+            rrf_k=ai_settings.hybrid_rrf_k,
+            bm25_k1=ai_settings.bm25_k1,
+            bm25_b=ai_settings.bm25_b,
+            index_cache_size=ai_settings.index_cache_size,
+            vector_store_type=ai_settings.vector_store_type,
+            ann_min_vectors=ai_settings.ann_min_vectors,
+            ann_ef_search=ai_settings.ann_ef_search,
+            ann_ivf_nprobe=ai_settings.ann_ivf_nprobe,
+            embedding_storage=ai_settings.embedding_storage,
+            embedding_rescore=ai_settings.embedding_rescore,
+            embedding_rescore_factor=ai_settings.embedding_rescore_factor,
         )
 
     @provide(scope=Scope.APP)
-    def get_analyzer(self, llm: LLM) -> AIAnalyzerProtocol:
-        return OllamaAnalyzer(llm=llm)
+    def get_shortlister(
+        self, indexer: IndexerProtocol, embed_model: BaseEmbedding, ai_settings: AISettings
+    ) -> CandidateShortlisterProtocol:
+        return CandidateShortlister(
+            indexer=indexer,
+            embed_model=embed_model,
+            similarity_weight=ai_settings.shortlist_similarity_weight,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_prompt_budget(self, ai_settings: AISettings) -> PromptBudgetProtocol:
+        return TokenBudgeter(
+            tokenizer=load_tokenizer(ai_settings.llm_tokenizer),
+            max_prompt_tokens=ai_settings.llm_prompt_max_tokens,
+            job_max_share=ai_settings.llm_prompt_job_max_share,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_analyzer(
+        self, llm: LLM, prompt_budget: PromptBudgetProtocol, ai_settings: AISettings
+    ) -> AIAnalyzerProtocol:
+        return OllamaAnalyzer(
+            llm=llm,
+            profile_excerpt_chunks=ai_settings.scoring_profile_excerpt_chunks,
+            prompt_budget=prompt_budget,
+            timeout=ai_settings.llm_timeout,
+        )
     
     @provide(scope=Scope.APP)
-    def get_validator(self, llm: LLM) -> ResumeValidatorProtocol:
+    def get_validator(
+        self, llm: LLM, prompt_budget: PromptBudgetProtocol, ai_settings: AISettings
+    ) -> ResumeValidatorProtocol:
         from infrastructures.ai.resume_validator import ResumeValidator
-        return ResumeValidator(llm=llm)
+        return ResumeValidator(
+            llm=llm,
+            prompt_budget=prompt_budget,
+            max_prompt_tokens=ai_settings.resume_validator_max_tokens,
+        )
     
     @provide(scope=Scope.APP)
-    def get_location_analyzer(self, llm: LLM) -> LocationAnalyzerProtocol:
+    def get_location_analyzer(
+        self, llm: LLM, prompt_budget: PromptBudgetProtocol, ai_settings: AISettings
+    ) -> LocationAnalyzerProtocol:
         from infrastructures.ai.location_analyzer import LocationAnalyzer
-        return LocationAnalyzer(llm=llm)
+        return LocationAnalyzer(llm=llm, prompt_budget=prompt_budget, timeout=ai_settings.llm_timeout)
 
 
 class ResumeUseCaseProvider(Provider):
@@ -590,68 +776,19 @@ class ResumeUseCaseProvider(Provider):
     def get_upload_use_case(
         self,
         indexer: IndexerProtocol,
-        ai_settings: AISettings,
         resume_repository: ResumeRepositoryProtocol,
         uow: UnitOfWorkProtocol,
         validator: ResumeValidatorProtocol,
+        blob_store: BlobStoreProtocol,
+        search_index: FullTextSearchProtocol,
     ) -> UploadResumesUseCase:
-        from pathlib import Path
-
-        storage_path = Path(ai_settings.storage_dir)
-        s3_storage = None
-        sqlite_storage = None
-        
-        # Configura SQLite se habilitado
-        if ai_settings.use_sqlite_storage:
-            try:
-                storage_url = ai_settings.sqlite_storage_url.strip()
-                
-                if storage_url.startswith(('http://', 'https://')):
-                    from infrastructures.storage.sqlite_storage import HTTPFileStorageService
-                    sqlite_storage = HTTPFileStorageService(storage_url)
-                    print("=" * 60)
-                    print("✅ SQLite HTTP Storage (PythonAnywhere) CONFIGURADO")
-                    print(f"   URL: {storage_url}")
-                    print("=" * 60)
-                else:
-                    from infrastructures.storage.sqlite_storage import SQLiteFileStorageService
-                    sqlite_storage = SQLiteFileStorageService(storage_url)
-                    print("=" * 60)
-                    print("✅ SQLite File Storage (Local) CONFIGURADO")
-                    print(f"   Caminho: {storage_url}")
-                    print("=" * 60)
-            except Exception as e:
-                print("=" * 60)
-                print("❌ ERRO ao configurar SQLite storage")
-                print(f"   Erro: {e}")
-                print("   Usando armazenamento local como fallback")
-                print("=" * 60)
-        
-        elif ai_settings.use_s3_storage:
-            try:
-                from infrastructures.storage.s3_storage import S3StorageService
-                s3_storage = S3StorageService(
-                    endpoint_url=ai_settings.s3_endpoint_url,
-                    region=ai_settings.s3_region,
-                    access_key=ai_settings.s3_access_key,
-                    secret_key=ai_settings.s3_secret_key,
-                    bucket_name=ai_settings.s3_bucket_name,
-                    folder_prefix=ai_settings.s3_folder_prefix
-                )
-            except Exception as e:
-                print(f"Erro ao configurar S3, usando armazenamento local: {e}")
-        
-        if not sqlite_storage and not s3_storage:
-            storage_path.mkdir(parents=True, exist_ok=True)
-        
         return UploadResumesUseCase(
             uow=uow,
             repository=resume_repository,
             indexer=indexer,
             validator=validator,
-            storage_dir=storage_path,
-            s3_storage=s3_storage,
-            sqlite_storage=sqlite_storage
+            blob_store=blob_store,
+            search_index=search_index,
         )
 
     @provide(scope=Scope.REQUEST)
@@ -700,13 +837,36 @@ class ResumeUseCaseProvider(Provider):
     ) -> ListResumesUseCase:
         return ListResumesUseCase(repository=repository)
     
+    @provide(scope=Scope.REQUEST)
+    def get_resume_use_case(
+        self,
+        repository: ResumeRepositoryProtocol,
+    ) -> GetResumeUseCase:
+        return GetResumeUseCase(repository=repository)
+    
     @provide(scope=Scope.REQUEST)
     def get_delete_resume_use_case(
         self,
         repository: ResumeRepositoryProtocol,
         uow: UnitOfWorkProtocol,
+        blob_store: BlobStoreProtocol,
+        search_index: FullTextSearchProtocol,
+        indexer: IndexerProtocol,
     ) -> DeleteResumeUseCase:
-        return DeleteResumeUseCase(repository=repository, uow=uow)
+        return DeleteResumeUseCase(
+            repository=repository,
+            uow=uow,
+            blob_store=blob_store,
+            search_index=search_index,
+            indexer=indexer,
+        )
+
+    @provide(scope=Scope.REQUEST)
+    def get_search_resumes_use_case(
+        self,
+        search_index: FullTextSearchProtocol,
+    ) -> SearchResumesUseCase:
+        return SearchResumesUseCase(search_index=search_index)
 
     @provide(scope=Scope.REQUEST)
     def get_resume_group_repository(self, session: AsyncSession) -> ResumeGroupRepositoryProtocol:
@@ -736,10 +896,9 @@ class ResumeUseCaseProvider(Provider):
     @provide(scope=Scope.REQUEST)
     def get_list_resumes_by_group_use_case(
         self,
-        group_repository: ResumeGroupRepositoryProtocol,
         resume_repository: ResumeRepositoryProtocol,
     ) -> ListResumesByGroupUseCase:
-        return ListResumesByGroupUseCase(group_repository=group_repository, resume_repository=resume_repository)
+        return ListResumesByGroupUseCase(resume_repository=resume_repository)
 
     @provide(scope=Scope.REQUEST)
     def get_set_group_resumes_use_case(
@@ -819,9 +978,18 @@ class ResumeUseCaseProvider(Provider):
         indexer: IndexerProtocol,
         location_analyzer: LocationAnalyzerProtocol,
         resume_repository: ResumeRepositoryProtocol,
+        shortlister: CandidateShortlisterProtocol,
+        prompt_budget: PromptBudgetProtocol,
+        ai_settings: AISettings,
     ) -> SearchCandidatesUseCase:
         return SearchCandidatesUseCase(
             indexer=indexer,
             location_analyzer=location_analyzer,
             resume_repository=resume_repository,
+            shortlister=shortlister,
+            llm_shortlist_size=ai_settings.llm_shortlist_size,
+            llm_shortlist_min_score=ai_settings.llm_shortlist_min_score,
+            use_resume_profiles=ai_settings.scoring_use_resume_profiles,
+            profile_excerpt_chunks=ai_settings.scoring_profile_excerpt_chunks,
+            prompt_budget=prompt_budget,
         )
@@ -0,0 +1,80 @@
+"""
+Pré-triagem dos candidatos antes da avaliação pelo LLM.
+
+Sinal barato, sem chamar o LLM nem embedar currículos de novo:
+- similaridade de cosseno entre o embedding da vaga (com cache) e a média dos
+  embeddings já salvos dos chunks recuperados do candidato;
+- fração das palavras-chave da vaga (radicais, sem stopwords) presentes nesses chunks.
+"""
+from dataclasses import dataclass
+from typing import final
+
+import numpy as np
+from llama_index.core.embeddings import BaseEmbedding
+
+from application.dtos.candidate.analysis import CandidatePreScoreDTO
+from application.interfaces.ai.indexer import IndexerProtocol
+from application.interfaces.ai.shortlister import CandidateShortlisterProtocol
+from infrastructures.search.text_analysis import keywords, query_terms, stem
+
+
+def _unit(vector: np.ndarray) -> np.ndarray:
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CandidateShortlister(CandidateShortlisterProtocol):
+    indexer: IndexerProtocol
+    embed_model: BaseEmbedding
+    # Peso da similaridade no score; o restante vai para as palavras-chave
+    similarity_weight: float = 0.7
+
+    async def pre_score(
+        self,
+        query: str,
+        index_ids: list[str],
+        candidates: dict[str, list[tuple[str, str]]],
+    ) -> list[CandidatePreScoreDTO]:
+        if not candidates:
+            return []
+
+        node_ids = [node_id for chunks in candidates.values() for node_id, _ in chunks]
+        embeddings = await self.indexer.get_node_embeddings(index_ids, node_ids)
+        query_vector = (
+            _unit(np.asarray(await self.embed_model.aget_query_embedding(query), dtype=np.float32))
+            if embeddings else None
+        )
+
+        # Radical -> palavra como escrita na vaga (para mostrar ao recrutador)
+        job_words: dict[str, str] = {}
+        for word in query_terms(query):
+            for term in keywords(word):
+                job_words.setdefault(term, word)
+        job_keywords = set(job_words) or {stem(word) for word in query_terms(query)}
+
+        results = []
+        for file_name, chunks in candidates.items():
+            vectors = [embeddings[node_id] for node_id, _ in chunks if node_id in embeddings]
+            similarity = 0.0
+            if query_vector is not None and vectors:
+                pooled = _unit(np.mean([_unit(np.asarray(v, dtype=np.float32)) for v in vectors], axis=0))
+                similarity = float(pooled @ query_vector)
+
+            matched = job_keywords & keywords(" ".join(text for _, text in chunks))
+            overlap = len(matched) / len(job_keywords) if job_keywords else 0.0
+
+            weight = self.similarity_weight if vectors else 0.0
+            score = 100 * (weight * max(similarity, 0.0) + (1 - weight) * overlap)
+            results.append(
+                CandidatePreScoreDTO(
+                    arquivo=file_name,
+                    score=round(score, 1),
+                    similarity=round(similarity, 4),
+                    keyword_overlap=round(overlap, 4),
+                    matched_keywords=sorted(job_words.get(term, term) for term in matched),
+                )
+            )
+
+        return sorted(results, key=lambda r: (-r.score, r.arquivo))
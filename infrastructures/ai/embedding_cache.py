@@ -0,0 +1,132 @@
+"""
+Cache de embeddings de consulta (descrições de vaga).
+
+A mesma descrição é buscada várias vezes e, com a Inference API do HuggingFace,
+cada embedding é uma chamada remota. O cache guarda o vetor por (modelo, hash do
+texto normalizado): primeiro em memória (LRU limitado, por processo) e, se
+configurado, no Redis (compartilhado entre workers, com TTL).
+
+Só os embeddings de consulta passam pelo cache; os de documentos (indexação e
+chunking semântico) vão direto para o modelo.
+"""
+import hashlib
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Any, List, Optional
+
+from llama_index.core.base.embeddings.base import BaseEmbedding, Embedding
+from pydantic import PrivateAttr
+
+from application.interfaces.cache import CacheProtocol
+
+DEFAULT_MAX_ENTRIES = 1024
+REDIS_KEY_PREFIX = "query_embedding:"
+
+
+def normalize_query(text: str) -> str:
+    """Normaliza unicode e espaços (é esse texto que vai para o modelo)"""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def query_cache_key(model_name: str, text: str) -> str:
+    digest = hashlib.sha256(normalize_query(text).encode("utf-8")).hexdigest()
+    return f"{model_name}:{digest}"
+
+
+class CachedQueryEmbedding(BaseEmbedding):
+    """Embedding do LlamaIndex que delega ao modelo real e guarda os embeddings de consulta"""
+
+    _inner: BaseEmbedding = PrivateAttr()
+    _redis: Optional[CacheProtocol] = PrivateAttr(default=None)
+    _redis_ttl: Optional[int] = PrivateAttr(default=None)
+    _max_entries: int = PrivateAttr(default=DEFAULT_MAX_ENTRIES)
+    _entries: "OrderedDict[str, Embedding]" = PrivateAttr(default_factory=OrderedDict)
+    _lock: Any = PrivateAttr(default_factory=threading.Lock)
+
+    def __init__(
+        self,
+        inner: BaseEmbedding,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        redis: Optional[CacheProtocol] = None,
+        redis_ttl: Optional[int] = None,
+    ):
+        """
+        Args:
+            inner: Modelo de embedding real
+            max_entries: Embeddings mantidos em memória (LRU)
+            redis: Cache compartilhado opcional (RedisCacheClient)
+            redis_ttl: TTL no Redis em segundos (None = TTL padrão do cliente)
+        """
+        super().__init__(
+            model_name=inner.model_name,
+            embed_batch_size=inner.embed_batch_size,
+            callback_manager=inner.callback_manager,
+        )
+        self._inner = inner
+        self._redis = redis
+        self._redis_ttl = redis_ttl
+        self._max_entries = max_entries
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "CachedQueryEmbedding"
+
+    @property
+    def inner(self) -> BaseEmbedding:
+        return self._inner
+
+    def _get_query_embedding(self, query: str) -> Embedding:
+        key = query_cache_key(self.model_name, query)
+        embedding = self._get_local(key)
+        if embedding is None:
+            embedding = self._inner.get_query_embedding(normalize_query(query))
+            self._put_local(key, embedding)
+        return embedding
+
+    async def _aget_query_embedding(self, query: str) -> Embedding:
+        key = query_cache_key(self.model_name, query)
+        embedding = self._get_local(key)
+        if embedding is not None:
+            return embedding
+
+        if self._redis is not None:
+            cached = await self._redis.get(REDIS_KEY_PREFIX + key)
+            if cached is not None:
+                embedding = cached["embedding"]
+                self._put_local(key, embedding)
+                return embedding
+
+        embedding = await self._inner.aget_query_embedding(normalize_query(query))
+        self._put_local(key, embedding)
+        if self._redis is not None:
+            await self._redis.set(REDIS_KEY_PREFIX + key, {"embedding": embedding}, ttl=self._redis_ttl)
+        return embedding
+
+    def _get_text_embedding(self, text: str) -> Embedding:
+        return self._inner.get_text_embedding(text)
+
+    async def _aget_text_embedding(self, text: str) -> Embedding:
+        return await self._inner.aget_text_embedding(text)
+
+    def _get_text_embeddings(self, texts: List[str]) -> List[Embedding]:
+        return self._inner.get_text_embedding_batch(texts)
+
+    async def _aget_text_embeddings(self, texts: List[str]) -> List[Embedding]:
+        return await self._inner.aget_text_embedding_batch(texts)
+
+    def _get_local(self, key: str) -> Optional[Embedding]:
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is not None:
+                self._entries.move_to_end(key)
+            return embedding
+
+    def _put_local(self, key: str, embedding: Embedding) -> None:
+        if self._max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = embedding
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
@@ -0,0 +1,138 @@
+"""
+Busca federada: a mesma consulta em vários índices vetoriais, em paralelo, com uma
+única fusão global.
+
+RRF só usa posições, então fundir os resultados RRF de cada índice daria um
+round-robin entre índices, não um ranking global. Por isso cada índice devolve as
+listas brutas: os hits densos (similaridade de cosseno, comparável entre índices do
+mesmo modelo de embedding) e os hits BM25. As listas de todos os índices são juntadas
+por score em uma lista densa global e uma BM25 global, e um único RRF funde as duas.
+Sem BM25 em nenhum índice, o resultado é o top-k global por cosseno.
+
+O score BM25 usa o IDF de cada índice, então a lista BM25 global é uma aproximação;
+índices sem BM25 (criados antes dele) entram só pela lista densa.
+"""
+import asyncio
+import heapq
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence
+
+from llama_index.core.retrievers import BaseRetriever
+from llama_index.core.schema import BaseNode, NodeWithScore, QueryBundle
+
+from infrastructures.ai.hybrid_retriever import DEFAULT_RRF_K, reciprocal_rank_fusion
+from infrastructures.search.bm25 import BM25Index
+
+
+def merge_top_k(
+    results: Sequence[tuple[str, Sequence[NodeWithScore]]], top_k: int
+) -> list[tuple[str, NodeWithScore]]:
+    """(index_id, nós) de cada índice -> os top_k (index_id, nó) de maior score entre todos"""
+    candidates = ((index_id, node) for index_id, nodes in results for node in nodes)
+    return heapq.nlargest(top_k, candidates, key=lambda item: item[1].score or 0.0)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class FederatedSource:
+    """Um índice da busca federada"""
+    index_id: str
+    vector_retriever: BaseRetriever  # só vetorial (score = cosseno), limitado a candidate_k
+    docstore: Any  # para os chunks que só o BM25 encontrou
+    bm25: Optional[BM25Index] = None
+    allowed_ids: Optional[set[str]] = None  # chunks que passaram nos filtros; None = todos
+
+
+class FederatedRetriever(BaseRetriever):
+    """Retriever do LlamaIndex que consulta vários índices e funde tudo em um top-k global"""
+
+    def __init__(
+        self,
+        sources: Sequence[FederatedSource],
+        top_k: int,
+        candidate_k: int,
+        vector_weight: float = 1.0,
+        bm25_weight: float = 1.0,
+        rrf_k: int = DEFAULT_RRF_K,
+    ):
+        """
+        Args:
+            sources: Índices consultados
+            top_k: Chunks devolvidos após a fusão
+            candidate_k: Tamanho de cada lista global (densa e BM25) antes da fusão
+        """
+        super().__init__()
+        self._sources = list(sources)
+        self._top_k = top_k
+        self._candidate_k = candidate_k
+        self._weights = (vector_weight, bm25_weight)
+        self._rrf_k = rrf_k
+
+    def _retrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        dense = [(s.index_id, s.vector_retriever.retrieve(query_bundle)) for s in self._dense_sources()]
+        lexical = [(s, self._lexical(s, query_bundle.query_str)) for s in self._lexical_sources()]
+        return [node for _, node in self._fuse(dense, lexical)]
+
+    async def _aretrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        return [node for _, node in await self.aretrieve_with_index(query_bundle)]
+
+    async def aretrieve_with_index(self, query_bundle: QueryBundle) -> list[tuple[str, NodeWithScore]]:
+        """Como aretrieve, mas cada nó vem com o id do índice de onde saiu"""
+        dense_sources = self._dense_sources()
+        lexical_sources = self._lexical_sources()
+        # Buscas densas e BM25 (Python puro, em threads) de todos os índices ao mesmo tempo
+        found = await asyncio.gather(
+            *(s.vector_retriever.aretrieve(query_bundle) for s in dense_sources),
+            *(asyncio.to_thread(self._lexical, s, query_bundle.query_str) for s in lexical_sources),
+        )
+        dense = [(s.index_id, nodes) for s, nodes in zip(dense_sources, found)]
+        lexical = list(zip(lexical_sources, found[len(dense_sources):]))
+        return self._fuse(dense, lexical)
+
+    def _dense_sources(self) -> list[FederatedSource]:
+        return self._sources if self._weights[0] > 0 else []
+
+    def _lexical_sources(self) -> list[FederatedSource]:
+        if self._weights[1] <= 0:
+            return []
+        return [s for s in self._sources if s.bm25 is not None]
+
+    def _lexical(self, source: FederatedSource, query: str) -> list[tuple[str, float]]:
+        return source.bm25.search(query, self._candidate_k, source.allowed_ids)
+
+    def _fuse(
+        self,
+        dense: list[tuple[str, Sequence[NodeWithScore]]],
+        lexical: list[tuple[FederatedSource, list[tuple[str, float]]]],
+    ) -> list[tuple[str, NodeWithScore]]:
+        global_dense = merge_top_k(dense, self._candidate_k)
+        if not lexical:
+            # Sem BM25: ranking global por cosseno
+            return global_dense[:self._top_k]
+
+        global_lexical = heapq.nlargest(
+            self._candidate_k,
+            ((source, node_id, score) for source, hits in lexical for node_id, score in hits),
+            key=lambda item: item[2],
+        )
+        fused = reciprocal_rank_fusion(
+            [
+                [(index_id, n.node.node_id) for index_id, n in global_dense],
+                [(source.index_id, node_id) for source, node_id, _ in global_lexical],
+            ],
+            self._weights,
+            self._rrf_k,
+        )
+
+        nodes: dict[tuple[str, str], BaseNode] = {
+            (index_id, n.node.node_id): n.node for index_id, n in global_dense
+        }
+        docstores = {source.index_id: source.docstore for source, _, _ in global_lexical}
+        results: list[tuple[str, NodeWithScore]] = []
+        for (index_id, node_id), score in fused:
+            node = nodes.get((index_id, node_id)) or docstores[index_id].get_node(node_id, raise_error=False)
+            if node is None:
+                continue
+            results.append((index_id, NodeWithScore(node=node, score=score)))
+            if len(results) >= self._top_k:
+                break
+        return results
@@ -0,0 +1,104 @@
+"""
+Recuperação híbrida: busca densa (embeddings) + BM25, combinadas por
+reciprocal rank fusion (RRF).
+
+RRF usa só a posição de cada chunk em cada lista (score = soma de peso / (k + posição)),
+então não é preciso normalizar similaridade de cosseno contra score BM25.
+"""
+import asyncio
+from typing import Any, Hashable, List, Sequence
+
+from llama_index.core.retrievers import BaseRetriever
+from llama_index.core.schema import NodeWithScore, QueryBundle
+
+from infrastructures.search.bm25 import BM25Index
+
+DEFAULT_RRF_K = 60
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[Hashable]],
+    weights: Sequence[float],
+    k: int = DEFAULT_RRF_K,
+) -> list[tuple[Hashable, float]]:
+    """Funde listas de ids ordenadas (melhor primeiro) em uma só, com o score RRF ponderado"""
+    scores: dict[str, float] = {}
+    for ranking, weight in zip(rankings, weights):
+        if weight <= 0:
+            continue
+        for position, item_id in enumerate(ranking, start=1):
+            scores[item_id] = scores.get(item_id, 0.0) + weight / (k + position)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+class HybridRetriever(BaseRetriever):
+    """Retriever do LlamaIndex que funde o retriever vetorial do índice com o BM25 salvo junto dele"""
+
+    def __init__(
+        self,
+        vector_retriever: BaseRetriever,
+        bm25: BM25Index,
+        docstore: Any,
+        top_k: int,
+        candidate_k: int,
+        vector_weight: float = 1.0,
+        bm25_weight: float = 1.0,
+        rrf_k: int = DEFAULT_RRF_K,
+        allowed_ids: set[str] | None = None,
+    ):
+        """
+        Args:
+            vector_retriever: index.as_retriever(similarity_top_k=candidate_k)
+            docstore: index.docstore, para os chunks que só o BM25 encontrou
+            top_k: Chunks devolvidos após a fusão
+            candidate_k: Chunks pedidos a cada lista antes da fusão
+            allowed_ids: Chunks que passaram nos filtros de metadados (o vector_retriever
+                já deve estar restrito a eles); None = todos
+        """
+        super().__init__()
+        self._vector_retriever = vector_retriever
+        self._bm25 = bm25
+        self._docstore = docstore
+        self._top_k = top_k
+        self._candidate_k = candidate_k
+        self._weights = (vector_weight, bm25_weight)
+        self._rrf_k = rrf_k
+        self._allowed_ids = allowed_ids
+
+    def _retrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        dense = self._vector_retriever.retrieve(query_bundle) if self._weights[0] > 0 else []
+        return self._fuse(dense, self._lexical(query_bundle.query_str))
+
+    async def _aretrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        async def no_dense() -> List[NodeWithScore]:
+            return []
+
+        # O BM25 é Python puro (CPU): roda numa thread, em paralelo com a busca densa
+        dense, lexical = await asyncio.gather(
+            self._vector_retriever.aretrieve(query_bundle) if self._weights[0] > 0 else no_dense(),
+            asyncio.to_thread(self._lexical, query_bundle.query_str),
+        )
+        return self._fuse(dense, lexical)
+
+    def _lexical(self, query: str) -> list[tuple[str, float]]:
+        if self._weights[1] <= 0:
+            return []
+        return self._bm25.search(query, self._candidate_k, self._allowed_ids)
+
+    def _fuse(self, dense: List[NodeWithScore], lexical: list[tuple[str, float]]) -> List[NodeWithScore]:
+        fused = reciprocal_rank_fusion(
+            [[n.node.node_id for n in dense], [node_id for node_id, _ in lexical]],
+            self._weights,
+            self._rrf_k,
+        )
+
+        nodes_by_id = {n.node.node_id: n.node for n in dense}
+        results: List[NodeWithScore] = []
+        for node_id, score in fused:
+            node = nodes_by_id.get(node_id) or self._docstore.get_node(node_id, raise_error=False)
+            if node is None:
+                continue
+            results.append(NodeWithScore(node=node, score=score))
+            if len(results) >= self._top_k:
+                break
+        return results
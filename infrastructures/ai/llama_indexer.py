@@ -1,6 +1,7 @@
 from pathlib import Path
 from typing import final, Optional
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 import asyncio
 import shutil
 import tempfile
@@ -8,8 +9,36 @@ import zipfile
 
 from llama_index.core import VectorStoreIndex, StorageContext, load_index_from_storage
 from llama_index.core.embeddings import BaseEmbedding
+from llama_index.core.indices.vector_store.retrievers import VectorIndexRetriever
+from llama_index.core.retrievers import BaseRetriever
+from llama_index.core.schema import NodeWithScore, QueryBundle
 
+from application.dtos.candidate.profile import ResumeProfileDTO
+from application.dtos.search import MetadataFilterDTO
 from application.interfaces.ai.indexer import IndexerProtocol
+from application.interfaces.storage import BlobStoreProtocol
+from infrastructures.ai.federated_retriever import FederatedRetriever, FederatedSource
+from infrastructures.ai.hybrid_retriever import DEFAULT_RRF_K, HybridRetriever
+from infrastructures.ai.resume_profiler import ResumeProfiles
+from infrastructures.ai.vector_search_retriever import VectorSearchRetriever
+from infrastructures.search.ann_index import ANN_BACKENDS, AnnIndex, is_backend_available
+from infrastructures.search.bm25 import BM25Index
+from infrastructures.search.metadata_index import MetadataIndex
+from infrastructures.search.quantized_vectors import QUANTIZED_DTYPES, QuantizedVectors
+from infrastructures.storage.blob_store import compute_digest, zstd
+
+_DIGEST_LENGTH = 64
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class _LoadedIndex:
+    index: VectorStoreIndex
+    bm25: Optional[BM25Index]
+    metadata_index: MetadataIndex
+    profiles: ResumeProfiles
+    ann: Optional[AnnIndex] = None
+    quantized: Optional[QuantizedVectors] = None
 
 @final
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -18,7 +47,28 @@ class LlamaIndexer(IndexerProtocol):
     vector_store_dir: Path
     chunker: "ChunkerProtocol"
     ingestor: "IngestionProtocol"
-    sqlite_storage: Optional[object] = None  # HTTPFileStorageService ou SQLiteFileStorageService
+    blob_store: Optional[BlobStoreProtocol] = None  # storage remoto (SQLite/HTTP/S3); None = diretórios locais
+    # Busca híbrida: BM25 salvo junto do índice + fusão RRF com a busca vetorial
+    hybrid_search: bool = True
+    vector_weight: float = 1.0
+    bm25_weight: float = 1.0
+    rrf_k: int = DEFAULT_RRF_K
+    bm25_k1: float = 1.5
+    bm25_b: float = 0.75
+    # Busca vetorial: "simple" (exaustiva) ou um backend ANN (faiss, faiss_hnsw, faiss_ivf, faiss_flat, hnswlib);
+    # abaixo de ann_min_vectors chunks (no índice ou após os filtros) a busca continua exaustiva
+    vector_store_type: str = "simple"
+    ann_min_vectors: int = 2000
+    ann_ef_search: int = 128
+    ann_ivf_nprobe: int = 16
+    # Embeddings salvos como "float32" (JSON do SimpleVectorStore), "float16" ou "int8";
+    # com embedding_rescore os vetores float32 vão junto (binário) para reordenar os candidatos
+    embedding_storage: str = "float32"
+    embedding_rescore: bool = False
+    embedding_rescore_factor: int = 4
+    # Índices mantidos em memória entre buscas (LRU); 0 = carrega do disco a cada busca
+    index_cache_size: int = 8
+    _index_cache: "OrderedDict[str, _LoadedIndex]" = field(default_factory=OrderedDict, init=False, repr=False)
     
     async def index_documents(self, file_paths: list[Path]) -> str:
         def _index_sync():
@@ -51,7 +101,29 @@ class LlamaIndexer(IndexerProtocol):
             persist_dir = temp_dir / index_id
             persist_dir.mkdir(parents=True, exist_ok=True)
             
+            embeddings = index.vector_store._data.embedding_dict
+            ann = self._build_ann(embeddings)
+            quantized = self._build_quantized(embeddings)
+            if quantized is not None:
+                # Os vetores ficam só no arquivo quantizado, não no JSON do SimpleVectorStore
+                embeddings.clear()
+            
             index.storage_context.persist(persist_dir=str(persist_dir))
+            # BM25 dos mesmos chunks, no mesmo diretório (vai junto no zip)
+            BM25Index.build(
+                ((chunk.node_id, chunk.get_content()) for chunk in chunks),
+                k1=self.bm25_k1,
+                b=self.bm25_b,
+            ).save(persist_dir)
+            MetadataIndex.build((chunk.node_id, chunk.metadata) for chunk in chunks).save(persist_dir)
+            # Perfil compacto por currículo, do texto inteiro (antes do chunking)
+            ResumeProfiles.build(
+                (doc.metadata.get("file_name", "Desconhecido"), doc.text, doc.metadata) for doc in documents
+            ).save(persist_dir)
+            if ann is not None:
+                ann.save(persist_dir)
+            if quantized is not None:
+                quantized.save(persist_dir)
             print(f"[DEBUG INDEXER] Índice persistido temporariamente em: {persist_dir}")
             
             return index_id, temp_dir, persist_dir
@@ -60,13 +132,15 @@ class LlamaIndexer(IndexerProtocol):
         index_id, temp_dir, persist_dir = await loop.run_in_executor(None, _index_sync)
         
         try:
-            if self.sqlite_storage:
-                print(f"📦 Compactando índice {index_id} para upload no PythonAnywhere...")
+            if self.blob_store:
+                print(f"📦 Compactando índice {index_id} para o blob store...")
                 
-                # Cria ZIP do diretório do índice
+                # Com zstd disponível o ZIP fica sem compressão e o blob store comprime
+                # o conjunto (JSON do índice comprime muito melhor assim)
+                zip_compression = zipfile.ZIP_STORED if zstd is not None else zipfile.ZIP_DEFLATED
                 zip_path = temp_dir / f"{index_id}.zip"
-                with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                    for file in persist_dir.rglob('*'):
+                with zipfile.ZipFile(zip_path, 'w', zip_compression) as zipf:
+                    for file in sorted(persist_dir.rglob('*')):
                         if file.is_file():
                             arcname = file.relative_to(persist_dir)
                             zipf.write(file, arcname)
@@ -74,12 +148,10 @@ class LlamaIndexer(IndexerProtocol):
                 print(f"✅ Índice compactado: {zip_path} ({zip_path.stat().st_size} bytes)")
                 
                 zip_content = zip_path.read_bytes()
-                sqlite_path = await self.sqlite_storage.upload_file(
-                    filename=f"{index_id}.zip",
-                    content=zip_content,
-                    extension="zip"
-                )
-                print(f"✅ Índice enviado para PythonAnywhere: {sqlite_path}")
+                # O id do índice passa a ser o SHA-256 do arquivo (endereçado por conteúdo)
+                index_id = compute_digest(zip_content)
+                location = await self.blob_store.put(zip_content, "zip", compress=True)
+                print(f"✅ Índice {index_id} enviado para o blob store: {location}")
                 
             else:
                 final_persist_dir = self.vector_store_dir / index_id
@@ -93,67 +165,285 @@ class LlamaIndexer(IndexerProtocol):
         
         return index_id
     
-    async def search(self, index_id: str, query: str, top_k: int) -> list[dict]:
-        def _search_sync(persist_dir: Path):
-            storage_context = StorageContext.from_defaults(persist_dir=str(persist_dir))
-            index = load_index_from_storage(storage_context, embed_model=self.embed_model)
-            
-            retriever = index.as_retriever(similarity_top_k=top_k)
-            nodes = retriever.retrieve(query)
-            
-            return [
-                {
-                    "text": node.text,
-                    "metadata": node.metadata,
-                    "score": node.score
-                }
-                for node in nodes
-            ]
+    async def search(
+        self, index_id: str, query: str, top_k: int, filters: Optional[MetadataFilterDTO] = None
+    ) -> list[dict]:
+        retriever = await self.get_retriever(index_id, top_k, filters)
+        # Async: o embedding da consulta passa pelo cache compartilhado (Redis), se houver
+        nodes = await retriever.aretrieve(query)
+        return [self._to_result(node) for node in nodes]
+    
+    async def search_many(
+        self,
+        index_ids: list[str],
+        query: str,
+        top_k: int,
+        filters: Optional[dict[str, MetadataFilterDTO]] = None,
+    ) -> list[dict]:
+        """Top-k de cada índice em paralelo, juntados em um heap global; cada resultado traz o index_id"""
+        retriever = await self.get_federated_retriever(index_ids, top_k, filters)
+        found = await retriever.aretrieve_with_index(QueryBundle(query_str=query))
+        return [{**self._to_result(node), "index_id": index_id} for index_id, node in found]
+    
+    async def get_retriever(
+        self, index_id: str, top_k: int, filters: Optional[MetadataFilterDTO] = None
+    ) -> BaseRetriever:
+        """
+        Retriever do índice: híbrido (vetorial + BM25) quando o índice tem BM25, senão só vetorial.
+        Os filtros de metadados restringem os chunks antes do top-k.
+        """
+        loaded = await self._get_loaded_index(index_id)
+        return self._build_retriever(loaded, top_k, filters)
+    
+    async def get_federated_retriever(
+        self,
+        index_ids: list[str],
+        top_k: int,
+        filters: Optional[dict[str, MetadataFilterDTO]] = None,
+    ) -> FederatedRetriever:
+        """
+        Retriever sobre vários índices (filtros por index_id; índice sem filtro = inteiro).
+        Junta os hits densos e BM25 de todos os índices e faz uma única fusão RRF global.
+        """
+        index_ids = list(dict.fromkeys(index_ids))
+        # Índices que ainda não estão em cache são carregados em paralelo
+        loaded = await asyncio.gather(*(self._get_loaded_index(index_id) for index_id in index_ids))
+        filters = filters or {}
+        candidate_k = top_k * 2
+        sources = []
+        for index_id, index in zip(index_ids, loaded):
+            allowed_ids = index.metadata_index.matching_ids(filters.get(index_id))
+            sources.append(FederatedSource(
+                index_id=index_id,
+                vector_retriever=self._build_vector_retriever(index, candidate_k, allowed_ids),
+                docstore=index.index.docstore,
+                bm25=index.bm25,
+                allowed_ids=allowed_ids,
+            ))
+        return FederatedRetriever(
+            sources,
+            top_k=top_k,
+            candidate_k=candidate_k,
+            vector_weight=self.vector_weight,
+            bm25_weight=self.bm25_weight,
+            rrf_k=self.rrf_k,
+        )
+    
+    def _build_retriever(
+        self, loaded: "_LoadedIndex", top_k: int, filters: Optional[MetadataFilterDTO] = None
+    ) -> BaseRetriever:
+        # Filtros viram um conjunto de node_ids antes da busca (None = índice inteiro)
+        allowed_ids = loaded.metadata_index.matching_ids(filters)
         
-        persist_dir, temp_dir = await self._get_index_directory(index_id)
+        if loaded.bm25 is None:
+            # Busca híbrida desligada
+            return self._build_vector_retriever(loaded, top_k, allowed_ids)
         
-        try:
-            loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(None, _search_sync, persist_dir)
-        finally:
-            if temp_dir and temp_dir.exists():
-                shutil.rmtree(temp_dir, ignore_errors=True)
+        # Cada lista traz mais candidatos que o top_k final para a fusão ter o que reordenar
+        candidate_k = top_k * 2
+        return HybridRetriever(
+            vector_retriever=self._build_vector_retriever(loaded, candidate_k, allowed_ids),
+            bm25=loaded.bm25,
+            docstore=loaded.index.docstore,
+            top_k=top_k,
+            candidate_k=candidate_k,
+            vector_weight=self.vector_weight,
+            bm25_weight=self.bm25_weight,
+            rrf_k=self.rrf_k,
+            allowed_ids=allowed_ids,
+        )
+    
+    def _build_vector_retriever(
+        self, loaded: "_LoadedIndex", k: int, allowed_ids: Optional[set[str]]
+    ) -> BaseRetriever:
+        """Retriever só vetorial (score = similaridade de cosseno), restrito a allowed_ids"""
+        index = loaded.index
+        searcher = None
+        if loaded.ann is not None and (allowed_ids is None or len(allowed_ids) >= self.ann_min_vectors):
+            searcher = loaded.ann
+        elif loaded.quantized is not None:
+            # Busca exaustiva nos vetores quantizados (o SimpleVectorStore está vazio)
+            searcher = loaded.quantized
+        if searcher is not None:
+            return VectorSearchRetriever(
+                searcher=searcher,
+                embed_model=self.embed_model,
+                docstore=index.docstore,
+                top_k=k,
+                allowed_ids=allowed_ids,
+            )
+        if allowed_ids is None:
+            return index.as_retriever(similarity_top_k=k)
+        return VectorIndexRetriever(
+            index,
+            similarity_top_k=k,
+            node_ids=list(allowed_ids),
+            callback_manager=index._callback_manager,
+            object_map=index._object_map,
+        )
+    
+    async def get_node_embeddings(self, index_ids: list[str], node_ids: list[str]) -> dict[str, list[float]]:
+        """Embeddings já salvos dos chunks (sem chamar o modelo); ids não encontrados ficam de fora"""
+        found: dict[str, list[float]] = {}
+        for index_id in dict.fromkeys(index_ids):
+            missing = [node_id for node_id in node_ids if node_id not in found]
+            if not missing:
+                break
+            loaded = await self._get_loaded_index(index_id)
+            embeddings = loaded.index.vector_store._data.embedding_dict
+            found.update({node_id: embeddings[node_id] for node_id in missing if node_id in embeddings})
+            if loaded.quantized is not None:
+                found.update(loaded.quantized.vectors_for(missing))
+        return found
+    
+    async def get_resume_profiles(
+        self, index_ids: list[str], file_names: list[str]
+    ) -> dict[str, ResumeProfileDTO]:
+        """Perfis extraídos na indexação, por file_name; arquivos sem perfil ficam de fora"""
+        found: dict[str, ResumeProfileDTO] = {}
+        for index_id in dict.fromkeys(index_ids):
+            missing = [file_name for file_name in file_names if file_name not in found]
+            if not missing:
+                break
+            loaded = await self._get_loaded_index(index_id)
+            found.update({
+                file_name: profile
+                for file_name in missing
+                if (profile := loaded.profiles.get(file_name)) is not None
+            })
+        return found
+    
+    async def delete_index(self, index_id: str) -> None:
+        """Remove um índice sem currículos: libera o zip no blob store ou apaga o diretório local"""
+        self._index_cache.pop(index_id, None)
+        if self.blob_store and len(index_id) == _DIGEST_LENGTH:
+            await self.blob_store.release_digest(index_id)
+            return
+        persist_dir = self.vector_store_dir / index_id
+        if persist_dir.is_dir():
+            shutil.rmtree(persist_dir, ignore_errors=True)
     
     async def load_index(self, index_id: str) -> VectorStoreIndex:
-        """Carrega um índice existente."""
-        def _load_sync(persist_dir: Path):
-            storage_context = StorageContext.from_defaults(persist_dir=str(persist_dir))
-            return load_index_from_storage(storage_context, embed_model=self.embed_model)
+        """
+        Carrega um índice existente.
+        Com embeddings quantizados o vector store vem vazio: use get_retriever para buscar.
+        """
+        return (await self._get_loaded_index(index_id)).index
+    
+    async def _get_loaded_index(self, index_id: str) -> "_LoadedIndex":
+        """
+        Índice carregado em memória (vetores, BM25 e metadados), com cache LRU.
+        Índices não mudam depois de criados, então o cache não precisa ser invalidado.
+        """
+        loaded = self._index_cache.get(index_id)
+        if loaded is not None:
+            self._index_cache.move_to_end(index_id)
+            return loaded
         
         persist_dir, temp_dir = await self._get_index_directory(index_id)
         
         try:
             loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(None, _load_sync, persist_dir)
+            loaded = await loop.run_in_executor(None, self._load_sync, persist_dir, temp_dir is None)
         finally:
-            # Limpa temp se foi criado
+            # Limpa temp se foi criado (tudo já está em memória)
             if temp_dir and temp_dir.exists():
                 shutil.rmtree(temp_dir, ignore_errors=True)
+        
+        if self.index_cache_size > 0:
+            self._index_cache[index_id] = loaded
+            while len(self._index_cache) > self.index_cache_size:
+                self._index_cache.popitem(last=False)
+        return loaded
+    
+    def _load_sync(self, persist_dir: Path, is_persistent: bool = True) -> "_LoadedIndex":
+        storage_context = StorageContext.from_defaults(persist_dir=str(persist_dir))
+        index = load_index_from_storage(storage_context, embed_model=self.embed_model)
+        
+        # Índices criados antes do BM25 ficam só com a busca vetorial
+        bm25 = BM25Index.load(persist_dir) if self.hybrid_search else None
+        metadata_index = MetadataIndex.load(persist_dir) or MetadataIndex.from_docstore(index.docstore)
+        profiles = ResumeProfiles.load(persist_dir) or ResumeProfiles.from_docstore(index.docstore)
+        
+        # Arquivo de precisão total por mmap só se o diretório não for temporário
+        quantized = QuantizedVectors.load(
+            persist_dir, rescore_factor=self.embedding_rescore_factor, mmap=is_persistent
+        )
+        embeddings = index.vector_store._data.embedding_dict
+        
+        ann = None
+        if self.vector_store_type in ANN_BACKENDS:
+            ann = AnnIndex.load(persist_dir, ef_search=self.ann_ef_search, nprobe=self.ann_ivf_nprobe)
+            if ann is None or ann.backend != self.vector_store_type:
+                # Índice salvo sem ANN (ou com outro backend): monta em memória, fica no cache
+                ann = self._build_ann(embeddings or (quantized.to_embeddings() if quantized else {}))
+        
+        if quantized is None and embeddings:
+            # Índice salvo em float32 com armazenamento quantizado configurado: quantiza em
+            # memória e libera as listas de floats (menos memória por índice em cache)
+            quantized = self._build_quantized(embeddings)
+            if quantized is not None:
+                embeddings.clear()
+        return _LoadedIndex(
+            index=index,
+            bm25=bm25,
+            metadata_index=metadata_index,
+            profiles=profiles,
+            ann=ann,
+            quantized=quantized,
+        )
+    
+    def _build_quantized(self, embeddings: dict[str, list[float]]) -> Optional[QuantizedVectors]:
+        """Embeddings quantizados no tipo configurado; None para manter float32 no SimpleVectorStore"""
+        if self.embedding_storage not in QUANTIZED_DTYPES or not embeddings:
+            return None
+        quantized = QuantizedVectors.build(
+            self.embedding_storage, embeddings, keep_full_precision=self.embedding_rescore
+        )
+        quantized.rescore_factor = self.embedding_rescore_factor
+        return quantized
+    
+    def _build_ann(self, embeddings: dict[str, list[float]]) -> Optional[AnnIndex]:
+        """Índice ANN do backend configurado; None para busca exaustiva"""
+        if self.vector_store_type not in ANN_BACKENDS or len(embeddings) < self.ann_min_vectors:
+            return None
+        if not is_backend_available(self.vector_store_type):
+            print(f"⚠️  Backend ANN '{self.vector_store_type}' não instalado; usando busca exaustiva")
+            return None
+        return AnnIndex.build(
+            self.vector_store_type,
+            embeddings,
+            ef_search=self.ann_ef_search,
+            nprobe=self.ann_ivf_nprobe,
+        )
+    
+    @staticmethod
+    def _to_result(node: NodeWithScore) -> dict:
+        return {
+            "text": node.text,
+            "metadata": node.metadata,
+            "score": node.score
+        }
     
     async def _get_index_directory(self, index_id: str) -> tuple[Path, Optional[Path]]:
         """
         Retorna o diretório onde o índice está localizado.
-        Se usar SQLite storage, baixa e descompacta em temp.
+        Se usar blob store remoto, baixa e descompacta em temp.
         Retorna: (persist_dir, temp_dir_opcional)
         """
-        if self.sqlite_storage:
-            print(f"📥 Baixando índice {index_id} do PythonAnywhere...")
+        if self.blob_store:
+            print(f"📥 Baixando índice {index_id} do blob store...")
             
             try:
-                try:
-                    zip_content = await self.sqlite_storage.download_file(f"zip/{index_id}.zip")
-                    print(f"✅ Índice baixado: {len(zip_content)} bytes")
-                except FileNotFoundError:
-                    zip_content = await self.sqlite_storage.download_file(f"{index_id}.zip")
-                    print(f"✅ Índice baixado: {len(zip_content)} bytes")
+                if len(index_id) == _DIGEST_LENGTH:
+                    zip_content = await self.blob_store.get_by_digest(index_id)
+                else:
+                    # Índices antigos, salvos por nome antes do blob store
+                    zip_content = await self.blob_store.get(f"zip/{index_id}.zip")
+                print(f"✅ Índice baixado: {len(zip_content)} bytes")
                 
-                temp_dir = Path(tempfile.mkdtemp(prefix=f"index_{index_id}_"))
-                zip_path = temp_dir / f"{index_id}.zip"
+                temp_dir = Path(tempfile.mkdtemp(prefix=f"index_{index_id[:16]}_"))
+                zip_path = temp_dir / "index.zip"
                 zip_path.write_bytes(zip_content)
                 
                 persist_dir = temp_dir / index_id
@@ -166,7 +456,7 @@ class LlamaIndexer(IndexerProtocol):
                 return persist_dir, temp_dir
                 
             except FileNotFoundError:
-                print(f"⚠️  Índice não encontrado no PythonAnywhere, tentando busca local...")
+                print(f"⚠️  Índice não encontrado no blob store, tentando busca local...")
                 persist_dir = self.vector_store_dir / index_id
                 
                 if persist_dir.exists():
@@ -174,7 +464,7 @@ class LlamaIndexer(IndexerProtocol):
                     return persist_dir, None
                 else:
                     available_indexes = [d.name for d in self.vector_store_dir.iterdir() if d.is_dir()] if self.vector_store_dir.exists() else []
-                    error_msg = f"Índice {index_id} não encontrado no PythonAnywhere nem localmente."
+                    error_msg = f"Índice {index_id} não encontrado no storage remoto nem localmente."
                     if available_indexes:
                         error_msg += f" Índices locais disponíveis: {', '.join(available_indexes)}"
                     else:
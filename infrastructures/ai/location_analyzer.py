@@ -1,10 +1,12 @@
 """Implementação do analisador de localização geográfica."""
+import asyncio
 from dataclasses import dataclass
-from typing import final
+from typing import Optional, final
 
 from llama_index.core.llms import LLM
 
 from application.interfaces.ai.location_analyzer import LocationAnalyzerProtocol
+from application.interfaces.ai.prompt_budget import PromptBudgetProtocol
 from application.dtos.candidate.location import LocationAnalysis
 
 
@@ -14,6 +16,11 @@ class LocationAnalyzer(LocationAnalyzerProtocol):
     """Analisador de localização que analisa o currículo do candidato para extrair informações de localização."""
     
     llm: LLM
+    # Mantém os prompts dentro do teto de tokens; None = sem controle
+    prompt_budget: Optional[PromptBudgetProtocol] = None
+    # Segundos de espera por cada resposta do LLM; None = sem limite.
+    # Timeout cai no tratamento de erro abaixo; cancelamento da requisição é propagado
+    timeout: Optional[float] = None
     
     async def analyze_location(
         self,
@@ -26,11 +33,12 @@ class LocationAnalyzer(LocationAnalyzerProtocol):
         """
         llm_model = self.llm
         
-        job_prompt = f"""
+        def render_job(vaga: str, _: str) -> str:
+            return f"""
 ANÁLISE CRÍTICA DA VAGA - Determine se é REMOTA ou PRESENCIAL.
 
 TEXTO COMPLETO DA VAGA:
-{job_description}
+{vaga}
 
 IMPORTANTE: Analise TODO o texto fornecido, incluindo qualquer menção de localização, cidade, estado ou endereço que possa aparecer no final ou em qualquer parte do texto.
 
@@ -49,8 +57,10 @@ TIPO_VAGA: [REMOTA ou PRESENCIAL]
 LOCALIZAÇÃO_VAGA: [cidade/estado exato ou "Não especificado"]
 """
 
+        job_prompt = self._fit(render_job, job_description, [])
+
         try:
-            job_response = llm_model.complete(job_prompt)
+            job_response = await asyncio.wait_for(llm_model.acomplete(job_prompt), timeout=self.timeout)
             job_response_text = str(job_response)
             
             print(f"[DEBUG LOCATION] Job prompt: {job_prompt[:200]}...")
@@ -105,11 +115,12 @@ LOCALIZAÇÃO_VAGA: [cidade/estado exato ou "Não especificado"]
                     match_status="REMOTE"
                 )
             
-            candidate_prompt = f"""
+            def render_candidate(_: str, curriculo: str) -> str:
+                return f"""
 Analise este currículo COMPLETAMENTE e extraia informações sobre a localização geográfica do candidato.
 
 CURRÍCULO:
-{resume_text}
+{curriculo}
 
 INSTRUÇÕES DETALHADAS:
 1. PROCURE CUIDADOSAMENTE por QUALQUER menção de localização no currículo
@@ -124,7 +135,11 @@ LOCALIZAÇÃO: [cidade/estado exato encontrado, ou "Não informado"]
 DISPOSIÇÃO_MUDANÇA: [SIM ou NAO]
 """
 
-            candidate_response = llm_model.complete(candidate_prompt)
+            candidate_prompt = self._fit(render_candidate, "", [resume_text])
+
+            candidate_response = await asyncio.wait_for(
+                llm_model.acomplete(candidate_prompt), timeout=self.timeout
+            )
             candidate_response_text = str(candidate_response)
             
             print(f"[DEBUG LOCATION] Candidate prompt: {candidate_prompt[:200]}...")
@@ -194,3 +209,11 @@ DISPOSIÇÃO_MUDANÇA: [SIM ou NAO]
                 willing_to_relocate=True,
                 match_status="REMOTE"
             )
+
+    def _fit(self, render, job_description: str, evidence: list[str]) -> str:
+        """Prompt dentro do teto de tokens (se configurado)"""
+        if self.prompt_budget is None:
+            return render(job_description, "\n\n".join(evidence))
+        budgeted = self.prompt_budget.fit(render, job_description, evidence)
+        print(f"[DEBUG LOCATION] Prompt: {budgeted.summary()}")
+        return budgeted.prompt
@@ -1,29 +1,45 @@
+import asyncio
 from dataclasses import dataclass
-from typing import final
+from typing import Optional, final
 from uuid import uuid4
 
 from llama_index.core.llms import LLM
 
+from application.exceptions import LLMTimeoutError
 from application.interfaces.ai.analyzer import AIAnalyzerProtocol
+from application.interfaces.ai.prompt_budget import PromptBudgetProtocol
 from application.dtos.candidate.candidate import CandidateAnalysisDTO
+from application.dtos.candidate.profile import ResumeProfileDTO
 
 @final
 @dataclass(frozen=True, slots=True, kw_only=True)
 class OllamaAnalyzer(AIAnalyzerProtocol):
     """Analisa currículos com qualquer LLM (Groq, Ollama, etc.). Nome mantido por compatibilidade."""
     llm: LLM
+    # Com perfil do currículo, o prompt leva o perfil + estes primeiros chunks (os mais relevantes)
+    profile_excerpt_chunks: int = 3
+    # Mantém o prompt dentro do teto de tokens; None = sem controle
+    prompt_budget: Optional[PromptBudgetProtocol] = None
+    # Segundos de espera pela resposta do LLM; None = sem limite
+    timeout: Optional[float] = None
     
     async def analyze_candidate(
         self, 
         chunks: list[str], 
-        job_description: str
+        job_description: str,
+        profile: Optional[ResumeProfileDTO] = None
     ) -> CandidateAnalysisDTO:
         from llama_index.core import Settings as LlamaSettings
         print(f"DEBUG: Using LLM: {type(self.llm)} - {self.llm}")
         print(f"DEBUG: LlamaSettings.llm: {type(LlamaSettings.llm)} - {LlamaSettings.llm}")
         print(f"DEBUG: Are they the same object? {self.llm is LlamaSettings.llm}")
         
-        texto_completo = "\n\n".join(chunks)
+        # Evidências na ordem de relevância dos chunks
+        if profile is not None:
+            evidence = profile.as_evidence(chunks, self.profile_excerpt_chunks)
+        else:
+            evidence = list(chunks)
+        texto_completo = "\n\n".join(evidence)
         print(f"DEBUG: Full resume text length: {len(texto_completo)}")
         print(f"DEBUG: Resume text sample: {texto_completo[:1000]}...")
         print(f"DEBUG: Job description: {job_description}")
@@ -41,7 +57,8 @@ class OllamaAnalyzer(AIAnalyzerProtocol):
                 improvement_tips=[]
             )
         
-        prompt = f"""Você é um recrutador especialista em triagem técnica (ATS). Sua tarefa é comparar um currículo estritamente com a descrição de vaga fornecida.
+        def render(vaga: str, curriculo: str) -> str:
+            return f"""Você é um recrutador especialista em triagem técnica (ATS). Sua tarefa é comparar um currículo estritamente com a descrição de vaga fornecida.
 
 REGRAS OBRIGATÓRIAS:
 1. ANÁLISE ESTRITA: Você só pode avaliar o candidato com base nos requisitos EXPLICITAMENTE escritos na descrição da vaga. Não assuma, não infira e não imagine requisitos que não estejam no texto.
@@ -49,10 +66,10 @@ REGRAS OBRIGATÓRIAS:
 3. JUSTIFICATIVA: Baseie sua justificativa apenas no "match" entre as palavras-chave do currículo e as da vaga.
 
 DESCRIÇÃO DA VAGA:
-{job_description}
+{vaga}
 
 CURRÍCULO PARA ANALISAR:
-{texto_completo}
+{curriculo}
 
 RESPOSTA ESTRUTURADA (JSON):
 {{
@@ -66,8 +83,18 @@ RESPOSTA ESTRUTURADA (JSON):
 
 As "dicas_de_melhoria" devem ser sugestões objetivas e acionáveis para o candidato melhorar o currículo ou aumentar as chances para esta vaga (ex: incluir palavra-chave X, destacar experiência em Y, fazer curso Z). Entre 2 e 5 dicas."""
         
+        if self.prompt_budget is not None:
+            budgeted = self.prompt_budget.fit(render, job_description, evidence)
+            prompt = budgeted.prompt
+            print(f"DEBUG: Prompt: {budgeted.summary()}")
+        else:
+            prompt = render(job_description, texto_completo)
         print(f"DEBUG: Generated prompt length: {len(prompt)}")
-        response = self.llm.complete(prompt)
+        # Chamada assíncrona: não bloqueia o event loop e é cancelada junto com a requisição
+        try:
+            response = await asyncio.wait_for(self.llm.acomplete(prompt), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            raise LLMTimeoutError(f"O LLM não respondeu em {self.timeout:g}s ao analisar o currículo")
         response_text = str(response)
         print(f"DEBUG: LLM response: {response_text}")
         
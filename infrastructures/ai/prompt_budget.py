@@ -0,0 +1,138 @@
+"""
+Orçamento de tokens dos prompts enviados ao LLM.
+
+O prompt é dividido em três partes: regras (texto fixo do template), descrição da
+vaga e evidências do currículo. As regras nunca são cortadas; a vaga fica com até
+job_max_share do espaço restante (ou mais, se o currículo não precisar) e o
+currículo com o resto, preenchido na ordem de relevância dos trechos. O primeiro
+trecho sempre entra (cortado se preciso); o trecho que não couber inteiro é
+cortado e os seguintes ficam de fora.
+
+A contagem usa o tokenizer do LlamaIndex (tiktoken) ou, se configurado e com
+transformers instalado, o tokenizer do próprio modelo no HuggingFace.
+"""
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Optional, Sequence, final
+
+from llama_index.core import Settings as LlamaSettings
+
+from application.dtos.prompt import BudgetedPromptDTO
+from application.interfaces.ai.prompt_budget import PromptBudgetProtocol
+
+try:
+    from transformers import AutoTokenizer
+except ImportError:
+    AutoTokenizer = None
+
+EVIDENCE_SEPARATOR = "\n\n"
+
+# Trecho cortado com menos tokens que isso não entra (exceto o primeiro)
+_MIN_PARTIAL_TOKENS = 32
+
+
+def load_tokenizer(model_name: str = "") -> Callable[[str], Sequence]:
+    """Tokenizer do modelo (HuggingFace) se informado e disponível; senão o padrão do LlamaIndex"""
+    if model_name:
+        if AutoTokenizer is not None:
+            return partial(AutoTokenizer.from_pretrained(model_name).encode, add_special_tokens=False)
+        print(f"⚠️  transformers não instalado; contando tokens de '{model_name}' com o tokenizer padrão")
+    return LlamaSettings.tokenizer
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class TokenBudgeter(PromptBudgetProtocol):
+    tokenizer: Callable[[str], Sequence]
+    max_prompt_tokens: int = 6000
+    job_max_share: float = 0.35
+
+    def count_tokens(self, text: str) -> int:
+        return len(self.tokenizer(text)) if text else 0
+
+    def fit(
+        self,
+        render: Callable[[str, str], str],
+        job_description: str,
+        evidence: list[str],
+        max_tokens: Optional[int] = None,
+    ) -> BudgetedPromptDTO:
+        ceiling = max_tokens or self.max_prompt_tokens
+        rubric_tokens = self.count_tokens(render("", ""))
+        available = max(ceiling - rubric_tokens, 0)
+
+        evidence = [item for item in evidence if item and item.strip()]
+        evidence_counts = [self.count_tokens(item) for item in evidence]
+        separator_tokens = self.count_tokens(EVIDENCE_SEPARATOR)
+        evidence_needed = sum(evidence_counts) + separator_tokens * max(len(evidence) - 1, 0)
+
+        job_full = self.count_tokens(job_description)
+        job_budget = min(job_full, max(int(available * self.job_max_share), available - evidence_needed))
+        job = self._truncate(job_description, job_budget, job_full)
+        job_tokens = self.count_tokens(job)
+
+        parts = self._fill(evidence, evidence_counts, available - job_tokens, separator_tokens)
+        evidence_text = EVIDENCE_SEPARATOR.join(parts)
+        prompt = render(job, evidence_text)
+        total = self.count_tokens(prompt)
+
+        # As junções entre as partes podem somar alguns tokens: tira o excedente do currículo
+        while total > ceiling and evidence_text:
+            evidence_tokens = self.count_tokens(evidence_text)
+            evidence_text = self._truncate(evidence_text, evidence_tokens - (total - ceiling), evidence_tokens)
+            prompt = render(job, evidence_text)
+            total = self.count_tokens(prompt)
+
+        evidence_used = len(parts) if evidence_text else 0
+        return BudgetedPromptDTO(
+            prompt=prompt,
+            total_tokens=total,
+            rubric_tokens=rubric_tokens,
+            job_tokens=job_tokens,
+            evidence_tokens=self.count_tokens(evidence_text),
+            evidence_used=evidence_used,
+            evidence_total=len(evidence),
+            truncated=(
+                job_tokens < job_full
+                or evidence_used < len(evidence)
+                or evidence_text != EVIDENCE_SEPARATOR.join(evidence[:evidence_used])
+            ),
+        )
+
+    def _fill(self, evidence: list[str], counts: list[int], budget: int, separator_tokens: int) -> list[str]:
+        """Trechos na ordem recebida enquanto couberem; o que não couber inteiro é cortado e encerra"""
+        parts: list[str] = []
+        remaining = budget
+        for item, tokens in zip(evidence, counts):
+            cost = tokens + (separator_tokens if parts else 0)
+            if cost <= remaining:
+                parts.append(item)
+                remaining -= cost
+                continue
+            room = remaining - (separator_tokens if parts else 0)
+            if room >= _MIN_PARTIAL_TOKENS or not parts:
+                cut = self._truncate(item, room, tokens)
+                if cut:
+                    parts.append(cut)
+            break
+        return parts
+
+    def _truncate(self, text: str, max_tokens: int, tokens: Optional[int] = None) -> str:
+        """Maior prefixo de text com até max_tokens tokens, cortado em fim de palavra"""
+        if max_tokens <= 0:
+            return ""
+        if (tokens if tokens is not None else self.count_tokens(text)) <= max_tokens:
+            return text
+        # Busca binária no número de caracteres (funciona com qualquer tokenizer, sem decode)
+        low, high = 0, len(text)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self.count_tokens(text[:middle]) <= max_tokens:
+                low = middle
+            else:
+                high = middle - 1
+        prefix = text[:low]
+        boundary = prefix.rfind(" ")
+        if boundary > low // 2:
+            prefix = prefix[:boundary]
+        return prefix.rstrip()
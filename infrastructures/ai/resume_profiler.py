@@ -0,0 +1,196 @@
+"""
+Perfil compacto de cada currículo (habilidades, senioridade, formação, localização,
+anos de experiência), extraído por regras na indexação e salvo junto do índice.
+
+Parte dos padrões do DocumentTransformer, com equivalentes em português e
+habilidades casadas por palavra inteira ("java" não casa com "javascript").
+Determinístico: o mesmo currículo sempre gera o mesmo perfil.
+"""
+import json
+import re
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from application.dtos.candidate.profile import ResumeProfileDTO
+from infrastructures.ai.transformer import EDUCATION_PATTERNS, EXPERIENCE_PATTERN, SKILL_KEYWORDS
+
+PROFILES_FILENAME = "resume_profiles.json"
+
+PROFILE_SKILLS = [
+    *SKILL_KEYWORDS,
+    "typescript", "c#", ".net", "php", "ruby", "golang", "kotlin", "swift", "html", "css",
+    "angular", "vue", "django", "flask", "fastapi", "spring", "express", "next.js",
+    "postgresql", "mysql", "mongodb", "redis", "oracle", "linux", "terraform", "gcp",
+    "ci/cd", "scrum", "kanban", "power bi", "excel", "tableau", "pandas", "spark",
+    "machine learning", "deep learning", "figma", "sap", "salesforce",
+]
+
+_SKILL_PATTERNS = [
+    (skill, re.compile(rf"(?<![\w#+.]){re.escape(skill)}(?![\w#+])", re.IGNORECASE))
+    for skill in PROFILE_SKILLS
+]
+
+_EDUCATION_PATTERNS = [
+    *EDUCATION_PATTERNS,
+    r"(?i)\b(doutorado|mestrado|mba|p[óo]s-gradua[çc][ãa]o|especializa[çc][ãa]o|bacharelado|bacharel"
+    r"|licenciatura|tecn[óo]logo|gradua[çc][ãa]o|curso t[ée]cnico|ensino m[ée]dio)\b[^\n.;|•]{0,80}",
+]
+_MAX_EDUCATION = 3
+_MAX_EDUCATION_LENGTH = 100
+
+_EXPERIENCE_PATTERNS = [
+    EXPERIENCE_PATTERN,
+    r"(\d+)\+?\s*anos?\s+(?:de\s+)?experi[êe]ncia",
+    r"experi[êe]ncia\s+de\s+(?:mais\s+de\s+)?(\d+)\+?\s*anos?",
+]
+
+_SENIORITY_LEVELS = [
+    ("especialista", r"especialista|tech\s*lead|l[íi]der\s+t[ée]cnico|arquitet[oa]"),
+    ("sênior", r"s[êe]nior|sr\."),
+    ("pleno", r"pleno|mid[-\s]level"),
+    ("júnior", r"j[úu]nior|jr\."),
+    ("estágio", r"est[áa]gi[áa]ri[oa]|est[áa]gio|intern|internship|trainee"),
+]
+_SENIORITY_PATTERNS = [
+    (level, re.compile(rf"(?<!\w)(?:{pattern})(?!\w)", re.IGNORECASE)) for level, pattern in _SENIORITY_LEVELS
+]
+# Cargo de outra pessoa ("reportava ao Tech Lead", "junto com o arquiteto"): não conta
+_OTHER_PERSON_CONTEXT = re.compile(
+    r"\b(?:ao|à|aos|às|o|a|os|as|com|para|pelo|pela|pelos|pelas|to|with|under)\s+$", re.IGNORECASE
+)
+_HEADLINE_LINES = 4
+_EXPERIENCE_HEADING = re.compile(
+    r"^[ \t]*(?:experi[êe]ncias?(?:[ \t]+profissional|[ \t]+profissionais)?|hist[óo]rico[ \t]+profissional"
+    r"|(?:professional[ \t]+|work[ \t]+)?experience)[ \t]*:?[ \t]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+_UFS = "AC|AL|AP|AM|BA|CE|DF|ES|GO|MA|MT|MS|MG|PA|PB|PR|PE|PI|RJ|RN|RS|RO|RR|SC|SP|SE|TO"
+# Cidade na mesma linha da UF ("Recife - PE", "São Paulo/SP", "Belo Horizonte, MG")
+_CITY = r"[A-ZÀ-Ý][a-zà-ÿ]+(?:[ \t]+(?:d[aeo]s?[ \t]+)?[A-ZÀ-Ý][a-zà-ÿ]+){0,3}"
+_LOCATION_PATTERN = re.compile(rf"\b({_CITY})[ \t]*[-–/,][ \t]*({_UFS})\b")
+
+
+def _skills(text: str) -> list[str]:
+    return [skill for skill, pattern in _SKILL_PATTERNS if pattern.search(text)]
+
+
+def _education(text: str) -> list[str]:
+    found: list[str] = []
+    for pattern in _EDUCATION_PATTERNS:
+        for match in re.finditer(pattern, text):
+            entry = " ".join(match.group(0).split())[:_MAX_EDUCATION_LENGTH].rstrip(" ,-")
+            if entry and entry.casefold() not in {e.casefold() for e in found}:
+                found.append(entry)
+            if len(found) >= _MAX_EDUCATION:
+                return found
+    return found
+
+
+def _experience_years(text: str) -> Optional[int]:
+    years = [
+        int(match.group(1))
+        for pattern in _EXPERIENCE_PATTERNS
+        for match in re.finditer(pattern, text, re.IGNORECASE)
+    ]
+    # Descarta números que não são anos de experiência plausíveis ("2019 anos")
+    years = [y for y in years if 0 < y <= 50]
+    return max(years) if years else None
+
+
+def _seniority_mentions(text: str) -> list[str]:
+    """Níveis citados como cargo do próprio candidato, na ordem em que aparecem"""
+    mentions = [
+        (match.start(), level)
+        for level, pattern in _SENIORITY_PATTERNS
+        for match in pattern.finditer(text)
+        if not _OTHER_PERSON_CONTEXT.search(text[max(0, match.start() - 20):match.start()])
+    ]
+    return [level for _, level in sorted(mentions)]
+
+
+def _seniority(text: str) -> Optional[str]:
+    """
+    Nível do título do currículo (primeiras linhas) ou, sem ele, do cargo mais recente
+    (primeiro citado na seção de experiência). Sem essas seções, só quando todas as
+    menções concordam; com sinais conflitantes fica de fora.
+    """
+    lines = [line for line in text.splitlines() if line.strip()]
+    headline = _seniority_mentions("\n".join(lines[:_HEADLINE_LINES]))
+    if headline:
+        return headline[0]
+    heading = _EXPERIENCE_HEADING.search(text)
+    if heading:
+        recent = _seniority_mentions(text[heading.end():])
+        return recent[0] if recent else None
+    levels = set(_seniority_mentions(text))
+    return levels.pop() if len(levels) == 1 else None
+
+
+def _location(text: str) -> Optional[str]:
+    match = _LOCATION_PATTERN.search(text)
+    return f"{match.group(1)} - {match.group(2)}" if match else None
+
+
+def extract_profile(file_name: str, text: str, candidate_name: Optional[str] = None) -> ResumeProfileDTO:
+    return ResumeProfileDTO(
+        file_name=file_name,
+        candidate_name=candidate_name or Path(file_name).stem.replace("_", " ").replace("-", " ").title(),
+        skills=_skills(text),
+        seniority=_seniority(text),
+        education=_education(text),
+        location=_location(text),
+        experience_years=_experience_years(text),
+    )
+
+
+@dataclass(slots=True, kw_only=True)
+class ResumeProfiles:
+    # file_name -> perfil
+    profiles: dict[str, ResumeProfileDTO] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, documents: Iterable[tuple[str, str, dict]]) -> "ResumeProfiles":
+        """
+        documents: (file_name, texto, metadata), na ordem do arquivo.
+        Páginas/chunks do mesmo arquivo são juntados antes da extração.
+        """
+        texts: dict[str, list[str]] = {}
+        names: dict[str, Optional[str]] = {}
+        for file_name, text, metadata in documents:
+            texts.setdefault(file_name, []).append(text)
+            names.setdefault(file_name, (metadata or {}).get("candidate_name"))
+        return cls(profiles={
+            file_name: extract_profile(file_name, "\n".join(parts), names[file_name])
+            for file_name, parts in texts.items()
+        })
+
+    @classmethod
+    def from_docstore(cls, docstore: Any) -> "ResumeProfiles":
+        """Para índices criados antes deste arquivo existir (perfil a partir dos chunks)"""
+        return cls.build(
+            (node.metadata.get("file_name", "Desconhecido"), node.get_content(), node.metadata)
+            for node in docstore.docs.values()
+        )
+
+    def get(self, file_name: str) -> Optional[ResumeProfileDTO]:
+        return self.profiles.get(file_name)
+
+    def save(self, persist_dir: Path) -> None:
+        (persist_dir / PROFILES_FILENAME).write_text(
+            json.dumps(
+                {file_name: asdict(profile) for file_name, profile in self.profiles.items()},
+                separators=(",", ":"),
+                ensure_ascii=False,
+            ),
+            encoding="utf-8",
+        )
+
+    @classmethod
+    def load(cls, persist_dir: Path) -> "ResumeProfiles | None":
+        path = persist_dir / PROFILES_FILENAME
+        if not path.exists():
+            return None
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return cls(profiles={file_name: ResumeProfileDTO(**profile) for file_name, profile in data.items()})
@@ -1,8 +1,9 @@
 from dataclasses import dataclass
-from typing import final
+from typing import Optional, final
 
 from llama_index.core.llms import LLM
 
+from application.interfaces.ai.prompt_budget import PromptBudgetProtocol
 from application.interfaces.ai.validator import ResumeValidatorProtocol
 
 @final
@@ -10,13 +11,17 @@ from application.interfaces.ai.validator import ResumeValidatorProtocol
 class ResumeValidator(ResumeValidatorProtocol):
     """Valida se um documento é um currículo usando LLM"""
     llm: LLM
+    # Início do texto mandado ao LLM, em tokens (basta para reconhecer um currículo)
+    prompt_budget: Optional[PromptBudgetProtocol] = None
+    max_prompt_tokens: int = 800
 
     async def is_resume(self, text: str) -> bool:
         """Verifica se o texto representa um currículo válido"""
         if not text or len(text.strip()) < 100:
             return False
 
-        prompt = f"""Analise o texto fornecido e determine se ele representa um currículo profissional (CV/resume) válido.
+        def render(_: str, texto: str) -> str:
+            return f"""Analise o texto fornecido e determine se ele representa um currículo profissional (CV/resume) válido.
 
 Um currículo típico contém:
 - Informações pessoais (nome, contato)
@@ -28,10 +33,15 @@ Um currículo típico contém:
 Responda apenas com "SIM" se for um currículo válido, ou "NÃO" se não for.
 
 Texto a analisar:
-{text[:2000]}...  # Limita para não exceder token limits
+{texto}
 
 Resposta:"""
 
+        if self.prompt_budget is not None:
+            prompt = self.prompt_budget.fit(render, "", [text], max_tokens=self.max_prompt_tokens).prompt
+        else:
+            prompt = render("", text[:2000])
+
         try:
             response = await self.llm.acomplete(prompt)
             answer = response.text.strip().upper()
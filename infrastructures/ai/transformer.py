@@ -7,6 +7,19 @@ from llama_index.core import Document
 
 from application.interfaces.ai.transformer import TransformerProtocol
 
+# Patterns shared with the resume profiles built at index time (resume_profiler.py)
+SKILL_KEYWORDS = [
+    "python", "java", "javascript", "sql", "react", "node",
+    "docker", "kubernetes", "aws", "azure", "git", "agile"
+]
+
+EDUCATION_PATTERNS = [
+    r"(?i)(bachelor|master|phd|mba|degree)\s+(?:of|in|degree)?\s+([A-Za-z\s]+)",
+    r"(?i)(university|college)\s+of\s+([A-Za-z\s]+)"
+]
+
+EXPERIENCE_PATTERN = r"(\d+)\+?\s*years?\s+(?:of\s+)?experience"
+
 @final
 @dataclass(frozen=True, slots=True)
 class DocumentTransformer(TransformerProtocol):
@@ -37,25 +50,15 @@ class DocumentTransformer(TransformerProtocol):
     
     def _extract_skills(self, doc: Document):
         """Extract skills from resume text"""
-        skills_keywords = [
-            "python", "java", "javascript", "sql", "react", "node",
-            "docker", "kubernetes", "aws", "azure", "git", "agile"
-        ]
-        
         text_lower = doc.text.lower()
-        found_skills = [skill for skill in skills_keywords if skill in text_lower]
+        found_skills = [skill for skill in SKILL_KEYWORDS if skill in text_lower]
         
         if found_skills:
             doc.metadata["skills"] = ", ".join(found_skills)
     
     def _extract_education(self, doc: Document):
         """Extract education information"""
-        education_patterns = [
-            r"(?i)(bachelor|master|phd|mba|degree)\s+(?:of|in|degree)?\s+([A-Za-z\s]+)",
-            r"(?i)(university|college)\s+of\s+([A-Za-z\s]+)"
-        ]
-        
-        for pattern in education_patterns:
+        for pattern in EDUCATION_PATTERNS:
             match = re.search(pattern, doc.text)
             if match:
                 doc.metadata["education"] = match.group(0).strip()
@@ -63,8 +66,7 @@ class DocumentTransformer(TransformerProtocol):
     
     def _extract_experience(self, doc: Document):
         """Extract years of experience"""
-        exp_pattern = r"(\d+)\+?\s*years?\s+(?:of\s+)?experience"
-        match = re.search(exp_pattern, doc.text, re.IGNORECASE)
+        match = re.search(EXPERIENCE_PATTERN, doc.text, re.IGNORECASE)
         
         if match:
             doc.metadata["experience_years"] = int(match.group(1))
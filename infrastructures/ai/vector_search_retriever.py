@@ -0,0 +1,64 @@
+"""
+Retriever vetorial sobre as estruturas salvas junto do índice: o índice ANN
+(FAISS/hnswlib) ou os embeddings quantizados, no lugar do SimpleVectorStore.
+"""
+from typing import Any, List, Optional, Protocol, Sequence
+
+from llama_index.core.embeddings import BaseEmbedding
+from llama_index.core.retrievers import BaseRetriever
+from llama_index.core.schema import NodeWithScore, QueryBundle
+
+
+
+class VectorSearcher(Protocol):
+    """AnnIndex ou QuantizedVectors"""
+
+    def search(
+        self, vector: Sequence[float], top_k: int, allowed_ids: Optional[set[str]] = None
+    ) -> list[tuple[str, float]]:
+        ...
+
+
+class VectorSearchRetriever(BaseRetriever):
+    """Mesmo contrato do retriever vetorial do índice (score = similaridade de cosseno)"""
+
+    def __init__(
+        self,
+        searcher: VectorSearcher,
+        embed_model: BaseEmbedding,
+        docstore: Any,
+        top_k: int,
+        allowed_ids: set[str] | None = None,
+    ):
+        """
+        Args:
+            searcher: Índice ANN ou embeddings quantizados dos chunks
+            docstore: index.docstore, para montar os nós encontrados
+            allowed_ids: Chunks que passaram nos filtros de metadados; None = todos
+        """
+        super().__init__()
+        self._searcher = searcher
+        self._embed_model = embed_model
+        self._docstore = docstore
+        self._top_k = top_k
+        self._allowed_ids = allowed_ids
+
+    def _retrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        if query_bundle.embedding is None:
+            query_bundle.embedding = self._embed_model.get_agg_embedding_from_queries(query_bundle.embedding_strs)
+        return self._search(query_bundle.embedding)
+
+    async def _aretrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        if query_bundle.embedding is None:
+            query_bundle.embedding = await self._embed_model.aget_agg_embedding_from_queries(
+                query_bundle.embedding_strs
+            )
+        return self._search(query_bundle.embedding)
+
+    def _search(self, embedding: List[float]) -> List[NodeWithScore]:
+        results: List[NodeWithScore] = []
+        for node_id, score in self._searcher.search(embedding, self._top_k, self._allowed_ids):
+            node = self._docstore.get_node(node_id, raise_error=False)
+            if node is not None:
+                results.append(NodeWithScore(node=node, score=score))
+        return results
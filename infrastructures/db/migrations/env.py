@@ -27,6 +27,7 @@ from infrastructures.db.models.chat import ChatSessionModel, ChatMessageModel
 from infrastructures.db.models.resumes.resume import ResumeModel
 from infrastructures.db.models.jobs.job import JobModel
 from infrastructures.db.models.candidates.job_application import JobApplicationModel
+from infrastructures.db.models.storage import BlobRefModel
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
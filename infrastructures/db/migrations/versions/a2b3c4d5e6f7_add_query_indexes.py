@@ -0,0 +1,38 @@
+"""Add indexes for the hot query patterns (per-user listings, index lookups, chat history)
+
+Revision ID: a2b3c4d5e6f7
+Revises: f1a2b3c4d5e6
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "a2b3c4d5e6f7"
+down_revision: Union[str, Sequence[str], None] = "f1a2b3c4d5e6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (nome, tabela, colunas) — a coluna de filtro vem primeiro e a de ordenação (keyset) depois
+INDEXES = [
+    ("ix_resumes_uploaded_by_user_id_created_at", "resumes", ["uploaded_by_user_id", "created_at", "resume_id"]),
+    ("ix_resumes_vector_index_id", "resumes", ["vector_index_id"]),
+    ("ix_chat_sessions_user_id_created_at", "chat_sessions", ["user_id", "created_at"]),
+    ("ix_chat_messages_session_id_timestamp", "chat_messages", ["session_id", "timestamp"]),
+    ("ix_jobs_created_by_user_id_created_at", "jobs", ["created_by_user_id", "created_at"]),
+    ("ix_jobs_status_created_at", "jobs", ["status", "created_at"]),
+    ("ix_job_applications_user_id_created_at", "job_applications", ["user_id", "created_at"]),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
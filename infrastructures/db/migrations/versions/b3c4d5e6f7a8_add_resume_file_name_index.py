@@ -0,0 +1,30 @@
+"""Add functional index on resumes (uploaded_by_user_id, lower(file_name)) for the duplicate-name check
+
+Revision ID: b3c4d5e6f7a8
+Revises: a2b3c4d5e6f7
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "b3c4d5e6f7a8"
+down_revision: Union[str, Sequence[str], None] = "a2b3c4d5e6f7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_resumes_uploaded_by_user_id_lower_file_name",
+        "resumes",
+        ["uploaded_by_user_id", sa.text("lower(file_name)")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_resumes_uploaded_by_user_id_lower_file_name", table_name="resumes")
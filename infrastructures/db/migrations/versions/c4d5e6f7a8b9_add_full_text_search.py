@@ -0,0 +1,74 @@
+"""Add full-text search index for jobs and resumes
+
+Revision ID: c4d5e6f7a8b9
+Revises: b3c4d5e6f7a8
+Create Date: 2026-10-19
+
+SQLite: FTS5 virtual table (terms are stemmed by the application).
+PostgreSQL: table with a generated tsvector ('portuguese') and a GIN index.
+Other databases: plain table searched with LIKE.
+
+Existing jobs are copied here on PostgreSQL/MySQL; resumes (whose text lives in the
+stored files) and SQLite need: python -m presentation.cli.search_reindex
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "c4d5e6f7a8b9"
+down_revision: Union[str, Sequence[str], None] = "b3c4d5e6f7a8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    if dialect == "sqlite":
+        op.execute(
+            "CREATE VIRTUAL TABLE search_documents_fts USING fts5("
+            "kind UNINDEXED, doc_id UNINDEXED, owner_id UNINDEXED, title UNINDEXED, body UNINDEXED, "
+            "title_terms, body_terms, tokenize = 'unicode61 remove_diacritics 2')"
+        )
+        return
+
+    op.create_table(
+        "search_documents",
+        sa.Column("kind", sa.String(length=16), nullable=False),
+        sa.Column("doc_id", sa.String(length=36), nullable=False),
+        sa.Column("owner_id", sa.String(length=36), nullable=False),
+        sa.Column("title", sa.Text(), nullable=False),
+        sa.Column("body", sa.Text(), nullable=False),
+        sa.PrimaryKeyConstraint("kind", "doc_id"),
+    )
+    op.create_index("ix_search_documents_kind_owner_id", "search_documents", ["kind", "owner_id"], unique=False)
+
+    if dialect == "postgresql":
+        op.execute(
+            "ALTER TABLE search_documents ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+            "setweight(to_tsvector('portuguese', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('portuguese', coalesce(body, '')), 'B')) STORED"
+        )
+        op.create_index(
+            "ix_search_documents_search_vector",
+            "search_documents",
+            ["search_vector"],
+            unique=False,
+            postgresql_using="gin",
+        )
+
+    # Mesmo corpo montado pelos casos de uso de vagas (descrição, requisitos, local)
+    op.execute(
+        "INSERT INTO search_documents (kind, doc_id, owner_id, title, body) "
+        "SELECT 'job', job_id, created_by_user_id, title, "
+        "concat_ws('\n', description, requirements, location) FROM jobs"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        op.execute("DROP TABLE search_documents_fts")
+        return
+    op.drop_table("search_documents")
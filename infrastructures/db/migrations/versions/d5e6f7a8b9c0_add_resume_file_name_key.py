@@ -0,0 +1,59 @@
+"""Add resumes.file_name_key (casefolded file name) for the duplicate-name check
+
+lower(file_name) only folds ASCII on SQLite, so "CURRÍCULO.pdf" and "currículo.pdf"
+were not detected as the same name. The key is computed in Python (str.casefold).
+
+Revision ID: d5e6f7a8b9c0
+Revises: c4d5e6f7a8b9
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "d5e6f7a8b9c0"
+down_revision: Union[str, Sequence[str], None] = "c4d5e6f7a8b9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("resumes", sa.Column("file_name_key", sa.String(length=255), nullable=True))
+
+    # Preenche as linhas existentes com a mesma regra do repositório
+    resumes = sa.table(
+        "resumes",
+        sa.column("resume_id", sa.String),
+        sa.column("file_name", sa.String),
+        sa.column("file_name_key", sa.String),
+    )
+    bind = op.get_bind()
+    rows = bind.execute(sa.select(resumes.c.resume_id, resumes.c.file_name)).all()
+    for resume_id, file_name in rows:
+        bind.execute(
+            resumes.update()
+            .where(resumes.c.resume_id == resume_id)
+            .values(file_name_key=(file_name or "").strip().casefold())
+        )
+
+    op.drop_index("ix_resumes_uploaded_by_user_id_lower_file_name", table_name="resumes")
+    op.create_index(
+        "ix_resumes_uploaded_by_user_id_file_name_key",
+        "resumes",
+        ["uploaded_by_user_id", "file_name_key"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_resumes_uploaded_by_user_id_file_name_key", table_name="resumes")
+    op.create_index(
+        "ix_resumes_uploaded_by_user_id_lower_file_name",
+        "resumes",
+        ["uploaded_by_user_id", sa.text("lower(file_name)")],
+        unique=False,
+    )
+    op.drop_column("resumes", "file_name_key")
@@ -0,0 +1,58 @@
+"""Ignore accents in the PostgreSQL full-text search
+
+Creates the text search configuration portuguese_unaccent (portuguese with the
+unaccent dictionary before the stemmer) and regenerates search_documents.search_vector
+with it, so "gestão" matches "gestao" in both directions. The configuration is
+used both in the generated column and in to_tsquery. SQLite (FTS5 with
+remove_diacritics) and the LIKE fallback are unchanged.
+
+Revision ID: e6f7a8b9c0d1
+Revises: d5e6f7a8b9c0
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "e6f7a8b9c0d1"
+down_revision: Union[str, Sequence[str], None] = "d5e6f7a8b9c0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _set_search_vector(config: str) -> None:
+    op.drop_index("ix_search_documents_search_vector", table_name="search_documents")
+    op.execute("ALTER TABLE search_documents DROP COLUMN search_vector")
+    op.execute(
+        "ALTER TABLE search_documents ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+        f"setweight(to_tsvector('{config}', coalesce(title, '')), 'A') || "
+        f"setweight(to_tsvector('{config}', coalesce(body, '')), 'B')) STORED"
+    )
+    op.create_index(
+        "ix_search_documents_search_vector",
+        "search_documents",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+    op.execute("CREATE TEXT SEARCH CONFIGURATION portuguese_unaccent (COPY = portuguese)")
+    op.execute(
+        "ALTER TEXT SEARCH CONFIGURATION portuguese_unaccent "
+        "ALTER MAPPING FOR hword, hword_part, word WITH unaccent, portuguese_stem"
+    )
+    _set_search_vector("portuguese_unaccent")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    _set_search_vector("portuguese")
+    op.execute("DROP TEXT SEARCH CONFIGURATION portuguese_unaccent")
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, Enum as SQLEnum, ForeignKey, Integer, String
+from sqlalchemy import DateTime, Enum as SQLEnum, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from domain.entities.candidates.job_application import JobApplicationStatus
@@ -13,6 +13,9 @@ class JobApplicationModel:
     """SQLAlchemy model for job_applications table."""
 
     __tablename__ = "job_applications"
+    __table_args__ = (
+        Index("ix_job_applications_user_id_created_at", "user_id", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.user_id"), nullable=False)
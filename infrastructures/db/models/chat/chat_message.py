@@ -1,6 +1,6 @@
 from datetime import UTC, datetime
 
-from sqlalchemy import DateTime, ForeignKey, String, Text, func
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, registry
 
 # Import the shared registry from users model
@@ -12,6 +12,9 @@ class ChatMessageModel:
     """SQLAlchemy model for chat_messages table."""
     
     __tablename__ = "chat_messages"
+    __table_args__ = (
+        Index("ix_chat_messages_session_id_timestamp", "session_id", "timestamp"),
+    )
     
     def __init__(
         self,
@@ -1,7 +1,7 @@
 from datetime import UTC, datetime
 from uuid import UUID
 
-from sqlalchemy import DateTime, ForeignKey, String, Text, func
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, registry
 
 # Import the shared registry from users model
@@ -13,6 +13,9 @@ class ChatSessionModel:
     """SQLAlchemy model for chat_sessions table."""
     
     __tablename__ = "chat_sessions"
+    __table_args__ = (
+        Index("ix_chat_sessions_user_id_created_at", "user_id", "created_at"),
+    )
     
     def __init__(
         self,
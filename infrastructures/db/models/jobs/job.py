@@ -1,6 +1,6 @@
 """SQLAlchemy model for Job entity."""
 from uuid import uuid4
-from sqlalchemy import String, DateTime, Text, Enum
+from sqlalchemy import String, DateTime, Text, Enum, Index
 from sqlalchemy.orm import Mapped, mapped_column, registry
 from sqlalchemy.sql import func
 import enum
@@ -29,6 +29,10 @@ class JobModel:
     """SQLAlchemy model for Job."""
 
     __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_created_by_user_id_created_at", "created_by_user_id", "created_at"),
+        Index("ix_jobs_status_created_at", "status", "created_at"),
+    )
 
     # Primary key
     job_id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
@@ -1,6 +1,6 @@
 """SQLAlchemy model for Resume entity."""
 from uuid import uuid4
-from sqlalchemy import String, DateTime, Boolean, Text, ForeignKey
+from sqlalchemy import String, DateTime, Boolean, Text, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, registry
 from sqlalchemy.sql import func
 
@@ -12,6 +12,11 @@ class ResumeModel:
     """SQLAlchemy model for Resume."""
 
     __tablename__ = "resumes"
+    __table_args__ = (
+        Index("ix_resumes_uploaded_by_user_id_created_at", "uploaded_by_user_id", "created_at", "resume_id"),
+        Index("ix_resumes_vector_index_id", "vector_index_id"),
+        Index("ix_resumes_uploaded_by_user_id_file_name_key", "uploaded_by_user_id", "file_name_key"),
+    )
 
     # Primary key
     resume_id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
@@ -23,6 +28,8 @@ class ResumeModel:
     candidate_name: Mapped[str] = mapped_column(String(255), nullable=False)
     file_name: Mapped[str] = mapped_column(String(255), nullable=False)
     file_path: Mapped[str] = mapped_column(Text, nullable=False)
+    # file_name.strip().casefold(): nomes iguais sem diferenciar maiúsculas (inclusive acentuadas)
+    file_name_key: Mapped[str] = mapped_column(String(255), nullable=True)
 
     # Vector index
     vector_index_id: Mapped[str] = mapped_column(String(255), nullable=True)
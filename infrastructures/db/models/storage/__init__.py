@@ -0,0 +1,3 @@
+from .blob_ref import BlobRefModel
+
+__all__ = ["BlobRefModel"]
@@ -0,0 +1,23 @@
+"""SQLAlchemy model for content-addressed blob reference counts."""
+from sqlalchemy import String, DateTime, Integer, BigInteger, Text
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from infrastructures.db.models.users.user import mapper_registry
+
+
+@mapper_registry.mapped
+class BlobRefModel:
+    """Um registro por conteúdo armazenado (SHA-256), com o número de referências."""
+
+    __tablename__ = "blob_refs"
+
+    digest: Mapped[str] = mapped_column(String(64), primary_key=True)
+    location: Mapped[str] = mapped_column(Text, nullable=False)
+    size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    stored_size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    compression: Mapped[str] = mapped_column(String(16), nullable=True)
+    ref_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
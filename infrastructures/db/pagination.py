@@ -0,0 +1,98 @@
+"""
+Paginação keyset: ordena por (timestamp, id) e continua a partir da última linha
+entregue, em vez de OFFSET. Cada página custa uma busca no índice, qualquer que
+seja a posição, e inserções concorrentes não repetem nem pulam linhas.
+
+Ordena e filtra sempre pela coluna crua, para usar os índices compostos
+(filtro, created_at, id). No SQLite o DateTime é texto e o server_default
+(CURRENT_TIMESTAMP) grava sem microssegundos, enquanto o SQLAlchemy grava com:
+a ordem é a do texto gravado, e o cursor leva esse texto para a comparação.
+"""
+from datetime import timezone
+from typing import Any, Callable, TypeVar
+
+from sqlalchemy import Select, String, and_, or_, type_coerce
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from application.dtos.pagination import PageCursor, PageDTO
+from application.exceptions import InvalidCursorError
+
+T = TypeVar("T")
+
+
+async def fetch_keyset_page(
+    session: AsyncSession,
+    stmt: Select,
+    *,
+    timestamp_column: Any,
+    id_column: Any,
+    limit: int | None,
+    cursor: str | None,
+    to_entity: Callable[[Any], T],
+    descending: bool = True,
+) -> PageDTO[T]:
+    """
+    Executa stmt (já filtrado) como uma página de no máximo `limit` linhas.
+
+    Busca limit + 1 linhas para saber se há próxima página sem um COUNT.
+    Com limit None devolve todas as linhas restantes, sem next_cursor.
+    """
+    sqlite = _is_sqlite(session)
+    if sqlite:
+        # Valor gravado (texto), para o cursor da próxima página
+        stmt = stmt.add_columns(type_coerce(timestamp_column, String).label("sort_key"))
+
+    if cursor:
+        after = PageCursor.decode(cursor)
+        try:
+            after_id = id_column.type.python_type(after.id)
+        except (TypeError, ValueError) as e:
+            raise InvalidCursorError(f"Cursor inválido: {cursor}") from e
+        after_time = type_coerce(_bind_timestamp(after), String) if sqlite else after.timestamp
+        if descending:
+            stmt = stmt.where(
+                or_(timestamp_column < after_time, and_(timestamp_column == after_time, id_column < after_id))
+            )
+        else:
+            stmt = stmt.where(
+                or_(timestamp_column > after_time, and_(timestamp_column == after_time, id_column > after_id))
+            )
+
+    if descending:
+        stmt = stmt.order_by(timestamp_column.desc(), id_column.desc())
+    else:
+        stmt = stmt.order_by(timestamp_column.asc(), id_column.asc())
+    if limit is not None:
+        stmt = stmt.limit(limit + 1)
+    result = await session.execute(stmt)
+    rows = list(result.all())
+
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = PageCursor(
+            timestamp=getattr(last[0], timestamp_column.key),
+            id=getattr(last[0], id_column.key),
+            key=last[1] if sqlite else None,
+        ).encode()
+
+    return PageDTO(items=[to_entity(row[0]) for row in rows], next_cursor=next_cursor)
+
+
+def _is_sqlite(session: AsyncSession) -> bool:
+    # session.bind (primário): get_bind() sem statement não deve decidir o roteamento
+    return session.bind.dialect.name == "sqlite"
+
+
+def _bind_timestamp(after: PageCursor) -> str:
+    """Texto gravado no SQLite para o timestamp do cursor"""
+    if after.key is not None:
+        return after.key
+    # Cursor sem o texto gravado: formato do SQLAlchemy (ou do CURRENT_TIMESTAMP, sem fração)
+    value = after.timestamp
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    if value.microsecond:
+        return value.strftime("%Y-%m-%d %H:%M:%S.%f")
+    return value.strftime("%Y-%m-%d %H:%M:%S")
@@ -0,0 +1,71 @@
+"""
+Medição da ocupação do pool de conexões por requisição.
+
+O middleware abre um PoolUsage no início da requisição (contextvar); os eventos
+checkout/checkin do pool somam quantas conexões a requisição pegou, por quanto
+tempo as segurou e o pico de conexões em uso no pool enquanto ela rodava.
+"""
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+_USAGE_KEY = "request_pool_usage"
+_CHECKOUT_AT_KEY = "checkout_at"
+
+_current_usage: ContextVar[Optional["PoolUsage"]] = ContextVar("db_pool_usage", default=None)
+
+
+@dataclass(slots=True, kw_only=True)
+class PoolUsage:
+    """Uso do pool por uma requisição."""
+    checkouts: int = 0
+    held_seconds: float = 0.0
+    peak_pool_in_use: int = 0
+    open_connections: int = 0
+
+    @property
+    def held_ms(self) -> float:
+        return self.held_seconds * 1000
+
+
+def start_request_usage() -> tuple[PoolUsage, Token]:
+    usage = PoolUsage()
+    return usage, _current_usage.set(usage)
+
+
+def end_request_usage(token: Token) -> None:
+    _current_usage.reset(token)
+
+
+def current_usage() -> Optional[PoolUsage]:
+    return _current_usage.get()
+
+
+def instrument_pool(engine: AsyncEngine) -> None:
+    """Registra os eventos de checkout/checkin no pool do engine"""
+    pool = engine.sync_engine.pool
+
+    @event.listens_for(pool, "checkout")
+    def _on_checkout(dbapi_connection: Any, record: Any, proxy: Any) -> None:
+        usage = _current_usage.get()
+        if usage is None:
+            return
+        # O checkin pode acontecer fora do contexto da requisição: guarda no registro
+        record.info[_USAGE_KEY] = usage
+        record.info[_CHECKOUT_AT_KEY] = time.perf_counter()
+        usage.checkouts += 1
+        usage.open_connections += 1
+        usage.peak_pool_in_use = max(usage.peak_pool_in_use, pool.checkedout())
+
+    @event.listens_for(pool, "checkin")
+    def _on_checkin(dbapi_connection: Any, record: Any) -> None:
+        usage = record.info.pop(_USAGE_KEY, None)
+        checkout_at = record.info.pop(_CHECKOUT_AT_KEY, None)
+        if usage is None or checkout_at is None:
+            return
+        usage.held_seconds += time.perf_counter() - checkout_at
+        usage.open_connections -= 1
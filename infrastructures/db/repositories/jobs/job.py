@@ -7,11 +7,13 @@ from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from application.dtos.pagination import PageDTO
 from application.interfaces.jobs.repositories import JobRepositoryProtocol
 from domain.entities.jobs.job import JobEntity, JobStatus
 from infrastructures.db.exceptions import RepositorySaveError
 from infrastructures.db.mappers.jobs.job_db_mapper import JobDBMapper
 from infrastructures.db.models.jobs.job import JobModel
+from infrastructures.db.pagination import fetch_keyset_page
 
 
 @final
@@ -52,6 +54,35 @@ class JobRepositorySQLAlchemy(JobRepositoryProtocol):
         except SQLAlchemyError as e:
             raise RepositorySaveError("Error retrieving active jobs: {e}") from e
 
+    async def get_page_by_user_id(
+        self, user_id: UUID, limit: int | None, cursor: str | None = None
+    ) -> PageDTO[JobEntity]:
+        """Retrieves one page of a user's jobs, newest first."""
+        try:
+            stmt = select(JobModel).where(JobModel.created_by_user_id == str(user_id))
+            return await self._fetch_page(stmt, limit, cursor)
+        except SQLAlchemyError as e:
+            raise RepositorySaveError(f"Error retrieving jobs for user {user_id}: {e}") from e
+
+    async def get_active_page(self, limit: int | None, cursor: str | None = None) -> PageDTO[JobEntity]:
+        """Retrieves one page of active jobs, newest first."""
+        try:
+            stmt = select(JobModel).where(JobModel.status == JobStatus.ACTIVE.value)
+            return await self._fetch_page(stmt, limit, cursor)
+        except SQLAlchemyError as e:
+            raise RepositorySaveError(f"Error retrieving active jobs: {e}") from e
+
+    async def _fetch_page(self, stmt, limit: int | None, cursor: str | None) -> PageDTO[JobEntity]:
+        return await fetch_keyset_page(
+            self.session,
+            stmt,
+            timestamp_column=JobModel.created_at,
+            id_column=JobModel.job_id,
+            limit=limit,
+            cursor=cursor,
+            to_entity=self.mapper.to_entity,
+        )
+
     async def save(self, job: JobEntity) -> None:
         """Saves a new job or updates an existing one."""
         try:
@@ -93,4 +124,14 @@ class JobRepositorySQLAlchemy(JobRepositoryProtocol):
             return result.scalar_one()
         except SQLAlchemyError as e:
             raise RepositorySaveError(f"Error counting jobs for user {user_id}: {e}") from e
+
+    async def count_active(self) -> int:
+        """Counts the number of active jobs."""
+        try:
+            from sqlalchemy import func
+            stmt = select(func.count(JobModel.job_id)).where(JobModel.status == JobStatus.ACTIVE.value)
+            result = await self.session.execute(stmt)
+            return result.scalar_one()
+        except SQLAlchemyError as e:
+            raise RepositorySaveError(f"Error counting active jobs: {e}") from e
             raise RepositorySaveError(f"Error updating status for job {job_id}: {e}") from e
\ No newline at end of file
@@ -1,18 +1,137 @@
+import random
+from typing import Any, Sequence
+
+from sqlalchemy.sql.selectable import SelectBase
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import Session
+
+from infrastructures.db.pool_metrics import instrument_pool
+
+# Chaves em Session.info usadas pelo roteamento primário/réplicas
+READ_ONLY_KEY = "read_only"
+REPLICAS_KEY = "replica_binds"
+WROTE_KEY = "wrote"
+
+
+def _is_plain_read(statement: Any) -> bool:
+    """SELECT (inclusive UNION e text().columns()) sem FOR UPDATE"""
+    return isinstance(statement, SelectBase) and getattr(statement, "_for_update_arg", None) is None
+
+
+class RoutingSession(Session):
+    """
+    Session that sends SELECTs to a read replica when it was opened as read-only
+    (info["read_only"]) and everything else to the primary.
+
+    Read-your-writes: after the first flush/INSERT/UPDATE/DELETE (or SELECT ... FOR UPDATE)
+    the session sticks to the primary for the rest of its life, i.e. the rest of the request.
+    A get_bind() with no statement (e.g. only to read the dialect) returns the primary
+    without pinning the session.
+    """
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kw: Any):
+        replicas = self.info.get(REPLICAS_KEY)
+        if replicas and self.info.get(READ_ONLY_KEY) and not self.info.get(WROTE_KEY):
+            if not self._flushing and _is_plain_read(clause):
+                return random.choice(replicas)
+            if self._flushing or clause is not None:
+                self.info[WROTE_KEY] = True
+        return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+
+class ReleasingAsyncSession(AsyncSession):
+    """
+    AsyncSession that gives its connection back to the pool as soon as a read returns,
+    instead of holding it from the first query until the session closes (end of the request).
+
+    Only sessions opened as read-only (info["read_only"], i.e. GET/HEAD requests) do this:
+    in the others a read is usually followed by a write that relies on it (quota and
+    duplicate checks before an insert), so the whole request stays in one transaction.
+
+    After a plain SELECT (AsyncSession already buffers the rows), with nothing pending in the
+    session and no write in the current transaction, the transaction is committed, which
+    checks the connection in; the next statement checks out a new one. Once the transaction
+    has a write (flush, DML, SELECT ... FOR UPDATE, raw text) the connection is kept until
+    commit/rollback, as before. With expire_on_commit=False loaded objects stay usable.
+    """
+
+    _tx_has_writes: bool = False
+
+    async def execute(self, statement: Any, *args: Any, **kw: Any):
+        result = await super().execute(statement, *args, **kw)
+        await self._after_statement(statement)
+        return result
+
+    async def scalar(self, statement: Any, *args: Any, **kw: Any):
+        result = await super().scalar(statement, *args, **kw)
+        await self._after_statement(statement)
+        return result
+
+    async def scalars(self, statement: Any, *args: Any, **kw: Any):
+        result = await super().scalars(statement, *args, **kw)
+        await self._after_statement(statement)
+        return result
+
+    async def get(self, *args: Any, **kw: Any):
+        result = await super().get(*args, **kw)
+        await self._release_if_idle()
+        return result
+
+    async def refresh(self, *args: Any, **kw: Any) -> None:
+        await super().refresh(*args, **kw)
+        await self._release_if_idle()
+
+    async def flush(self, objects: Any = None) -> None:
+        self._tx_has_writes = True
+        await super().flush(objects)
+
+    async def commit(self) -> None:
+        await super().commit()
+        self._tx_has_writes = False
+
+    async def rollback(self) -> None:
+        await super().rollback()
+        self._tx_has_writes = False
+
+    async def close(self) -> None:
+        await super().close()
+        self._tx_has_writes = False
+
+    async def _after_statement(self, statement: Any) -> None:
+        if not _is_plain_read(statement):
+            self._tx_has_writes = True
+            return
+        await self._release_if_idle()
+
+    async def _release_if_idle(self) -> None:
+        if not self.info.get(READ_ONLY_KEY):
+            return
+        if self._tx_has_writes or not self.in_transaction():
+            return
+        if self.new or self.dirty or self.deleted:
+            return
+        await super().commit()
 
 
-def create_engine(url: str, is_echo: bool = True) -> AsyncEngine:
+def create_engine(
+    url: str,
+    is_echo: bool = True,
+    pool_size: int = 20,
+    max_overflow: int = 30,
+) -> AsyncEngine:
     """
     Creates an asynchronous SQLAlchemy engine.
 
     Args:
         url: The database connection URL.
         is_echo: If True, SQL statements will be echoed to the console.
+        pool_size: Connections kept open in the pool.
+        max_overflow: Extra connections allowed above pool_size under load.
 
     Returns:
         An AsyncEngine instance.
@@ -25,30 +144,38 @@ def create_engine(url: str, is_echo: bool = True) -> AsyncEngine:
             "prepared_statement_cache_size": 0,  
         }
     
-    return create_async_engine(
+    engine = create_async_engine(
         url=url,
         echo=is_echo,
-        pool_size=20,
-        max_overflow=30,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
         pool_pre_ping=True,
         pool_recycle=3600,
         connect_args=connect_args,
     )
+    instrument_pool(engine)
+    return engine
 
 
-def get_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+def get_session_factory(
+    engine: AsyncEngine,
+    replica_engines: Sequence[AsyncEngine] = (),
+) -> async_sessionmaker[AsyncSession]:
     """
     Creates an asynchronous sessionmaker for SQLAlchemy sessions.
 
     Args:
-        engine: The AsyncEngine instance.
+        engine: The AsyncEngine instance (primary).
+        replica_engines: Read replicas; used only by sessions opened with info={"read_only": True}.
 
     Returns:
         An async_sessionmaker configured for AsyncSession.
     """
     return async_sessionmaker(
         bind=engine,
-        class_=AsyncSession,
+        class_=ReleasingAsyncSession,
         expire_on_commit=False,
         autoflush=False,
+        sync_session_class=RoutingSession,
+        info={REPLICAS_KEY: [replica.sync_engine for replica in replica_engines]},
     )
@@ -0,0 +1,200 @@
+"""
+Contagem de referências dos blobs endereçados por conteúdo (tabela blob_refs).
+Usa uma session factory própria e faz commit após cada operação, como o ChatRepositorySupabase.
+"""
+from typing import Optional
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from infrastructures.db.models.storage.blob_ref import BlobRefModel
+
+
+class BlobRefRepositorySqlAlchemy:
+    """Incremento/decremento atômicos de ref_count, portáveis entre SQLite, MySQL e PostgreSQL."""
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+        self._session_factory = session_factory
+
+    async def get(self, digest: str) -> Optional[dict]:
+        async with self._session_factory() as session:
+            model = await session.get(BlobRefModel, digest)
+            if model is None:
+                return None
+            return {
+                "digest": model.digest,
+                "location": model.location,
+                "size": model.size,
+                "stored_size": model.stored_size,
+                "compression": model.compression,
+                "ref_count": model.ref_count,
+            }
+
+    async def get_many(self, digests: list[str]) -> dict[str, dict]:
+        """Busca vários registros com um único SELECT ... IN (...)"""
+        if not digests:
+            return {}
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(BlobRefModel).where(BlobRefModel.digest.in_(set(digests)))
+            )
+            return {
+                model.digest: {
+                    "digest": model.digest,
+                    "location": model.location,
+                    "size": model.size,
+                    "stored_size": model.stored_size,
+                    "compression": model.compression,
+                    "ref_count": model.ref_count,
+                }
+                for model in result.scalars()
+            }
+
+    async def get_all(self) -> list[dict]:
+        """Todos os registros (digest, location, stored_size, ref_count, created_at, updated_at)"""
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(
+                    BlobRefModel.digest,
+                    BlobRefModel.location,
+                    BlobRefModel.stored_size,
+                    BlobRefModel.ref_count,
+                    BlobRefModel.created_at,
+                    BlobRefModel.updated_at,
+                )
+            )
+            return [dict(row._mapping) for row in result]
+
+    async def delete_many(self, digests: list[str]) -> int:
+        """Remove registros (coleta de lixo). Retorna quantos foram removidos."""
+        if not digests:
+            return 0
+        async with self._session_factory() as session:
+            result = await session.execute(delete(BlobRefModel).where(BlobRefModel.digest.in_(digests)))
+            await session.commit()
+            return result.rowcount
+
+    async def acquire_existing(self, digest: str) -> Optional[dict]:
+        """
+        Incrementa a referência de um blob já registrado e ainda em uso (ref_count > 0),
+        num único UPDATE: um release concorrente não consegue apagá-lo no meio.
+        Retorna o registro, ou None se o blob não existe (o chamador grava o conteúdo).
+        """
+        async with self._session_factory() as session:
+            result = await session.execute(
+                update(BlobRefModel)
+                .where(BlobRefModel.digest == digest, BlobRefModel.ref_count > 0)
+                .values(ref_count=BlobRefModel.ref_count + 1)
+            )
+            if result.rowcount == 0:
+                await session.rollback()
+                return None
+            model = await session.get(BlobRefModel, digest)
+            ref = {
+                "digest": model.digest,
+                "location": model.location,
+                "size": model.size,
+                "stored_size": model.stored_size,
+                "compression": model.compression,
+                "ref_count": model.ref_count,
+            }
+            await session.commit()
+            return ref
+
+    async def acquire_many(self, entries: list[tuple[str, str, int, int, Optional[str]]]) -> None:
+        """
+        Incrementa várias referências em uma única transação.
+        entries: (digest, location, size, stored_size, compression); digests repetidos contam várias vezes.
+        """
+        if not entries:
+            return
+        async with self._session_factory() as session:
+            try:
+                for digest, location, size, stored_size, compression in entries:
+                    result = await session.execute(
+                        update(BlobRefModel)
+                        .where(BlobRefModel.digest == digest)
+                        .values(ref_count=BlobRefModel.ref_count + 1)
+                    )
+                    if result.rowcount == 0:
+                        session.add(BlobRefModel(
+                            digest=digest,
+                            location=location,
+                            size=size,
+                            stored_size=stored_size,
+                            compression=compression,
+                            ref_count=1,
+                        ))
+                        await session.flush()
+                await session.commit()
+                return
+            except IntegrityError:
+                await session.rollback()
+        # Conflito com upload concorrente: registra um a um
+        for entry in entries:
+            await self.acquire(*entry)
+
+    async def acquire(
+        self,
+        digest: str,
+        location: str,
+        size: int,
+        stored_size: int,
+        compression: Optional[str],
+    ) -> int:
+        """Incrementa a referência (criando o registro se necessário). Retorna o novo ref_count."""
+        for _ in range(2):
+            async with self._session_factory() as session:
+                result = await session.execute(
+                    update(BlobRefModel)
+                    .where(BlobRefModel.digest == digest)
+                    .values(ref_count=BlobRefModel.ref_count + 1)
+                )
+                if result.rowcount == 0:
+                    session.add(BlobRefModel(
+                        digest=digest,
+                        location=location,
+                        size=size,
+                        stored_size=stored_size,
+                        compression=compression,
+                        ref_count=1,
+                    ))
+                try:
+                    await session.commit()
+                except IntegrityError:
+                    # Outro upload concorrente criou o registro: tenta de novo pelo UPDATE
+                    await session.rollback()
+                    continue
+                count = await session.scalar(
+                    select(BlobRefModel.ref_count).where(BlobRefModel.digest == digest)
+                )
+                return int(count or 1)
+        raise RuntimeError(f"Não foi possível registrar referência para o blob {digest}")
+
+    async def release(self, digest: str) -> Optional[int]:
+        """
+        Decrementa a referência. Quando chega a zero o registro é removido.
+        Retorna o ref_count restante, ou None se o blob não é conhecido.
+        """
+        async with self._session_factory() as session:
+            result = await session.execute(
+                update(BlobRefModel)
+                .where(BlobRefModel.digest == digest, BlobRefModel.ref_count > 0)
+                .values(ref_count=BlobRefModel.ref_count - 1)
+            )
+            if result.rowcount == 0:
+                await session.rollback()
+                return None
+            count = await session.scalar(
+                select(BlobRefModel.ref_count).where(BlobRefModel.digest == digest)
+            )
+            if not count:
+                deleted = await session.execute(
+                    delete(BlobRefModel).where(BlobRefModel.digest == digest, BlobRefModel.ref_count <= 0)
+                )
+                if deleted.rowcount == 0:
+                    # Readquirido por um upload concorrente: o blob continua em uso
+                    count = 1
+            await session.commit()
+            return int(count or 0)
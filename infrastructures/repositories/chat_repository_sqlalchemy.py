@@ -4,10 +4,12 @@ from typing import Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc, delete, update
 
+from application.dtos.pagination import PageDTO
 from domain.entities.chat.chat_session import ChatSessionEntity
 from domain.entities.chat.chat_message import ChatMessageEntity
 from infrastructures.db.models.chat.chat_session import ChatSessionModel
 from infrastructures.db.models.chat.chat_message import ChatMessageModel
+from infrastructures.db.pagination import fetch_keyset_page
 
 
 class ChatRepositorySqlAlchemy:
@@ -26,6 +28,48 @@ class ChatRepositorySqlAlchemy:
         )
         self.session.add(model)
 
+    async def create_session_with_retention(self, session: ChatSessionEntity, max_sessions: int) -> int:
+        """Create a chat session and prune the user's older sessions in the same transaction."""
+        await self.create_session(session)
+        return await self.prune_sessions(session.user_id, max_sessions)
+
+    async def prune_sessions(self, user_id: UUID, keep: int) -> int:
+        """
+        Delete every session of the user except the newest `keep` (and their messages) with
+        two set-based DELETEs instead of one delete_session per old session.
+        Returns the number of sessions deleted.
+        """
+        # A sessão recém-criada precisa estar no banco para entrar nas N mais recentes (autoflush=False)
+        await self.session.flush()
+
+        # Tabela derivada: o MySQL não aceita LIMIT em subquery de IN nem ler a tabela alvo do DELETE
+        newest = (
+            select(ChatSessionModel.session_id)
+            .where(ChatSessionModel.user_id == str(user_id))
+            .order_by(desc(ChatSessionModel.created_at), desc(ChatSessionModel.session_id))
+            .limit(keep)
+            .subquery()
+        )
+        kept_ids = select(newest.c.session_id)
+        stale_ids = select(ChatSessionModel.session_id).where(
+            ChatSessionModel.user_id == str(user_id),
+            ChatSessionModel.session_id.not_in(kept_ids),
+        )
+
+        # Mensagens primeiro por causa da FK
+        await self.session.execute(
+            delete(ChatMessageModel).where(ChatMessageModel.session_id.in_(stale_ids)),
+            execution_options={"synchronize_session": False},
+        )
+        result = await self.session.execute(
+            delete(ChatSessionModel).where(
+                ChatSessionModel.user_id == str(user_id),
+                ChatSessionModel.session_id.not_in(kept_ids),
+            ),
+            execution_options={"synchronize_session": False},
+        )
+        return result.rowcount or 0
+
     async def get_sessions_by_user(self, user_id: UUID) -> List[ChatSessionEntity]:
         """Get all chat sessions for a user."""
         stmt = select(ChatSessionModel).where(ChatSessionModel.user_id == str(user_id)).order_by(desc(ChatSessionModel.created_at))
@@ -86,6 +130,28 @@ class ChatRepositorySqlAlchemy:
             for model in models
         ]
 
+    async def get_messages_page(
+        self, session_id: UUID, limit: Optional[int], cursor: Optional[str] = None
+    ) -> PageDTO[ChatMessageEntity]:
+        """Get one page of a session's messages, oldest first (keyset on timestamp, message_id)."""
+        stmt = select(ChatMessageModel).where(ChatMessageModel.session_id == str(session_id))
+        return await fetch_keyset_page(
+            self.session,
+            stmt,
+            timestamp_column=ChatMessageModel.timestamp,
+            id_column=ChatMessageModel.message_id,
+            limit=limit,
+            cursor=cursor,
+            to_entity=lambda model: ChatMessageEntity(
+                message_id=UUID(model.message_id),
+                session_id=UUID(model.session_id),
+                sender=model.sender,
+                text=model.text,
+                timestamp=model.timestamp,
+            ),
+            descending=False,
+        )
+
     async def delete_session(self, session_id: UUID) -> None:
         """Delete a chat session and its messages (messages first due to FK)."""
         await self.session.execute(delete(ChatMessageModel).where(ChatMessageModel.session_id == str(session_id)))
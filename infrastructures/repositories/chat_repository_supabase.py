@@ -7,7 +7,9 @@ from typing import List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from application.dtos.pagination import PageDTO
 from application.interfaces.chat.repositories import ChatRepositoryProtocol
+from infrastructures.db.session import READ_ONLY_KEY
 from domain.entities.chat.chat_session import ChatSessionEntity
 from domain.entities.chat.chat_message import ChatMessageEntity
 from infrastructures.repositories.chat_repository_sqlalchemy import ChatRepositorySqlAlchemy
@@ -19,40 +21,67 @@ class ChatRepositorySupabase(ChatRepositoryProtocol):
     Assim o histórico de conversas fica no Supabase e o restante do app pode usar SQLite.
     """
 
-    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession], read_from_replica: bool = False):
+        """
+        Args:
+            read_from_replica: Leituras podem ir para uma réplica (requisições GET/HEAD).
+                Depois de qualquer escrita, as leituras seguintes voltam ao primário.
+        """
         self._session_factory = session_factory
+        self._read_from_replica = read_from_replica
+        self._wrote = False
 
     def _repo(self, session: AsyncSession) -> ChatRepositorySqlAlchemy:
         return ChatRepositorySqlAlchemy(session)
 
+    def _read_session(self) -> AsyncSession:
+        return self._session_factory(info={READ_ONLY_KEY: self._read_from_replica and not self._wrote})
+
+    def _write_session(self) -> AsyncSession:
+        self._wrote = True
+        return self._session_factory()
+
     async def create_session(self, session_entity: ChatSessionEntity) -> None:
-        async with self._session_factory() as session:
+        async with self._write_session() as session:
             await self._repo(session).create_session(session_entity)
             await session.commit()
 
+    async def create_session_with_retention(self, session_entity: ChatSessionEntity, max_sessions: int) -> int:
+        # Inserção e limpeza na mesma conexão e no mesmo commit
+        async with self._write_session() as session:
+            deleted = await self._repo(session).create_session_with_retention(session_entity, max_sessions)
+            await session.commit()
+            return deleted
+
     async def get_sessions_by_user(self, user_id: UUID) -> List[ChatSessionEntity]:
-        async with self._session_factory() as session:
+        async with self._read_session() as session:
             return await self._repo(session).get_sessions_by_user(user_id)
 
     async def get_session_by_id(self, session_id: UUID) -> Optional[ChatSessionEntity]:
-        async with self._session_factory() as session:
+        async with self._read_session() as session:
             return await self._repo(session).get_session_by_id(session_id)
 
     async def add_message(self, message: ChatMessageEntity) -> None:
-        async with self._session_factory() as session:
+        async with self._write_session() as session:
             await self._repo(session).add_message(message)
             await session.commit()
 
     async def get_messages_by_session(self, session_id: UUID) -> List[ChatMessageEntity]:
-        async with self._session_factory() as session:
+        async with self._read_session() as session:
             return await self._repo(session).get_messages_by_session(session_id)
 
+    async def get_messages_page(
+        self, session_id: UUID, limit: Optional[int], cursor: Optional[str] = None
+    ) -> PageDTO[ChatMessageEntity]:
+        async with self._read_session() as session:
+            return await self._repo(session).get_messages_page(session_id, limit, cursor)
+
     async def delete_session(self, session_id: UUID) -> None:
-        async with self._session_factory() as session:
+        async with self._write_session() as session:
             await self._repo(session).delete_session(session_id)
             await session.commit()
 
     async def update_session_title(self, session_id: UUID, title: str) -> None:
-        async with self._session_factory() as session:
+        async with self._write_session() as session:
             await self._repo(session).update_session_title(session_id, title)
             await session.commit()
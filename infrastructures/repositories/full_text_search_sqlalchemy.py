@@ -0,0 +1,207 @@
+"""
+Índice de texto completo para vagas e currículos, no próprio banco da aplicação.
+
+- SQLite: tabela virtual FTS5 (search_documents_fts). Os termos são gravados já
+  reduzidos ao radical (stemmer português do NLTK, quando instalado) e sem acentos;
+  ranking por bm25 com o título pesando mais que o corpo.
+- PostgreSQL: tabela search_documents com coluna tsvector gerada (configuração
+  'portuguese_unaccent': portuguese sem acentos, migração e6f7a8b9c0d1; título com
+  peso A e corpo com peso B) e índice GIN; ranking por ts_rank_cd.
+- Outros bancos: a mesma tabela sem tsvector, filtrada com LIKE por termo.
+
+As tabelas são criadas pela migração c4d5e6f7a8b9; para indexar o que já existe,
+rode python -m presentation.cli.search_reindex.
+"""
+from dataclasses import dataclass
+from typing import Any, final
+
+from sqlalchemy import String, Text, and_, bindparam, column, delete, func, insert, select, table, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from application.dtos.search import SearchDocumentDTO, SearchHitDTO
+from application.interfaces.search import FullTextSearchProtocol
+from infrastructures.search.text_analysis import fold, query_terms, stem, stem_text
+
+FTS_TABLE = "search_documents_fts"
+TABLE = "search_documents"
+# Mesma configuração da coluna gerada search_vector (unaccent + stemmer português)
+TS_CONFIG = "portuguese_unaccent"
+
+TITLE_WEIGHT = 4.0
+BODY_WEIGHT = 1.0
+SNIPPET_CHARS = 160
+
+_documents = table(
+    TABLE,
+    column("kind", String),
+    column("doc_id", String),
+    column("owner_id", String),
+    column("title", Text),
+    column("body", Text),
+)
+_fts_documents = table(
+    FTS_TABLE,
+    column("kind"),
+    column("doc_id"),
+    column("owner_id"),
+    column("title"),
+    column("body"),
+    column("title_terms"),
+    column("body_terms"),
+)
+
+# text().columns(...) faz da consulta um SELECT (a sessão libera a conexão logo depois)
+_HIT_COLUMNS = (column("doc_id"), column("title"), column("body"), column("score"))
+
+
+def make_snippet(body: str, terms: list[str]) -> str:
+    """Trecho do corpo em volta da primeira ocorrência de algum termo"""
+    folded = fold(body)
+    positions = [p for p in (folded.find(stem(t)) for t in terms) if p >= 0]
+    start = max(0, min(positions) - SNIPPET_CHARS // 3) if positions else 0
+    if start > 0:
+        # Começa no início de uma palavra
+        start = body.rfind(" ", 0, start) + 1
+    snippet = " ".join(body[start:start + SNIPPET_CHARS].split())
+    if start > 0:
+        snippet = "…" + snippet
+    if start + SNIPPET_CHARS < len(body):
+        snippet += "…"
+    return snippet
+
+
+@final
+@dataclass(frozen=True, slots=True)
+class FullTextSearchSqlAlchemy(FullTextSearchProtocol):
+    """Índice de texto completo na mesma sessão (e transação) dos repositórios"""
+
+    session: AsyncSession
+
+    async def upsert(self, documents: list[SearchDocumentDTO]) -> None:
+        if not documents:
+            return
+        # Substitui (remove + insere) para funcionar igual em FTS5 e tabelas comuns
+        for kind in {d.kind for d in documents}:
+            await self.delete(kind, [d.doc_id for d in documents if d.kind == kind])
+
+        if self._dialect() == "sqlite":
+            rows = [
+                {
+                    "kind": d.kind,
+                    "doc_id": d.doc_id,
+                    "owner_id": d.owner_id,
+                    "title": d.title,
+                    "body": d.body,
+                    "title_terms": stem_text(d.title),
+                    "body_terms": stem_text(d.body),
+                }
+                for d in documents
+            ]
+            await self.session.execute(insert(_fts_documents), rows)
+            return
+
+        rows = [
+            {"kind": d.kind, "doc_id": d.doc_id, "owner_id": d.owner_id, "title": d.title, "body": d.body}
+            for d in documents
+        ]
+        await self.session.execute(insert(_documents), rows)
+
+    async def delete(self, kind: str, doc_ids: list[str]) -> None:
+        if not doc_ids:
+            return
+        target = _fts_documents if self._dialect() == "sqlite" else _documents
+        await self.session.execute(
+            delete(target).where(target.c.kind == kind, target.c.doc_id.in_(doc_ids))
+        )
+
+    async def clear(self, kind: str) -> None:
+        """Remove todos os documentos de um tipo (usado na reindexação completa)"""
+        target = _fts_documents if self._dialect() == "sqlite" else _documents
+        await self.session.execute(delete(target).where(target.c.kind == kind))
+
+    async def search(self, kind: str, query: str, owner_id: str, limit: int) -> list[SearchHitDTO]:
+        terms = query_terms(query)
+        if not terms:
+            return []
+
+        dialect = self._dialect()
+        if dialect == "sqlite":
+            rows = await self._search_fts5(kind, terms, owner_id, limit)
+        elif dialect == "postgresql":
+            rows = await self._search_tsvector(kind, terms, owner_id, limit)
+        else:
+            rows = await self._search_like(kind, terms, owner_id, limit)
+
+        return [
+            SearchHitDTO(
+                doc_id=row.doc_id,
+                title=row.title,
+                score=round(float(row.score), 6),
+                snippet=make_snippet(row.body or "", terms),
+            )
+            for row in rows
+        ]
+
+    async def _search_fts5(self, kind: str, terms: list[str], owner_id: str, limit: int) -> list[Any]:
+        # Cada termo vira um prefixo entre aspas (sem sintaxe FTS5 vinda do usuário), todos obrigatórios
+        match = " ".join(f'"{stem(t)}"*' for t in terms)
+        stmt = text(
+            f"SELECT doc_id, title, body, "
+            f"-bm25({FTS_TABLE}, 0, 0, 0, 0, 0, :title_weight, :body_weight) AS score "
+            f"FROM {FTS_TABLE} "
+            f"WHERE {FTS_TABLE} MATCH :match AND kind = :kind AND owner_id = :owner_id "
+            f"ORDER BY score DESC LIMIT :limit"
+        ).columns(*_HIT_COLUMNS)
+        result = await self.session.execute(
+            stmt,
+            {
+                "match": match,
+                "kind": kind,
+                "owner_id": owner_id,
+                "limit": limit,
+                "title_weight": TITLE_WEIGHT,
+                "body_weight": BODY_WEIGHT,
+            },
+        )
+        return list(result.all())
+
+    async def _search_tsvector(self, kind: str, terms: list[str], owner_id: str, limit: int) -> list[Any]:
+        # "react sênior" -> react:* & senior:* (to_tsquery tira os acentos e aplica o stemmer em cada termo)
+        tsquery = " & ".join(f"{t}:*" for t in terms)
+        stmt = text(
+            f"SELECT doc_id, title, body, ts_rank_cd(search_vector, q) AS score "
+            f"FROM {TABLE}, to_tsquery('{TS_CONFIG}', :tsquery) AS q "
+            f"WHERE kind = :kind AND owner_id = :owner_id AND search_vector @@ q "
+            f"ORDER BY score DESC LIMIT :limit"
+        ).columns(*_HIT_COLUMNS)
+        result = await self.session.execute(
+            stmt, {"tsquery": tsquery, "kind": kind, "owner_id": owner_id, "limit": limit}
+        )
+        return list(result.all())
+
+    async def _search_like(self, kind: str, terms: list[str], owner_id: str, limit: int) -> list[Any]:
+        content = func.lower(_documents.c.title + " " + _documents.c.body)
+        stmt = select(_documents.c.doc_id, _documents.c.title, _documents.c.body).where(
+            _documents.c.kind == kind,
+            _documents.c.owner_id == owner_id,
+            and_(*(content.like(bindparam(f"term_{i}", f"%{t}%")) for i, t in enumerate(terms))),
+        )
+        rows = (await self.session.execute(stmt)).all()
+
+        def _score(row: Any) -> float:
+            title, body = (row.title or "").lower(), (row.body or "").lower()
+            return sum(TITLE_WEIGHT * title.count(t) + BODY_WEIGHT * body.count(t) for t in terms)
+
+        ranked = sorted(rows, key=_score, reverse=True)[:limit]
+        return [_LikeRow(doc_id=r.doc_id, title=r.title, body=r.body, score=_score(r)) for r in ranked]
+
+    def _dialect(self) -> str:
+        return self.session.bind.dialect.name
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class _LikeRow:
+    doc_id: str
+    title: str
+    body: str
+    score: float
@@ -2,8 +2,10 @@ from sqlalchemy import select, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 from domain.entities.candidates.job_application import JobApplicationEntity, JobApplicationStatus
+from application.dtos.pagination import PageDTO
 from application.interfaces.candidates.repositories import JobApplicationRepositoryProtocol
 from infrastructures.db.models.candidates.job_application import JobApplicationModel
+from infrastructures.db.pagination import fetch_keyset_page
 
 
 class JobApplicationRepository(JobApplicationRepositoryProtocol):
@@ -73,6 +75,30 @@ class JobApplicationRepository(JobApplicationRepositoryProtocol):
             for model in models
         ]
 
+    async def get_page_by_user_id(
+        self, user_id: str, limit: Optional[int], cursor: Optional[str] = None
+    ) -> PageDTO[JobApplicationEntity]:
+        query = select(JobApplicationModel).where(JobApplicationModel.user_id == user_id)
+        return await fetch_keyset_page(
+            self.session,
+            query,
+            timestamp_column=JobApplicationModel.created_at,
+            id_column=JobApplicationModel.id,
+            limit=limit,
+            cursor=cursor,
+            to_entity=lambda model: JobApplicationEntity(
+                id=model.id,
+                user_id=model.user_id,
+                company_name=model.company_name,
+                job_title=model.job_title,
+                application_date=model.application_date,
+                description=model.description,
+                status=model.status,
+                created_at=model.created_at,
+                updated_at=model.updated_at,
+            ),
+        )
+
     async def update(self, entity: JobApplicationEntity) -> JobApplicationEntity:
         query = (
             update(JobApplicationModel)
@@ -2,10 +2,18 @@
 from uuid import UUID
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import Integer, String, delete, func, insert, literal, select, union_all
 
+from application.dtos.pagination import PageDTO
 from domain.entities.resumes.resume import ResumeEntity
 from infrastructures.db.models.resumes.resume import ResumeModel
+from infrastructures.db.models.resumes.resume_group import ResumeGroupModel, ResumeGroupMemberModel
+from infrastructures.db.pagination import fetch_keyset_page
+
+
+def file_name_key(file_name: str) -> str:
+    """Chave de comparação de nomes: casefold do Python (o lower() do SQLite só converte ASCII)"""
+    return file_name.strip().casefold()
 
 
 class ResumeRepositorySqlAlchemy:
@@ -21,12 +29,32 @@ class ResumeRepositorySqlAlchemy:
             uploaded_by_user_id=str(resume.uploaded_by_user_id),
             candidate_name=resume.candidate_name,
             file_name=resume.file_name,
+            file_name_key=file_name_key(resume.file_name),
             file_path=resume.file_path,
             vector_index_id=resume.vector_index_id,
             is_indexed=resume.is_indexed,
         )
         self.session.add(model)
 
+    async def add_many(self, resumes: list[ResumeEntity]) -> None:
+        """Add several resumes with a single multi-row INSERT (no per-object ORM bookkeeping)."""
+        if not resumes:
+            return
+        rows = [
+            {
+                "resume_id": str(resume.resume_id),
+                "uploaded_by_user_id": str(resume.uploaded_by_user_id),
+                "candidate_name": resume.candidate_name,
+                "file_name": resume.file_name,
+                "file_name_key": file_name_key(resume.file_name),
+                "file_path": resume.file_path,
+                "vector_index_id": resume.vector_index_id,
+                "is_indexed": resume.is_indexed,
+            }
+            for resume in resumes
+        ]
+        await self.session.execute(insert(ResumeModel).values(rows))
+
     async def get_by_id(self, resume_id: UUID) -> Optional[ResumeEntity]:
         """Get a resume by ID."""
         stmt = select(ResumeModel).where(ResumeModel.resume_id == str(resume_id))
@@ -47,9 +75,82 @@ class ResumeRepositorySqlAlchemy:
             uploaded_at=model.created_at,
         )
 
-    async def get_by_vector_index_id(self, index_id: str) -> list[ResumeEntity]:
-        """Get all resumes for a vector index."""
-        stmt = select(ResumeModel).where(ResumeModel.vector_index_id == index_id)
+    async def get_owned(self, resume_id: UUID, user_id: UUID) -> Optional[ResumeEntity]:
+        """Get a resume by ID only if it belongs to user_id (single indexed lookup)."""
+        stmt = select(ResumeModel).where(
+            ResumeModel.resume_id == str(resume_id),
+            ResumeModel.uploaded_by_user_id == str(user_id),
+        )
+        result = await self.session.execute(stmt)
+        model = result.scalar_one_or_none()
+        return self._to_entity(model) if model is not None else None
+
+    async def get_by_ids(self, resume_ids: list[UUID], user_id: Optional[UUID] = None) -> list[ResumeEntity]:
+        """Get several resumes in one query (optionally only those owned by user_id)."""
+        if not resume_ids:
+            return []
+        stmt = select(ResumeModel).where(ResumeModel.resume_id.in_([str(rid) for rid in resume_ids]))
+        if user_id is not None:
+            stmt = stmt.where(ResumeModel.uploaded_by_user_id == str(user_id))
+        result = await self.session.execute(stmt)
+        return [self._to_entity(model) for model in result.scalars().all()]
+
+    async def get_by_group_id(self, group_id: str, user_id: UUID) -> list[ResumeEntity]:
+        """Get the resumes of a group owned by user_id (group and resumes) in a single join query."""
+        stmt = (
+            select(ResumeModel)
+            .join(ResumeGroupMemberModel, ResumeGroupMemberModel.resume_id == ResumeModel.resume_id)
+            .join(ResumeGroupModel, ResumeGroupModel.group_id == ResumeGroupMemberModel.group_id)
+            .where(
+                ResumeGroupModel.group_id == group_id,
+                ResumeGroupModel.user_id == str(user_id),
+                ResumeModel.uploaded_by_user_id == str(user_id),
+            )
+            .order_by(ResumeModel.created_at, ResumeModel.resume_id)
+        )
+        result = await self.session.execute(stmt)
+        return [self._to_entity(model) for model in result.scalars().all()]
+
+    async def get_index_summaries(self, user_id: UUID) -> list[dict]:
+        """
+        One row per vector index of the user (vector_index_id, resume_count, first_uploaded_at),
+        aggregated in SQL and ordered by the most recent index first.
+        """
+        first_uploaded_at = func.min(ResumeModel.created_at).label("first_uploaded_at")
+        stmt = (
+            select(
+                ResumeModel.vector_index_id,
+                func.count(ResumeModel.resume_id).label("resume_count"),
+                first_uploaded_at,
+            )
+            .where(
+                ResumeModel.uploaded_by_user_id == str(user_id),
+                ResumeModel.vector_index_id.isnot(None),
+            )
+            .group_by(ResumeModel.vector_index_id)
+            .order_by(first_uploaded_at.desc())
+        )
+        result = await self.session.execute(stmt)
+        return [
+            {
+                "vector_index_id": row.vector_index_id,
+                "resume_count": row.resume_count,
+                "first_uploaded_at": row.first_uploaded_at,
+            }
+            for row in result.all()
+        ]
+
+    async def get_by_vector_index_id(self, index_id: str, user_id: Optional[UUID] = None) -> list[ResumeEntity]:
+        """Get all resumes for a vector index (optionally only those owned by user_id)."""
+        return await self.get_by_vector_index_ids([index_id], user_id)
+
+    async def get_by_vector_index_ids(self, index_ids: list[str], user_id: Optional[UUID] = None) -> list[ResumeEntity]:
+        """Get the resumes of several vector indexes in one query (optionally only those owned by user_id)."""
+        if not index_ids:
+            return []
+        stmt = select(ResumeModel).where(ResumeModel.vector_index_id.in_(index_ids))
+        if user_id is not None:
+            stmt = stmt.where(ResumeModel.uploaded_by_user_id == str(user_id))
         result = await self.session.execute(stmt)
         models = result.scalars().all()
 
@@ -74,6 +175,35 @@ class ResumeRepositorySqlAlchemy:
         model = result.scalar_one_or_none()
         return model is not None
 
+    async def get_upload_conflicts(self, user_id: UUID, file_names: list[str]) -> tuple[int, list[str]]:
+        """
+        In one round-trip, return the user's resume count and the stored file names that
+        collide (case-insensitively, Unicode-aware) with file_names. Uses the
+        (uploaded_by_user_id, file_name_key) index.
+        """
+        keys = {file_name_key(name) for name in file_names if name and name.strip()}
+
+        owned = ResumeModel.uploaded_by_user_id == str(user_id)
+        count_stmt = select(func.count(ResumeModel.resume_id).label("total"), literal(None, String).label("file_name")).where(owned)
+        if not keys:
+            result = await self.session.execute(count_stmt)
+            return result.one().total, []
+
+        collisions_stmt = select(literal(None, Integer).label("total"), ResumeModel.file_name).where(
+            owned,
+            ResumeModel.file_name_key.in_(sorted(keys)),
+        )
+        result = await self.session.execute(union_all(count_stmt, collisions_stmt))
+
+        total = 0
+        colliding = []
+        for row in result.all():
+            if row.total is not None:
+                total = row.total
+            else:
+                colliding.append(row.file_name)
+        return total, colliding
+
     async def get_all_vector_index_ids(self) -> list[str]:
         """Get all unique vector index IDs."""
         stmt = select(ResumeModel.vector_index_id).where(ResumeModel.vector_index_id.isnot(None)).distinct()
@@ -81,6 +211,12 @@ class ResumeRepositorySqlAlchemy:
         index_ids = result.scalars().all()
         return [idx for idx in index_ids if idx is not None]
 
+    async def get_all_file_paths(self) -> list[str]:
+        """Get every stored file path referenced by a resume."""
+        stmt = select(ResumeModel.file_path).distinct()
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
     async def get_by_user_id(self, user_id: UUID) -> list[ResumeEntity]:
         """Get all resumes for a user."""
         stmt = select(ResumeModel).where(ResumeModel.uploaded_by_user_id == str(user_id))
@@ -101,6 +237,21 @@ class ResumeRepositorySqlAlchemy:
             for model in models
         ]
 
+    async def get_page_by_user_id(
+        self, user_id: UUID, limit: Optional[int], cursor: Optional[str] = None
+    ) -> PageDTO[ResumeEntity]:
+        """Get one page of a user's resumes, newest first (keyset on created_at, resume_id)."""
+        stmt = select(ResumeModel).where(ResumeModel.uploaded_by_user_id == str(user_id))
+        return await fetch_keyset_page(
+            self.session,
+            stmt,
+            timestamp_column=ResumeModel.created_at,
+            id_column=ResumeModel.resume_id,
+            limit=limit,
+            cursor=cursor,
+            to_entity=self._to_entity,
+        )
+
     async def count_by_user_id(self, user_id: UUID) -> int:
         """Count the number of resumes for a user."""
         from sqlalchemy import func
@@ -128,9 +279,38 @@ class ResumeRepositorySqlAlchemy:
             for model in models
         ]
 
+    async def delete_owned(
+        self, resume_id: UUID, user_id: Optional[UUID] = None
+    ) -> Optional[tuple[str, Optional[str]]]:
+        """
+        Delete a resume (restricted to user_id when given) and return its (file_path, vector_index_id),
+        or None if nothing was deleted. Uses DELETE ... RETURNING where the dialect supports it.
+        """
+        conditions = [ResumeModel.resume_id == str(resume_id)]
+        if user_id is not None:
+            conditions.append(ResumeModel.uploaded_by_user_id == str(user_id))
+        columns = (ResumeModel.file_path, ResumeModel.vector_index_id)
+
+        if self.session.bind.dialect.delete_returning:
+            stmt = delete(ResumeModel).where(*conditions).returning(*columns)
+            row = (await self.session.execute(stmt)).one_or_none()
+            return tuple(row) if row is not None else None
+
+        # MySQL não tem DELETE ... RETURNING
+        row = (await self.session.execute(select(*columns).where(*conditions))).one_or_none()
+        if row is not None:
+            await self.session.execute(delete(ResumeModel).where(*conditions))
+        return tuple(row) if row is not None else None
+
+    async def count_by_vector_index_id(self, index_id: str) -> int:
+        """Count resumes (of any user) that live in a vector index."""
+        from sqlalchemy import func
+        stmt = select(func.count(ResumeModel.resume_id)).where(ResumeModel.vector_index_id == index_id)
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
+
     async def delete(self, resume_id: UUID) -> bool:
-        """Delete a resume by ID."""
-        import os
+        """Delete a resume by ID (the stored file is released by the caller via the blob store)."""
         stmt = select(ResumeModel).where(ResumeModel.resume_id == str(resume_id))
         result = await self.session.execute(stmt)
         model = result.scalar_one_or_none()
@@ -138,13 +318,18 @@ class ResumeRepositorySqlAlchemy:
         if model is None:
             return False
 
-        # Delete the file from filesystem
-        if os.path.exists(model.file_path):
-            try:
-                os.remove(model.file_path)
-            except OSError:
-                # Log error but don't fail the deletion
-                pass
-
         await self.session.delete(model)
-        return True
\ No newline at end of file
+        return True
+
+    @staticmethod
+    def _to_entity(model: ResumeModel) -> ResumeEntity:
+        return ResumeEntity(
+            resume_id=UUID(model.resume_id),
+            uploaded_by_user_id=UUID(model.uploaded_by_user_id),
+            candidate_name=model.candidate_name,
+            file_name=model.file_name,
+            file_path=model.file_path,
+            vector_index_id=model.vector_index_id,
+            is_indexed=model.is_indexed,
+            uploaded_at=model.created_at,
+        )
\ No newline at end of file
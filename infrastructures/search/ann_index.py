@@ -0,0 +1,183 @@
+"""
+Índice de vizinhos aproximados (ANN) sobre os embeddings dos chunks, salvo junto do
+índice vetorial (vai no mesmo zip/blob que os JSONs do LlamaIndex).
+
+Backends (AISettings.vector_store_type), todos em CPU e por similaridade de cosseno,
+como o SimpleVectorStore:
+- faiss / faiss_hnsw: grafo HNSW do FAISS
+- faiss_ivf: listas invertidas (IVF) do FAISS, com nprobe listas visitadas por busca
+- faiss_flat: busca exata do FAISS (sem aproximação, mas vetorizada)
+- hnswlib: grafo HNSW do hnswlib
+- simple: sem ANN; busca exaustiva no SimpleVectorStore
+
+As bibliotecas são opcionais: sem elas (ou em índices pequenos) a busca continua
+exaustiva no SimpleVectorStore.
+"""
+import json
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+import numpy as np
+
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
+try:
+    import hnswlib
+except ImportError:
+    hnswlib = None
+
+ANN_META_FILENAME = "ann_index.json"
+ANN_DATA_FILENAME = "ann_index.bin"
+
+FAISS_BACKENDS = {"faiss": "hnsw", "faiss_hnsw": "hnsw", "faiss_ivf": "ivf", "faiss_flat": "flat"}
+ANN_BACKENDS = (*FAISS_BACKENDS, "hnswlib")
+
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 200
+
+
+def is_backend_available(backend: str) -> bool:
+    if backend in FAISS_BACKENDS:
+        return faiss is not None
+    if backend == "hnswlib":
+        return hnswlib is not None
+    return False
+
+
+def _normalized_matrix(vectors: Sequence[Sequence[float]]) -> np.ndarray:
+    matrix = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return np.ascontiguousarray(matrix / norms)
+
+
+@dataclass(slots=True, kw_only=True)
+class AnnIndex:
+    backend: str
+    node_ids: list[str]
+    dim: int
+    index: Any
+    # Parâmetros de busca (não são salvos: vêm da configuração a cada carga)
+    ef_search: int = 128
+    nprobe: int = 16
+    _positions: dict[str, int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        self._positions = {node_id: position for position, node_id in enumerate(self.node_ids)}
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+    @classmethod
+    def build(
+        cls,
+        backend: str,
+        embeddings: dict[str, Sequence[float]],
+        ef_search: int = 128,
+        nprobe: int = 16,
+    ) -> "AnnIndex":
+        """embeddings: node_id -> vetor (o embedding_dict do SimpleVectorStore)"""
+        if not is_backend_available(backend):
+            raise ValueError(f"Backend ANN indisponível: {backend}")
+        node_ids = list(embeddings)
+        matrix = _normalized_matrix([embeddings[node_id] for node_id in node_ids])
+        count, dim = matrix.shape
+
+        if backend == "hnswlib":
+            index = hnswlib.Index(space="ip", dim=dim)
+            index.init_index(max_elements=count, ef_construction=HNSW_EF_CONSTRUCTION, M=HNSW_M)
+            index.add_items(matrix, np.arange(count))
+        else:
+            kind = FAISS_BACKENDS[backend]
+            if kind == "hnsw":
+                index = faiss.IndexHNSWFlat(dim, HNSW_M, faiss.METRIC_INNER_PRODUCT)
+                index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+            elif kind == "ivf":
+                # ~sqrt(n) listas, com pelo menos 39 vetores de treino por lista
+                nlist = max(1, min(int(math.sqrt(count)), count // 39))
+                index = faiss.IndexIVFFlat(faiss.IndexFlatIP(dim), dim, nlist, faiss.METRIC_INNER_PRODUCT)
+                index.train(matrix)
+            else:
+                index = faiss.IndexFlatIP(dim)
+            index.add(matrix)
+
+        return cls(backend=backend, node_ids=node_ids, dim=dim, index=index, ef_search=ef_search, nprobe=nprobe)
+
+    def search(
+        self, vector: Sequence[float], top_k: int, allowed_ids: Optional[set[str]] = None
+    ) -> list[tuple[str, float]]:
+        """(node_id, similaridade de cosseno) dos top_k vizinhos, opcionalmente só entre allowed_ids"""
+        allowed_positions = None
+        if allowed_ids is not None:
+            allowed_positions = [self._positions[i] for i in allowed_ids if i in self._positions]
+            if not allowed_positions:
+                return []
+        k = min(top_k, len(self.node_ids) if allowed_positions is None else len(allowed_positions))
+        if k <= 0:
+            return []
+        query = _normalized_matrix([vector])
+
+        if self.backend == "hnswlib":
+            self.index.set_ef(max(self.ef_search, k))
+            allowed = None if allowed_positions is None else set(allowed_positions)
+            labels, distances = self.index.knn_query(
+                query, k=k, filter=None if allowed is None else allowed.__contains__
+            )
+            # Espaço "ip": distância = 1 - produto interno
+            return [(self.node_ids[int(p)], 1.0 - float(d)) for p, d in zip(labels[0], distances[0])]
+
+        scores, labels = self.index.search(query, k, params=self._faiss_params(allowed_positions, k))
+        return [(self.node_ids[int(p)], float(s)) for p, s in zip(labels[0], scores[0]) if p >= 0]
+
+    def _faiss_params(self, allowed_positions: Optional[list[int]], k: int) -> Any:
+        selector = None
+        if allowed_positions is not None:
+            selector = faiss.IDSelectorBatch(np.asarray(allowed_positions, dtype=np.int64))
+        kind = FAISS_BACKENDS[self.backend]
+        if kind == "hnsw":
+            return faiss.SearchParametersHNSW(sel=selector, efSearch=max(self.ef_search, k))
+        if kind == "ivf":
+            return faiss.SearchParametersIVF(sel=selector, nprobe=self.nprobe)
+        return faiss.SearchParameters(sel=selector) if selector is not None else None
+
+    def save(self, persist_dir: Path) -> None:
+        data_path = persist_dir / ANN_DATA_FILENAME
+        if self.backend == "hnswlib":
+            self.index.save_index(str(data_path))
+        else:
+            faiss.write_index(self.index, str(data_path))
+        (persist_dir / ANN_META_FILENAME).write_text(
+            json.dumps({"backend": self.backend, "dim": self.dim, "node_ids": self.node_ids}, separators=(",", ":")),
+            encoding="utf-8",
+        )
+
+    @classmethod
+    def load(cls, persist_dir: Path, ef_search: int = 128, nprobe: int = 16) -> "AnnIndex | None":
+        """None se o índice não tem ANN salvo ou a biblioteca do backend não está instalada"""
+        meta_path = persist_dir / ANN_META_FILENAME
+        data_path = persist_dir / ANN_DATA_FILENAME
+        if not meta_path.exists() or not data_path.exists():
+            return None
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        backend = meta["backend"]
+        if not is_backend_available(backend):
+            return None
+
+        if backend == "hnswlib":
+            index = hnswlib.Index(space="ip", dim=meta["dim"])
+            index.load_index(str(data_path), max_elements=len(meta["node_ids"]))
+        else:
+            index = faiss.read_index(str(data_path))
+        return cls(
+            backend=backend,
+            node_ids=meta["node_ids"],
+            dim=meta["dim"],
+            index=index,
+            ef_search=ef_search,
+            nprobe=nprobe,
+        )
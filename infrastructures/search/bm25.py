@@ -0,0 +1,112 @@
+"""
+Índice invertido BM25 (Okapi) em Python puro, salvo como JSON junto do índice vetorial.
+
+Complementa a busca densa: termos exatos de competências ("Kubernetes", "SAP FI")
+pesam pelo IDF mesmo quando o embedding não os separa de termos parecidos.
+"""
+import json
+import math
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable
+
+from infrastructures.search.text_analysis import analyze
+
+BM25_FILENAME = "bm25.json"
+_FORMAT_VERSION = 1
+
+
+@dataclass(slots=True, kw_only=True)
+class BM25Index:
+    k1: float = 1.5
+    b: float = 0.75
+    doc_ids: list[str] = field(default_factory=list)
+    doc_lengths: list[int] = field(default_factory=list)
+    # termo -> [(posição do documento em doc_ids, frequência do termo)]
+    postings: dict[str, list[tuple[int, int]]] = field(default_factory=dict)
+    # Derivados de doc_ids/doc_lengths, montados uma vez (não são salvos)
+    _positions: dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _total_length: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._refresh()
+
+    def _refresh(self) -> None:
+        self._positions = {doc_id: position for position, doc_id in enumerate(self.doc_ids)}
+        self._total_length = sum(self.doc_lengths)
+
+    @classmethod
+    def build(cls, documents: Iterable[tuple[str, str]], k1: float = 1.5, b: float = 0.75) -> "BM25Index":
+        """documents: (id, texto), ex.: (node_id, conteúdo do chunk)"""
+        index = cls(k1=k1, b=b)
+        for position, (doc_id, text) in enumerate(documents):
+            terms = analyze(text)
+            index.doc_ids.append(doc_id)
+            index.doc_lengths.append(len(terms))
+            for term, frequency in Counter(terms).items():
+                index.postings.setdefault(term, []).append((position, frequency))
+        index._refresh()
+        return index
+
+    def search(self, query: str, top_k: int, allowed_ids: set[str] | None = None) -> list[tuple[str, float]]:
+        """
+        (id, score) dos top_k documentos com algum termo da busca, do maior score para o menor.
+
+        allowed_ids restringe a pontuação a esses documentos (filtro aplicado antes do top-k);
+        IDF e tamanho médio continuam sendo os do índice inteiro.
+        """
+        total = len(self.doc_ids)
+        if total == 0 or top_k <= 0:
+            return []
+        average_length = (self._total_length / total) or 1.0
+        allowed_positions = (
+            None if allowed_ids is None
+            else {self._positions[doc_id] for doc_id in allowed_ids if doc_id in self._positions}
+        )
+
+        scores: dict[int, float] = {}
+        for term in set(analyze(query)):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+            for position, frequency in postings:
+                if allowed_positions is not None and position not in allowed_positions:
+                    continue
+                norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[position] / average_length)
+                scores[position] = scores.get(position, 0.0) + idf * frequency * (self.k1 + 1) / (frequency + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:top_k]
+        return [(self.doc_ids[position], score) for position, score in ranked]
+
+    def to_dict(self) -> dict:
+        return {
+            "version": _FORMAT_VERSION,
+            "k1": self.k1,
+            "b": self.b,
+            "doc_ids": self.doc_ids,
+            "doc_lengths": self.doc_lengths,
+            "postings": self.postings,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BM25Index":
+        return cls(
+            k1=data["k1"],
+            b=data["b"],
+            doc_ids=list(data["doc_ids"]),
+            doc_lengths=list(data["doc_lengths"]),
+            postings={term: [tuple(p) for p in postings] for term, postings in data["postings"].items()},
+        )
+
+    def save(self, persist_dir: Path) -> None:
+        (persist_dir / BM25_FILENAME).write_text(json.dumps(self.to_dict(), separators=(",", ":")), encoding="utf-8")
+
+    @classmethod
+    def load(cls, persist_dir: Path) -> "BM25Index | None":
+        """None para índices criados antes do BM25"""
+        path = persist_dir / BM25_FILENAME
+        if not path.exists():
+            return None
+        return cls.from_dict(json.loads(path.read_text(encoding="utf-8")))
@@ -0,0 +1,69 @@
+"""
+Índice de metadados -> ids dos chunks, salvo junto do índice vetorial.
+
+Transforma filtros (arquivos, seções) em um conjunto de node_ids antes da busca,
+para que o top-k vetorial e o BM25 pontuem só os chunks que interessam.
+"""
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable
+
+from application.dtos.search import MetadataFilterDTO
+
+METADATA_INDEX_FILENAME = "metadata_index.json"
+
+# Campo do filtro -> chave do metadata dos chunks
+_FIELDS = {"file_names": "file_name", "sections": "section"}
+
+
+def _normalize(value: Any) -> str:
+    return str(value).strip().casefold()
+
+
+@dataclass(slots=True, kw_only=True)
+class MetadataIndex:
+    # chave do metadata -> valor normalizado -> node_ids
+    values: dict[str, dict[str, list[str]]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, nodes: Iterable[tuple[str, dict]]) -> "MetadataIndex":
+        """nodes: (node_id, metadata)"""
+        index = cls(values={key: {} for key in _FIELDS.values()})
+        for node_id, metadata in nodes:
+            for key in _FIELDS.values():
+                value = (metadata or {}).get(key)
+                if value is not None:
+                    index.values[key].setdefault(_normalize(value), []).append(node_id)
+        return index
+
+    @classmethod
+    def from_docstore(cls, docstore: Any) -> "MetadataIndex":
+        """Para índices criados antes deste arquivo existir"""
+        return cls.build((node_id, node.metadata) for node_id, node in docstore.docs.items())
+
+    def matching_ids(self, filters: MetadataFilterDTO | None) -> set[str] | None:
+        """node_ids que passam em todos os filtros (None = sem restrição)"""
+        if filters is None or filters.is_empty:
+            return None
+        allowed: set[str] | None = None
+        for attribute, key in _FIELDS.items():
+            wanted = getattr(filters, attribute)
+            if wanted is None:
+                continue
+            by_value = self.values.get(key, {})
+            ids = {node_id for value in wanted for node_id in by_value.get(_normalize(value), ())}
+            allowed = ids if allowed is None else allowed & ids
+        return allowed
+
+    def save(self, persist_dir: Path) -> None:
+        (persist_dir / METADATA_INDEX_FILENAME).write_text(
+            json.dumps({"values": self.values}, separators=(",", ":"), ensure_ascii=False), encoding="utf-8"
+        )
+
+    @classmethod
+    def load(cls, persist_dir: Path) -> "MetadataIndex | None":
+        path = persist_dir / METADATA_INDEX_FILENAME
+        if not path.exists():
+            return None
+        return cls(values=json.loads(path.read_text(encoding="utf-8"))["values"])
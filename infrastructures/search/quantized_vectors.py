@@ -0,0 +1,182 @@
+"""
+Embeddings dos chunks guardados quantizados, no lugar das listas de floats em JSON
+do SimpleVectorStore.
+
+- float16: metade do tamanho, erro desprezível para similaridade de cosseno.
+- int8: um byte por dimensão + um fator de escala float32 por vetor
+  (codes = round(v / scale), scale = max|v| / 127).
+
+Os vetores são normalizados antes da quantização, então similaridade de cosseno é
+o produto interno. A busca calcula o score direto nos códigos (query float32 contra
+codes * scale, em blocos) e, se os vetores originais foram salvos junto, reordena
+os melhores candidatos com eles em precisão total (lidos por mmap, sem ocupar RAM).
+"""
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Sequence
+
+import numpy as np
+
+QUANTIZED_FILENAME = "quantized_vectors.npz"
+FULL_PRECISION_FILENAME = "vectors_f32.npy"
+
+QUANTIZED_DTYPES = ("float16", "int8")
+
+# Linhas convertidas para float32 por vez no cálculo dos scores
+_BLOCK_ROWS = 4096
+
+
+def _normalized_matrix(vectors: Sequence[Sequence[float]]) -> np.ndarray:
+    matrix = np.asarray(vectors, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return np.ascontiguousarray(matrix / norms)
+
+
+@dataclass(slots=True, kw_only=True)
+class QuantizedVectors:
+    dtype: str
+    node_ids: list[str]
+    codes: np.ndarray
+    scales: Optional[np.ndarray] = None  # só int8
+    full: Optional[np.ndarray] = None  # vetores float32 normalizados, para o rescore
+    # Com rescore, candidatos pontuados nos códigos = top_k * rescore_factor
+    rescore_factor: int = 4
+    _positions: dict[str, int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        self._positions = {node_id: position for position, node_id in enumerate(self.node_ids)}
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def nbytes(self) -> int:
+        """Memória dos vetores quantizados (sem o arquivo de precisão total, que fica em disco)"""
+        return self.codes.nbytes + (self.scales.nbytes if self.scales is not None else 0)
+
+    @classmethod
+    def build(
+        cls, dtype: str, embeddings: dict[str, Sequence[float]], keep_full_precision: bool = False
+    ) -> "QuantizedVectors":
+        """embeddings: node_id -> vetor (o embedding_dict do SimpleVectorStore)"""
+        if dtype not in QUANTIZED_DTYPES:
+            raise ValueError(f"Tipo de quantização inválido: {dtype}")
+        node_ids = list(embeddings)
+        matrix = _normalized_matrix([embeddings[node_id] for node_id in node_ids])
+
+        scales = None
+        if dtype == "int8":
+            scales = np.abs(matrix).max(axis=1) / 127.0
+            scales[scales == 0] = 1.0
+            codes = np.clip(np.rint(matrix / scales[:, None]), -127, 127).astype(np.int8)
+            scales = scales.astype(np.float32)
+        else:
+            codes = matrix.astype(np.float16)
+
+        return cls(
+            dtype=dtype,
+            node_ids=node_ids,
+            codes=codes,
+            scales=scales,
+            full=matrix if keep_full_precision else None,
+        )
+
+    def dequantized(self, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        codes = self.codes if rows is None else self.codes[rows]
+        matrix = codes.astype(np.float32)
+        if self.scales is not None:
+            matrix *= (self.scales if rows is None else self.scales[rows])[:, None]
+        return matrix
+
+    def vectors_for(self, node_ids: Sequence[str]) -> dict[str, list[float]]:
+        """node_id -> vetor (precisão total se salvo, senão dequantizado) dos ids presentes"""
+        found = [node_id for node_id in node_ids if node_id in self._positions]
+        if not found:
+            return {}
+        rows = np.asarray([self._positions[node_id] for node_id in found], dtype=np.int64)
+        matrix = np.asarray(self.full[rows]) if self.full is not None else self.dequantized(rows)
+        return dict(zip(found, matrix.tolist()))
+
+    def to_embeddings(self) -> dict[str, list[float]]:
+        """node_id -> vetor (dequantizado), para montar um índice ANN"""
+        return dict(zip(self.node_ids, self.dequantized().tolist()))
+
+    def search(
+        self, vector: Sequence[float], top_k: int, allowed_ids: Optional[set[str]] = None
+    ) -> list[tuple[str, float]]:
+        """(node_id, similaridade de cosseno) dos top_k mais próximos, opcionalmente só entre allowed_ids"""
+        rows = None
+        if allowed_ids is not None:
+            rows = np.fromiter(
+                sorted(self._positions[i] for i in allowed_ids if i in self._positions), dtype=np.int64
+            )
+        total = len(self.node_ids) if rows is None else len(rows)
+        if top_k <= 0 or total == 0:
+            return []
+
+        query = _normalized_matrix(vector)[0]
+        scores = self._scores(query, rows)
+
+        candidates_k = min(total, top_k * self.rescore_factor if self.full is not None else top_k)
+        best = np.argpartition(-scores, candidates_k - 1)[:candidates_k]
+        candidate_rows = best if rows is None else rows[best]
+        if self.full is not None:
+            # Rescore em precisão total só dos candidatos (ordenados: leitura sequencial no mmap)
+            candidate_rows = np.sort(candidate_rows)
+            candidate_scores = np.asarray(self.full[candidate_rows]) @ query
+        else:
+            candidate_scores = scores[best]
+
+        order = np.argsort(-candidate_scores)[:top_k]
+        return [(self.node_ids[int(candidate_rows[i])], float(candidate_scores[i])) for i in order]
+
+    def _scores(self, query: np.ndarray, rows: Optional[np.ndarray]) -> np.ndarray:
+        """Produto interno da query (float32) com os códigos, em blocos para limitar a memória"""
+        count = len(self.node_ids) if rows is None else len(rows)
+        scores = np.empty(count, dtype=np.float32)
+        for start in range(0, count, _BLOCK_ROWS):
+            block = slice(start, start + _BLOCK_ROWS)
+            block_rows = None if rows is None else rows[block]
+            codes = self.codes[block] if rows is None else self.codes[block_rows]
+            block_scores = codes.astype(np.float32) @ query
+            if self.scales is not None:
+                block_scores *= self.scales[block] if rows is None else self.scales[block_rows]
+            scores[block] = block_scores
+        return scores
+
+    def save(self, persist_dir: Path) -> None:
+        arrays = {"dtype": np.array(self.dtype), "node_ids": np.array(self.node_ids), "codes": self.codes}
+        if self.scales is not None:
+            arrays["scales"] = self.scales
+        np.savez(persist_dir / QUANTIZED_FILENAME, **arrays)
+        if self.full is not None:
+            np.save(persist_dir / FULL_PRECISION_FILENAME, self.full)
+
+    @classmethod
+    def load(cls, persist_dir: Path, rescore_factor: int = 4, mmap: bool = True) -> "QuantizedVectors | None":
+        """mmap=False quando persist_dir é temporário (índice baixado do blob store)"""
+        path = persist_dir / QUANTIZED_FILENAME
+        if not path.exists():
+            return None
+        with np.load(path) as data:
+            dtype = str(data["dtype"])
+            node_ids = data["node_ids"].tolist()
+            codes = data["codes"]
+            scales = data["scales"] if "scales" in data.files else None
+
+        full = None
+        full_path = persist_dir / FULL_PRECISION_FILENAME
+        if full_path.exists():
+            # Com mmap fica em disco: só as linhas dos candidatos do rescore são lidas
+            full = np.load(full_path, mmap_mode="r" if mmap else None)
+        return cls(
+            dtype=dtype,
+            node_ids=node_ids,
+            codes=codes,
+            scales=scales,
+            full=full,
+            rescore_factor=rescore_factor,
+        )
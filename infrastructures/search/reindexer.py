@@ -0,0 +1,95 @@
+"""
+Reconstrói o índice de texto completo a partir do banco (vagas) e do storage
+(texto extraído dos arquivos dos currículos).
+
+Necessário uma vez depois da migração c4d5e6f7a8b9 e sempre que a forma de
+indexar mudar (ex.: stemmer instalado depois).
+"""
+import asyncio
+import logging
+from dataclasses import dataclass, field
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from application.dtos.search import JOB_DOCUMENT, RESUME_DOCUMENT, SearchDocumentDTO
+from application.interfaces.storage import BlobStoreProtocol
+from application.use_cases.jobs.job import job_search_document
+from infrastructures.ai.text_extractor import extract_text_from_bytes
+from infrastructures.db.mappers.jobs.job_db_mapper import JobDBMapper
+from infrastructures.db.models.jobs.job import JobModel
+from infrastructures.repositories.full_text_search_sqlalchemy import FullTextSearchSqlAlchemy
+from infrastructures.repositories.resume_repository_sqlalchemy import ResumeRepositorySqlAlchemy
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, kw_only=True)
+class ReindexReport:
+    jobs: int = 0
+    resumes: int = 0
+    errors: dict[str, str] = field(default_factory=dict)
+
+    def summary(self) -> str:
+        return f"{self.jobs} vagas e {self.resumes} currículos indexados; {len(self.errors)} erros"
+
+
+class FullTextReindexer:
+    """Apaga e regrava os documentos de busca de vagas e currículos"""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        blob_store: BlobStoreProtocol,
+        batch_size: int = 50,
+    ):
+        self.session_factory = session_factory
+        self.blob_store = blob_store
+        self.batch_size = max(1, batch_size)
+
+    async def run(self) -> ReindexReport:
+        report = ReindexReport()
+
+        async with self.session_factory() as session:
+            mapper = JobDBMapper()
+            jobs = (await session.execute(select(JobModel))).scalars().all()
+            job_documents = [job_search_document(mapper.to_entity(model)) for model in jobs]
+            resumes = await ResumeRepositorySqlAlchemy(session=session).get_all()
+
+        # Texto dos currículos vem dos arquivos (fora da transação)
+        resume_documents: list[SearchDocumentDTO] = []
+        for start in range(0, len(resumes), self.batch_size):
+            batch = resumes[start:start + self.batch_size]
+            contents = await self.blob_store.get_many([r.file_path for r in batch])
+            for resume, item in zip(batch, contents):
+                if not item.ok:
+                    report.errors[str(resume.resume_id)] = item.error
+                    continue
+                text = await asyncio.to_thread(extract_text_from_bytes, item.content, resume.file_name)
+                if not text:
+                    report.errors[str(resume.resume_id)] = "Não foi possível extrair texto"
+                    continue
+                resume_documents.append(
+                    SearchDocumentDTO(
+                        kind=RESUME_DOCUMENT,
+                        doc_id=str(resume.resume_id),
+                        owner_id=str(resume.uploaded_by_user_id),
+                        title=resume.candidate_name,
+                        body=text,
+                    )
+                )
+
+        async with self.session_factory() as session:
+            index = FullTextSearchSqlAlchemy(session=session)
+            await index.clear(JOB_DOCUMENT)
+            await index.clear(RESUME_DOCUMENT)
+            for start in range(0, len(job_documents), self.batch_size):
+                await index.upsert(job_documents[start:start + self.batch_size])
+            for start in range(0, len(resume_documents), self.batch_size):
+                await index.upsert(resume_documents[start:start + self.batch_size])
+            await session.commit()
+
+        report.jobs = len(job_documents)
+        report.resumes = len(resume_documents)
+        logger.info(f"Reindexação de texto completo: {report.summary()}")
+        return report
@@ -0,0 +1,58 @@
+"""
+Análise de texto compartilhada pelas buscas por palavra-chave (índice de texto
+completo no banco e BM25 dos índices vetoriais): palavras em minúsculas, radical
+em português (stemmer do NLTK, quando instalado) e sem acentos.
+"""
+import re
+import unicodedata
+
+try:
+    from nltk.stem.snowball import PortugueseStemmer
+except ImportError:
+    PortugueseStemmer = None
+
+_WORD_RE = re.compile(r"\w+")
+_stemmer = PortugueseStemmer() if PortugueseStemmer is not None else None
+
+# Palavras sem peso para comparar vaga e currículo (já sem acento)
+STOPWORDS = frozenset(
+    "a ao aos as com como da das de do dos e em entre na nas no nos o os ou para pela pelas pelo "
+    "pelos por que se sem sua suas seu seus um uma umas uns ser sera serao sao esta estao ter tem "
+    "mais muito nosso nossa nossos nossas voce voces ja ate apos sobre "
+    "the and or of to in on for with at by an be is are as from this that our you your will".split()
+)
+
+
+def fold(value: str) -> str:
+    """Minúsculas e sem acentos ("Sênior" -> "senior")"""
+    decomposed = unicodedata.normalize("NFKD", value.lower())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def query_terms(query: str) -> list[str]:
+    """Palavras da busca, sem repetição e na ordem digitada"""
+    return list(dict.fromkeys(_WORD_RE.findall(query.lower())))
+
+
+def stem(word: str) -> str:
+    if _stemmer is not None and not word.isdigit():
+        word = _stemmer.stem(word)
+    return fold(word)
+
+
+def analyze(value: str) -> list[str]:
+    """Termos indexáveis do texto, na ordem em que aparecem"""
+    return [stem(word) for word in _WORD_RE.findall(value.lower())]
+
+
+def keywords(value: str) -> set[str]:
+    """Radicais das palavras relevantes do texto (sem stopwords e termos de uma ou duas letras)"""
+    return {
+        stem(word)
+        for word in _WORD_RE.findall(value.lower())
+        if len(word) > 2 and fold(word) not in STOPWORDS
+    }
+
+
+def stem_text(value: str) -> str:
+    return " ".join(analyze(value))
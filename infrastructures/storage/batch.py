@@ -0,0 +1,58 @@
+"""Execução de operações de storage em lote com concorrência limitada e resultado por arquivo."""
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from application.dtos.storage import StorageItemResultDTO
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+def _to_result(name: str, value: Any) -> StorageItemResultDTO:
+    # Uploads devolvem a chave/localização; downloads devolvem o conteúdo
+    if isinstance(value, (bytes, bytearray)):
+        return StorageItemResultDTO(name=name, location=name, content=bytes(value))
+    return StorageItemResultDTO(name=name, location=value)
+
+
+async def gather_bounded(
+    jobs: list[tuple[str, Callable[[], Awaitable[Any]]]],
+    limit: int = DEFAULT_MAX_CONCURRENCY,
+) -> list[StorageItemResultDTO]:
+    """Executa as corrotinas com no máximo `limit` simultâneas; falhas não interrompem o lote."""
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def _run(name: str, factory: Callable[[], Awaitable[Any]]) -> StorageItemResultDTO:
+        async with semaphore:
+            try:
+                value = await factory()
+            except Exception as e:
+                logger.error(f"Falha na operação em lote para {name}: {e}")
+                return StorageItemResultDTO(name=name, error=str(e))
+        return _to_result(name, value)
+
+    return list(await asyncio.gather(*(_run(name, factory) for name, factory in jobs)))
+
+
+def run_bounded(
+    jobs: list[tuple[str, Callable[[], Any]]],
+    limit: int = DEFAULT_MAX_CONCURRENCY,
+) -> list[StorageItemResultDTO]:
+    """Versão síncrona (clientes bloqueantes como o boto3) usando um pool de threads limitado."""
+    if not jobs:
+        return []
+
+    def _run(job: tuple[str, Callable[[], Any]]) -> StorageItemResultDTO:
+        name, func = job
+        try:
+            return _to_result(name, func())
+        except Exception as e:
+            logger.error(f"Falha na operação em lote para {name}: {e}")
+            return StorageItemResultDTO(name=name, error=str(e))
+
+    with ThreadPoolExecutor(max_workers=max(1, min(limit, len(jobs)))) as executor:
+        return list(executor.map(_run, jobs))
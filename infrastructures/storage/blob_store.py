@@ -0,0 +1,252 @@
+"""
+Armazenamento endereçado por conteúdo (SHA-256) sobre os backends existentes
+(local, SQLite, HTTP/PythonAnywhere e S3).
+
+Os blobs são gravados como <extensão>/<sha256>.<extensão>[.zst]; o mesmo conteúdo
+enviado duas vezes (mesmo por usuários diferentes) reutiliza a cópia já armazenada.
+A contagem de referências fica na tabela blob_refs do banco da aplicação.
+"""
+import asyncio
+import hashlib
+import inspect
+import logging
+import re
+from typing import Optional
+
+from application.dtos.storage import StorageItemResultDTO
+from application.interfaces.storage import BlobStoreProtocol
+from infrastructures.repositories.blob_ref_repository_sqlalchemy import BlobRefRepositorySqlAlchemy
+
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+
+logger = logging.getLogger(__name__)
+
+ZSTD_SUFFIX = ".zst"
+ZSTD_LEVEL = 10
+
+# Extensões que compensam comprimir (PDF/DOCX já são comprimidos)
+COMPRESSIBLE_EXTENSIONS = {"json", "txt", "csv", "md", "zip"}
+
+_DIGEST_RE = re.compile(r"^([0-9a-f]{64})\.")
+
+
+def compute_digest(content: bytes) -> str:
+    """SHA-256 (hex) do conteúdo original"""
+    return hashlib.sha256(content).hexdigest()
+
+
+def digest_from_location(location: str) -> Optional[str]:
+    """Extrai o SHA-256 de uma localização gerada pelo blob store (None para caminhos antigos)"""
+    name = location.replace("\\", "/").rsplit("/", 1)[-1]
+    match = _DIGEST_RE.match(name)
+    return match.group(1) if match else None
+
+
+class ContentAddressedBlobStore(BlobStoreProtocol):
+    """Blob store com deduplicação por SHA-256, contagem de referências e zstd opcional"""
+
+    def __init__(
+        self,
+        backend: object,
+        refs: BlobRefRepositorySqlAlchemy,
+        location_prefix: str = "",
+    ):
+        """
+        Args:
+            backend: LocalFileStorageService, SQLiteFileStorageService, HTTPFileStorageService ou S3StorageService
+            refs: Repositório da contagem de referências
+            location_prefix: Prefixo adicionado à chave devolvida pelo backend (ex.: "s3://")
+        """
+        self.backend = backend
+        self.refs = refs
+        self.location_prefix = location_prefix
+
+    async def put(self, content: bytes, extension: str, compress: bool | None = None) -> str:
+        ext_clean = extension.replace('.', '').lower()
+        digest = compute_digest(content)
+
+        # Conteúdo idêntico já armazenado: só incrementa a referência (atômico com o release)
+        existing = await self.refs.acquire_existing(digest)
+        if existing is not None:
+            logger.info(f"Blob {digest[:12]} já armazenado, upload ignorado ({len(content)} bytes)")
+            return existing["location"]
+
+        payload, compression = self._maybe_compress(content, ext_clean, compress)
+        filename = f"{digest}.{ext_clean}" + (ZSTD_SUFFIX if compression else "")
+        key = await self._call("upload_file", filename, payload, ext_clean)
+        location = f"{self.location_prefix}{key}"
+
+        await self.refs.acquire(digest, location, len(content), len(payload), compression)
+        logger.info(
+            f"Blob {digest[:12]} armazenado em {location} "
+            f"({len(content)} -> {len(payload)} bytes, compressão: {compression or 'nenhuma'})"
+        )
+        return location
+
+    async def put_many(self, files: list[tuple[str, bytes, str]]) -> list[StorageItemResultDTO]:
+        """
+        Versão em lote do put: incremento condicional (acquire_existing) por arquivo,
+        um upload_many no backend só para o que não estava em uso (uma transação no
+        SQLite, requisições paralelas limitadas no HTTP/S3) e o registro das
+        referências novas em uma única transação.
+        """
+        digests = [compute_digest(content) for _, content, _ in files]
+
+        # Como no put: o conteúdo só é reaproveitado se o UPDATE condicional acertar,
+        # senão um release concorrente poderia apagar o arquivo entre a consulta e o incremento
+        stored: dict[str, dict] = {}
+        reused = 0
+        pending: dict[str, tuple[str, bytes, str, int, Optional[str]]] = {}
+        to_acquire: list[str] = []  # uma entrada por arquivo que depende do upload
+        for (name, content, extension), digest in zip(files, digests):
+            if digest in pending:
+                to_acquire.append(digest)
+                continue
+            existing = await self.refs.acquire_existing(digest)
+            if existing is not None:
+                stored.setdefault(digest, existing)
+                reused += 1
+                continue
+            ext_clean = extension.replace('.', '').lower()
+            payload, compression = self._maybe_compress(content, ext_clean, None)
+            filename = f"{digest}.{ext_clean}" + (ZSTD_SUFFIX if compression else "")
+            pending[digest] = (filename, payload, ext_clean, len(content), compression)
+            to_acquire.append(digest)
+
+        errors: dict[str, str] = {}
+        if pending:
+            uploads = await self._call(
+                "upload_many",
+                [(filename, payload, ext) for filename, payload, ext, _, _ in pending.values()],
+            )
+            for (digest, (_, payload, _, size, compression)), result in zip(pending.items(), uploads):
+                if result.ok:
+                    stored[digest] = {
+                        "location": f"{self.location_prefix}{result.location}",
+                        "size": size,
+                        "stored_size": len(payload),
+                        "compression": compression,
+                    }
+                else:
+                    errors[digest] = result.error
+
+        # Os reaproveitados já foram contados pelo acquire_existing
+        acquired = [
+            (digest, stored[digest]["location"], stored[digest]["size"],
+             stored[digest]["stored_size"], stored[digest]["compression"])
+            for digest in to_acquire
+            if digest in stored
+        ]
+        await self.refs.acquire_many(acquired)
+
+        logger.info(
+            f"Lote de {len(files)} blobs: {len(pending) - len(errors)} gravados, "
+            f"{reused} já existentes, {len(errors)} com erro"
+        )
+        return [
+            StorageItemResultDTO(name=name, location=stored[digest]["location"])
+            if digest in stored
+            else StorageItemResultDTO(name=name, error=errors.get(digest, "Falha no upload"))
+            for (name, _, _), digest in zip(files, digests)
+        ]
+
+    async def get(self, location: str) -> bytes:
+        payload = await self._call("download_file", self._backend_key(location))
+        if location.endswith(ZSTD_SUFFIX):
+            return self._decompress(payload)
+        return payload
+
+    async def get_many(self, locations: list[str]) -> list[StorageItemResultDTO]:
+        """Versão em lote do get, com resultado por localização"""
+        results = await self._call("download_many", [self._backend_key(loc) for loc in locations])
+        items = []
+        for location, result in zip(locations, results):
+            if not result.ok:
+                items.append(StorageItemResultDTO(name=location, error=result.error))
+                continue
+            content = result.content
+            if location.endswith(ZSTD_SUFFIX):
+                try:
+                    content = self._decompress(content)
+                except Exception as e:
+                    items.append(StorageItemResultDTO(name=location, error=str(e)))
+                    continue
+            items.append(StorageItemResultDTO(name=location, location=location, content=content))
+        return items
+
+    async def get_by_digest(self, digest: str) -> bytes:
+        ref = await self.refs.get(digest)
+        if ref is None:
+            raise FileNotFoundError(f"Blob não encontrado: {digest}")
+        return await self.get(ref["location"])
+
+    async def list_blobs(self) -> list[dict]:
+        files = await self._call("list_files")
+        return [{**item, "location": f"{self.location_prefix}{item['key']}"} for item in files]
+
+    async def delete_many(self, locations: list[str]) -> list[StorageItemResultDTO]:
+        results = await self._call("delete_many", [self._backend_key(loc) for loc in locations])
+        return [
+            StorageItemResultDTO(name=location, location=location if result.ok else None, error=result.error)
+            for location, result in zip(locations, results)
+        ]
+
+    async def compact(self) -> None:
+        # Só o backend SQLite precisa (VACUUM); nos demais o espaço é liberado na remoção
+        if hasattr(self.backend, "vacuum"):
+            await self.backend.vacuum()
+
+    def content_digest(self, location: str) -> Optional[str]:
+        return digest_from_location(location)
+
+    async def release(self, location: str) -> bool:
+        digest = digest_from_location(location)
+        if digest is None:
+            # Arquivo salvo antes do blob store (chave por nome): remove diretamente
+            return bool(await self._call("delete_file", self._backend_key(location)))
+
+        remaining = await self.refs.release(digest)
+        if remaining != 0:
+            # Ainda referenciado, ou digest sem registro (não sabemos se está em uso)
+            return False
+        # Um put concorrente do mesmo conteúdo pode ter regravado a mesma chave e registrado
+        # a referência depois do release: nesse caso o arquivo fica (sobras vão para a coleta de lixo)
+        if await self.refs.get(digest) is not None:
+            return False
+        return bool(await self._call("delete_file", self._backend_key(location)))
+
+    async def release_digest(self, digest: str) -> bool:
+        ref = await self.refs.get(digest)
+        if ref is None:
+            return False
+        return await self.release(ref["location"])
+
+    def _maybe_compress(self, content: bytes, ext: str, compress: bool | None) -> tuple[bytes, Optional[str]]:
+        if compress is None:
+            compress = ext in COMPRESSIBLE_EXTENSIONS
+        if not compress or zstd is None:
+            return content, None
+        compressed = zstd.ZstdCompressor(level=ZSTD_LEVEL).compress(content)
+        if len(compressed) >= len(content):
+            return content, None
+        return compressed, "zstd"
+
+    def _decompress(self, payload: bytes) -> bytes:
+        if zstd is None:
+            raise ValueError("Blob comprimido com zstd, mas o pacote 'zstandard' não está instalado")
+        return zstd.ZstdDecompressor().decompressobj().decompress(payload)
+
+    def _backend_key(self, location: str) -> str:
+        if self.location_prefix and location.startswith(self.location_prefix):
+            return location[len(self.location_prefix):]
+        return location
+
+    async def _call(self, method_name: str, *args):
+        """Chama o backend; o S3StorageService é síncrono e roda em thread"""
+        method = getattr(self.backend, method_name)
+        if inspect.iscoroutinefunction(method):
+            return await method(*args)
+        return await asyncio.to_thread(method, *args)
@@ -0,0 +1,22 @@
+"""Content-types dos arquivos armazenados (compartilhado pelos serviços de storage e pelo download)."""
+import mimetypes
+
+CONTENT_TYPES = {
+    '.pdf': 'application/pdf',
+    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    '.doc': 'application/msword',
+    '.txt': 'text/plain; charset=utf-8',
+    '.json': 'application/json',
+    '.zip': 'application/zip',
+}
+
+
+def get_content_type(extension: str) -> str:
+    """Retorna o content-type baseado na extensão (com ou sem ponto)"""
+    if not extension.startswith('.'):
+        extension = f'.{extension}'
+    extension = extension.lower()
+    if extension in CONTENT_TYPES:
+        return CONTENT_TYPES[extension]
+    guessed, _ = mimetypes.guess_type(f"file{extension}")
+    return guessed or 'application/octet-stream'
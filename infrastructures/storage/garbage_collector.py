@@ -0,0 +1,195 @@
+"""
+Coleta de lixo do storage: remove arquivos, arquivos de índice (zip), registros de
+blob_refs e diretórios em vector_store_dir que nenhum currículo referencia mais
+(uploads que falharam no meio, currículos/grupos removidos etc.).
+"""
+import asyncio
+import logging
+import re
+import shutil
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from application.interfaces.storage import BlobStoreProtocol
+from infrastructures.repositories.blob_ref_repository_sqlalchemy import BlobRefRepositorySqlAlchemy
+from infrastructures.repositories.resume_repository_sqlalchemy import ResumeRepositorySqlAlchemy
+from infrastructures.storage.blob_store import digest_from_location
+
+logger = logging.getLogger(__name__)
+
+_DIGEST_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+def _normalize(location: str) -> str:
+    """Mesma normalização do download: barras do Windows e sqlite:/ -> sqlite://"""
+    location = location.replace("\\", "/")
+    if location.startswith("sqlite:/") and not location.startswith("sqlite://"):
+        location = "sqlite://" + location[len("sqlite:"):].lstrip("/")
+    if location.startswith("./"):
+        location = location[2:]
+    return location
+
+
+@dataclass(slots=True, kw_only=True)
+class GarbageCollectionReport:
+    dry_run: bool
+    scanned_files: int = 0
+    orphaned_files: list[str] = field(default_factory=list)
+    orphaned_index_dirs: list[str] = field(default_factory=list)
+    orphaned_refs: int = 0
+    bytes_reclaimed: int = 0
+    errors: dict[str, str] = field(default_factory=dict)
+
+    def summary(self) -> str:
+        action = "seriam removidos" if self.dry_run else "removidos"
+        return (
+            f"{self.scanned_files} arquivos analisados; {action}: "
+            f"{len(self.orphaned_files)} arquivos, {len(self.orphaned_index_dirs)} diretórios de índice, "
+            f"{self.orphaned_refs} registros de blob; {self.bytes_reclaimed} bytes "
+            f"({self.bytes_reclaimed / (1024 * 1024):.2f} MB); {len(self.errors)} erros"
+        )
+
+
+class StorageGarbageCollector:
+    """Cruza resumes.file_path/vector_index_id com o conteúdo do storage e remove o que sobrou"""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        blob_store: BlobStoreProtocol,
+        vector_store_dir: Path,
+        batch_size: int = 100,
+        min_age: timedelta = timedelta(hours=1),
+    ):
+        """
+        Args:
+            min_age: Objetos mais novos que isso nunca são removidos (protege uploads em andamento,
+                que gravam o arquivo antes de inserir o currículo no banco)
+        """
+        self.session_factory = session_factory
+        self.blob_store = blob_store
+        self.refs = BlobRefRepositorySqlAlchemy(session_factory=session_factory)
+        self.vector_store_dir = Path(vector_store_dir)
+        self.batch_size = max(1, batch_size)
+        self.min_age = min_age
+
+    async def run(self, dry_run: bool = False) -> GarbageCollectionReport:
+        report = GarbageCollectionReport(dry_run=dry_run)
+        cutoff = datetime.now(timezone.utc) - self.min_age
+
+        async with self.session_factory() as session:
+            repository = ResumeRepositorySqlAlchemy(session=session)
+            file_paths = await repository.get_all_file_paths()
+            index_ids = await repository.get_all_vector_index_ids()
+
+        referenced_locations = {_normalize(path) for path in file_paths}
+        referenced_digests = {d for d in (digest_from_location(p) for p in referenced_locations) if d}
+        referenced_index_ids = set(index_ids)
+        for index_id in referenced_index_ids:
+            if _DIGEST_RE.match(index_id):
+                referenced_digests.add(index_id)
+            else:
+                # Índices antigos salvos por nome
+                referenced_locations.add(f"sqlite://zip/{index_id}.zip")
+                referenced_locations.add(f"zip/{index_id}.zip")
+
+        # Referência mexida há pouco (put/release em andamento): o blob conta como em uso
+        refs = await self.refs.get_all()
+        referenced_digests.update(
+            ref["digest"] for ref in refs if not self._older_than(ref["updated_at"], cutoff)
+        )
+
+        def _is_referenced(location: str) -> bool:
+            location = _normalize(location)
+            digest = digest_from_location(location)
+            return location in referenced_locations or (digest is not None and digest in referenced_digests)
+
+        # 1. Arquivos no storage
+        try:
+            stored = await self.blob_store.list_blobs()
+        except NotImplementedError as e:
+            logger.warning(f"Storage não permite listagem, arquivos não verificados: {e}")
+            stored = []
+        report.scanned_files = len(stored)
+
+        orphans = [
+            item for item in stored
+            if not _is_referenced(item["location"])
+            and (item.get("modified_at") is None or item["modified_at"] <= cutoff)
+        ]
+        await self._delete_files(orphans, report)
+
+        # 2. Registros de blob_refs sem currículo/índice que os use
+        stale_refs = [ref["digest"] for ref in refs if ref["digest"] not in referenced_digests]
+        report.orphaned_refs = len(stale_refs)
+        if stale_refs and not dry_run:
+            for start in range(0, len(stale_refs), self.batch_size):
+                await self.refs.delete_many(stale_refs[start:start + self.batch_size])
+
+        # 3. Diretórios de índice locais
+        await self._delete_index_dirs(referenced_index_ids, cutoff, report)
+
+        if not dry_run and report.orphaned_files:
+            await self.blob_store.compact()
+
+        logger.info(f"Coleta de lixo do storage: {report.summary()}")
+        return report
+
+    async def _delete_files(self, orphans: list[dict], report: GarbageCollectionReport) -> None:
+        for start in range(0, len(orphans), self.batch_size):
+            batch = orphans[start:start + self.batch_size]
+            if report.dry_run:
+                report.orphaned_files.extend(item["location"] for item in batch)
+                report.bytes_reclaimed += sum(item.get("size") or 0 for item in batch)
+                continue
+
+            sizes = {item["location"]: item.get("size") or 0 for item in batch}
+            for result in await self.blob_store.delete_many(list(sizes)):
+                if result.ok:
+                    report.orphaned_files.append(result.name)
+                    report.bytes_reclaimed += sizes[result.name]
+                else:
+                    report.errors[result.name] = result.error
+
+    async def _delete_index_dirs(
+        self,
+        referenced_index_ids: set[str],
+        cutoff: datetime,
+        report: GarbageCollectionReport,
+    ) -> None:
+        if not self.vector_store_dir.exists():
+            return
+
+        def _scan() -> list[tuple[Path, int]]:
+            found = []
+            for directory in self.vector_store_dir.iterdir():
+                if not directory.is_dir() or directory.name in referenced_index_ids:
+                    continue
+                modified = datetime.fromtimestamp(directory.stat().st_mtime, tz=timezone.utc)
+                if modified > cutoff:
+                    continue
+                size = sum(f.stat().st_size for f in directory.rglob('*') if f.is_file())
+                found.append((directory, size))
+            return found
+
+        for directory, size in await asyncio.to_thread(_scan):
+            if not report.dry_run:
+                try:
+                    await asyncio.to_thread(shutil.rmtree, directory)
+                except OSError as e:
+                    report.errors[str(directory)] = str(e)
+                    continue
+            report.orphaned_index_dirs.append(str(directory))
+            report.bytes_reclaimed += size
+
+    @staticmethod
+    def _older_than(value: Optional[datetime], cutoff: datetime) -> bool:
+        if value is None:
+            return True
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value <= cutoff
@@ -0,0 +1,126 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from application.dtos.storage import StorageItemResultDTO
+from infrastructures.storage.batch import DEFAULT_MAX_CONCURRENCY, gather_bounded
+
+logger = logging.getLogger(__name__)
+
+
+class LocalFileStorageService:
+    """Serviço para armazenamento de arquivos no disco local (fallback sem SQLite/S3)"""
+
+    def __init__(self, storage_dir: Path):
+        self.storage_dir = Path(storage_dir)
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+
+    async def upload_file(self, filename: str, content: bytes, extension: str) -> str:
+        """
+        Grava o arquivo em <storage_dir>/<extensão>/<filename>
+
+        Returns:
+            String com o caminho do arquivo gravado
+        """
+        ext_clean = extension.replace('.', '')
+        file_path = self.storage_dir / ext_clean / filename
+
+        def _write():
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_bytes(content)
+
+        try:
+            await asyncio.to_thread(_write)
+            logger.info(f"Arquivo gravado localmente: {file_path}")
+            return str(file_path)
+        except OSError as e:
+            logger.error(f"Erro ao gravar arquivo {filename}: {e}")
+            raise ValueError(f"Falha no upload: {e}")
+
+    async def upload_many(self, files: list[tuple[str, bytes, str]]) -> list[StorageItemResultDTO]:
+        """Grava vários arquivos em paralelo, com resultado por arquivo"""
+        return await gather_bounded(
+            [(filename, lambda f=filename, c=content, e=extension: self.upload_file(f, c, e))
+             for filename, content, extension in files],
+            DEFAULT_MAX_CONCURRENCY,
+        )
+
+    async def download_many(self, file_keys: list[str]) -> list[StorageItemResultDTO]:
+        """Lê vários arquivos em paralelo, com resultado por arquivo"""
+        return await gather_bounded(
+            [(key, lambda k=key: self.download_file(k)) for key in file_keys],
+            DEFAULT_MAX_CONCURRENCY,
+        )
+
+    async def download_file(self, file_key: str) -> bytes:
+        """Lê o conteúdo de um arquivo local"""
+        file_path = self._resolve(file_key)
+        if not file_path.is_file():
+            raise FileNotFoundError(f"Arquivo não encontrado: {file_key}")
+        return await asyncio.to_thread(file_path.read_bytes)
+
+    async def file_exists(self, file_key: str) -> bool:
+        """Verifica se um arquivo existe no disco"""
+        return self._resolve(file_key).is_file()
+
+    async def delete_file(self, file_key: str) -> bool:
+        """Remove um arquivo do disco"""
+        file_path = self._resolve(file_key)
+        try:
+            file_path.unlink()
+            logger.info(f"Arquivo deletado com sucesso: {file_path}")
+            return True
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            logger.error(f"Erro ao deletar arquivo {file_key}: {e}")
+            return False
+
+    async def get_file_info(self, file_key: str) -> Optional[dict]:
+        """Obtém informações do arquivo (sem o conteúdo)"""
+        file_path = self._resolve(file_key)
+        if not file_path.is_file():
+            return None
+        stat = file_path.stat()
+        return {
+            "filename": file_path.name,
+            "file_size": stat.st_size,
+            "updated_at": stat.st_mtime,
+        }
+
+    async def list_files(self) -> list[dict]:
+        """Lista todos os arquivos sob storage_dir (key, size e modified_at)"""
+        def _list():
+            files = []
+            for path in self.storage_dir.rglob('*'):
+                if path.is_file():
+                    stat = path.stat()
+                    files.append({
+                        "key": str(path),
+                        "size": stat.st_size,
+                        "modified_at": datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
+                    })
+            return files
+
+        return await asyncio.to_thread(_list)
+
+    async def delete_many(self, file_keys: list[str]) -> list[StorageItemResultDTO]:
+        """Deleta vários arquivos, com resultado por arquivo"""
+        async def _delete(key: str) -> str:
+            if not await self.delete_file(key):
+                raise FileNotFoundError(f"Arquivo não encontrado: {key}")
+            return key
+
+        return await gather_bounded(
+            [(key, lambda k=key: _delete(k)) for key in file_keys],
+            DEFAULT_MAX_CONCURRENCY,
+        )
+
+    def _resolve(self, file_key: str) -> Path:
+        """Aceita tanto o caminho devolvido por upload_file quanto a chave relativa (pdf/arquivo.pdf)"""
+        path = Path(file_key)
+        if path.is_absolute() or path.parts[:len(self.storage_dir.parts)] == self.storage_dir.parts:
+            return path
+        return self.storage_dir / path
@@ -5,6 +5,10 @@ from botocore.exceptions import ClientError, NoCredentialsError
 import logging
 from io import BytesIO
 
+from application.dtos.storage import StorageItemResultDTO
+from infrastructures.storage.content_types import get_content_type
+from infrastructures.storage.batch import DEFAULT_MAX_CONCURRENCY, run_bounded
+
 logger = logging.getLogger(__name__)
 
 class S3StorageService:
@@ -17,10 +21,12 @@ class S3StorageService:
         access_key: str,
         secret_key: str,
         bucket_name: str,
-        folder_prefix: str = "uploaded_files"
+        folder_prefix: str = "uploaded_files",
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY
     ):
         self.bucket_name = bucket_name
         self.folder_prefix = folder_prefix
+        self.max_concurrency = max_concurrency
         
         # Configura o cliente S3 para DigitalOcean Spaces
         self.s3_client = boto3.client(
@@ -83,6 +89,29 @@ class S3StorageService:
         except ClientError as e:
             logger.error(f"Erro ao fazer upload do arquivo {filename}: {e}")
             raise ValueError(f"Falha no upload: {e}")
+
+    def upload_many(self, files: list[tuple[str, bytes, str]]) -> list[StorageItemResultDTO]:
+        """
+        Upload de vários arquivos em paralelo (no máximo max_concurrency por vez)
+
+        Args:
+            files: Lista de (filename, content, extension)
+
+        Returns:
+            Um resultado por arquivo, na mesma ordem (location = chave S3 ou error)
+        """
+        return run_bounded(
+            [(filename, lambda f=filename, c=content, e=extension: self.upload_file(f, c, e))
+             for filename, content, extension in files],
+            self.max_concurrency,
+        )
+
+    def download_many(self, s3_keys: list[str]) -> list[StorageItemResultDTO]:
+        """Download de vários arquivos em paralelo, com resultado por arquivo"""
+        return run_bounded(
+            [(key, lambda k=key: self.download_file(k)) for key in s3_keys],
+            self.max_concurrency,
+        )
     
     def download_file(self, s3_key: str) -> bytes:
         """
@@ -122,16 +151,41 @@ class S3StorageService:
             logger.error(f"Erro ao deletar arquivo {s3_key}: {e}")
             return False
     
+    def list_files(self) -> list[dict]:
+        """Lista os objetos sob folder_prefix (key, size e modified_at), paginando"""
+        files = []
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=f"{self.folder_prefix}/"):
+            for obj in page.get('Contents', []):
+                files.append({
+                    "key": obj['Key'],
+                    "size": obj['Size'],
+                    "modified_at": obj['LastModified'],
+                })
+        return files
+
+    def delete_many(self, s3_keys: list[str]) -> list[StorageItemResultDTO]:
+        """Deleta vários objetos com delete_objects (até 1000 chaves por requisição)"""
+        results = []
+        for start in range(0, len(s3_keys), 1000):
+            chunk = s3_keys[start:start + 1000]
+            try:
+                response = self.s3_client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={'Objects': [{'Key': key} for key in chunk], 'Quiet': True}
+                )
+            except ClientError as e:
+                logger.error(f"Erro ao deletar {len(chunk)} objetos em lote: {e}")
+                results.extend(StorageItemResultDTO(name=key, error=str(e)) for key in chunk)
+                continue
+            errors = {err['Key']: err.get('Message', 'Erro') for err in response.get('Errors', [])}
+            results.extend(
+                StorageItemResultDTO(name=key, error=errors[key]) if key in errors
+                else StorageItemResultDTO(name=key, location=key)
+                for key in chunk
+            )
+        return results
+
     def _get_content_type(self, extension: str) -> str:
         """Retorna o content-type baseado na extensão"""
-        content_types = {
-            '.pdf': 'application/pdf',
-            '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-            '.doc': 'application/msword',
-            '.txt': 'text/plain'
-        }
-        
-        if not extension.startswith('.'):
-            extension = f'.{extension}'
-            
-        return content_types.get(extension.lower(), 'application/octet-stream')
\ No newline at end of file
+        return get_content_type(extension)
\ No newline at end of file
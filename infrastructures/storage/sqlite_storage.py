@@ -2,14 +2,31 @@ import sqlite3
 import logging
 from pathlib import Path
 from typing import Optional, Tuple
-from datetime import datetime
+from datetime import datetime, timezone
 import asyncio
 import aiosqlite
 import base64
 import httpx
 
+from application.dtos.storage import StorageItemResultDTO
+from infrastructures.storage.content_types import get_content_type
+from infrastructures.storage.batch import DEFAULT_MAX_CONCURRENCY, gather_bounded
+
 logger = logging.getLogger(__name__)
 
+
+def _parse_timestamp(value) -> Optional[datetime]:
+    """Converte o CURRENT_TIMESTAMP do SQLite (UTC, sem fuso) para datetime com fuso"""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
 class SQLiteFileStorageService:
     """Serviço para armazenamento de arquivos como BLOBs no SQLite"""
     
@@ -86,7 +103,68 @@ class SQLiteFileStorageService:
         except Exception as e:
             logger.error(f"Erro ao fazer upload do arquivo {filename}: {e}")
             raise ValueError(f"Falha no upload: {e}")
-    
+
+    async def upload_many(self, files: list[tuple[str, bytes, str]]) -> list[StorageItemResultDTO]:
+        """
+        Upload de vários arquivos em uma única transação (executemany)
+
+        Args:
+            files: Lista de (filename, content, extension)
+
+        Returns:
+            Um resultado por arquivo, na mesma ordem. Como é uma transação só,
+            ou todos são gravados ou todos são reportados com o mesmo erro.
+        """
+        if not files:
+            return []
+        await self._ensure_initialized()
+
+        rows = []
+        for filename, content, extension in files:
+            file_key = f"{extension.replace('.', '')}/{filename}"
+            rows.append((file_key, filename, self._get_content_type(extension), len(content), content))
+
+        try:
+            async with aiosqlite.connect(self.database_url) as db:
+                await db.executemany("""
+                    INSERT OR REPLACE INTO file_storage
+                    (file_key, filename, content_type, file_size, file_content, updated_at)
+                    VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                """, rows)
+                await db.commit()
+        except Exception as e:
+            logger.error(f"Erro ao fazer upload em lote de {len(files)} arquivos: {e}")
+            return [StorageItemResultDTO(name=row[1], error=f"Falha no upload: {e}") for row in rows]
+
+        logger.info(f"{len(rows)} arquivos enviados para SQLite em uma transação")
+        return [StorageItemResultDTO(name=row[1], location=f"sqlite://{row[0]}") for row in rows]
+
+    async def download_many(self, file_keys: list[str]) -> list[StorageItemResultDTO]:
+        """Download de vários arquivos com um único SELECT ... IN (...)"""
+        if not file_keys:
+            return []
+        await self._ensure_initialized()
+
+        keys = [k[9:] if k.startswith("sqlite://") else k for k in file_keys]
+        try:
+            async with aiosqlite.connect(self.database_url) as db:
+                placeholders = ", ".join("?" for _ in keys)
+                cursor = await db.execute(
+                    f"SELECT file_key, file_content FROM file_storage WHERE file_key IN ({placeholders})",
+                    keys,
+                )
+                found = {row[0]: row[1] for row in await cursor.fetchall()}
+        except Exception as e:
+            logger.error(f"Erro ao fazer download em lote de {len(keys)} arquivos: {e}")
+            return [StorageItemResultDTO(name=k, error=f"Falha no download: {e}") for k in file_keys]
+
+        return [
+            StorageItemResultDTO(name=original, location=original, content=found[key])
+            if key in found
+            else StorageItemResultDTO(name=original, error=f"Arquivo não encontrado: {key}")
+            for original, key in zip(file_keys, keys)
+        ]
+
     async def download_file(self, file_key: str) -> bytes:
         """
         Download de arquivo do SQLite
@@ -206,25 +284,51 @@ class SQLiteFileStorageService:
             logger.error(f"Erro ao obter informações do arquivo {file_key}: {e}")
             return None
     
+    async def list_files(self) -> list[dict]:
+        """Lista todos os arquivos (sem conteúdo): key, size e modified_at"""
+        await self._ensure_initialized()
+        async with aiosqlite.connect(self.database_url) as db:
+            cursor = await db.execute("SELECT file_key, file_size, updated_at FROM file_storage")
+            rows = await cursor.fetchall()
+        return [
+            {"key": f"sqlite://{row[0]}", "size": row[1], "modified_at": _parse_timestamp(row[2])}
+            for row in rows
+        ]
+
+    async def delete_many(self, file_keys: list[str]) -> list[StorageItemResultDTO]:
+        """Deleta vários arquivos com um único DELETE ... IN (...)"""
+        if not file_keys:
+            return []
+        await self._ensure_initialized()
+
+        keys = [k[9:] if k.startswith("sqlite://") else k for k in file_keys]
+        try:
+            async with aiosqlite.connect(self.database_url) as db:
+                placeholders = ", ".join("?" for _ in keys)
+                await db.execute(f"DELETE FROM file_storage WHERE file_key IN ({placeholders})", keys)
+                await db.commit()
+        except Exception as e:
+            logger.error(f"Erro ao deletar {len(keys)} arquivos em lote: {e}")
+            return [StorageItemResultDTO(name=k, error=str(e)) for k in file_keys]
+        return [StorageItemResultDTO(name=k, location=k) for k in file_keys]
+
+    async def vacuum(self) -> None:
+        """Compacta o arquivo SQLite depois de remoções grandes (o espaço só volta ao disco com VACUUM)"""
+        await self._ensure_initialized()
+        async with aiosqlite.connect(self.database_url) as db:
+            await db.execute("VACUUM")
+        logger.info(f"VACUUM concluído: {self.database_url}")
+
     def _get_content_type(self, extension: str) -> str:
         """Retorna o content-type baseado na extensão"""
-        content_types = {
-            '.pdf': 'application/pdf',
-            '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-            '.doc': 'application/msword',
-            '.txt': 'text/plain'
-        }
-        
-        if not extension.startswith('.'):
-            extension = f'.{extension}'
-            
-        return content_types.get(extension.lower(), 'application/octet-stream')
+        return get_content_type(extension)
 
 class HTTPFileStorageService:
     """Serviço para armazenamento de arquivos via HTTP API no PythonAnywhere"""
     
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
         self.base_url = base_url.rstrip('/')
+        self.max_concurrency = max_concurrency
         self.client = httpx.AsyncClient(timeout=30.0)
         self._initialized = False
     
@@ -283,7 +387,24 @@ class HTTPFileStorageService:
         except Exception as e:
             logger.error(f"Erro ao fazer upload do arquivo {filename}: {e}")
             raise ValueError(f"Falha no upload via HTTP: {e}")
-    
+
+    async def upload_many(self, files: list[tuple[str, bytes, str]]) -> list[StorageItemResultDTO]:
+        """Upload concorrente (limitado a max_concurrency requisições) com resultado por arquivo"""
+        await self._ensure_initialized()
+        return await gather_bounded(
+            [(filename, lambda f=filename, c=content, e=extension: self.upload_file(f, c, e))
+             for filename, content, extension in files],
+            self.max_concurrency,
+        )
+
+    async def download_many(self, file_keys: list[str]) -> list[StorageItemResultDTO]:
+        """Download concorrente (limitado a max_concurrency requisições) com resultado por arquivo"""
+        await self._ensure_initialized()
+        return await gather_bounded(
+            [(key, lambda k=key: self.download_file(k)) for key in file_keys],
+            self.max_concurrency,
+        )
+
     async def download_file(self, file_key: str) -> bytes:
         """Download de arquivo via HTTP do PythonAnywhere"""
         await self._ensure_initialized()
@@ -344,16 +465,41 @@ class HTTPFileStorageService:
             logger.error(f"Erro ao deletar arquivo {file_key}: {e}")
             return False
     
+    async def list_files(self) -> list[dict]:
+        """
+        Lista os arquivos via GET /files (key, size e modified_at quando a API informa).
+        Levanta NotImplementedError se a API não expõe a listagem.
+        """
+        await self._ensure_initialized()
+        response = await self.client.get(f"{self.base_url}/files")
+        if response.status_code in (404, 405):
+            raise NotImplementedError("A API de arquivos não suporta listagem (GET /files)")
+        response.raise_for_status()
+        data = response.json()
+        items = data.get("files", []) if isinstance(data, dict) else data
+        return [
+            {
+                "key": f"sqlite://{item['file_key']}",
+                "size": item.get("file_size", 0),
+                "modified_at": _parse_timestamp(item.get("updated_at") or item.get("created_at")),
+            }
+            for item in items
+        ]
+
+    async def delete_many(self, file_keys: list[str]) -> list[StorageItemResultDTO]:
+        """Deleta vários arquivos em paralelo (limitado a max_concurrency requisições)"""
+        await self._ensure_initialized()
+
+        async def _delete(key: str) -> str:
+            if not await self.delete_file(key):
+                raise ValueError(f"Falha ao deletar {key}")
+            return key
+
+        return await gather_bounded(
+            [(key, lambda k=key: _delete(k)) for key in file_keys],
+            self.max_concurrency,
+        )
+
     def _get_content_type(self, extension: str) -> str:
         """Retorna o content-type baseado na extensão"""
-        content_types = {
-            '.pdf': 'application/pdf',
-            '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-            '.doc': 'application/msword',
-            '.txt': 'text/plain'
-        }
-        
-        if not extension.startswith('.'):
-            extension = f'.{extension}'
-            
-        return content_types.get(extension.lower(), 'application/octet-stream')
\ No newline at end of file
+        return get_content_type(extension)
\ No newline at end of file
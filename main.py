@@ -1,5 +1,6 @@
 import os
 import json
+import asyncio
 import warnings
 
 # Try to load dotenv, but make it optional for Hugging Face Spaces
@@ -25,6 +26,7 @@ from config.ioc.di import get_providers
 from config.logging import setup_logging
 from config.ai_config import setup_ai_services, validate_ai_config
 from presentation.api.rest.error_handling import setup_exception_handlers
+from presentation.api.rest.middlewares import DBPoolUsageMiddleware
 from presentation.api.rest.v1.routers import api_v1_router
 
 setup_logging()
@@ -95,9 +97,38 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         logger.error(f"Failed to initialize AI services: {e}")
         raise
     
+    gc_task = _start_storage_gc(app)
+    
     yield
     
     logger.info("Shutting down application...")
+    if gc_task:
+        gc_task.cancel()
+
+
+def _start_storage_gc(app: FastAPI) -> "asyncio.Task | None":
+    """Agenda a coleta de lixo do storage se STORAGE_GC_INTERVAL_HOURS > 0"""
+    from config.ai.ai import AISettings
+    from infrastructures.storage.garbage_collector import StorageGarbageCollector
+    
+    interval_hours = AISettings().storage_gc_interval_hours
+    if interval_hours <= 0:
+        return None
+    
+    async def _loop() -> None:
+        while True:
+            await asyncio.sleep(interval_hours * 3600)
+            try:
+                collector = await app.state.dishka_container.get(StorageGarbageCollector)
+                report = await collector.run()
+                logger.info(f"Storage GC: {report.summary()}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Storage GC failed: {e}")
+    
+    logger.info(f"Storage GC scheduled every {interval_hours}h")
+    return asyncio.create_task(_loop())
 
 
 def create_app() -> FastAPI:
@@ -125,7 +156,9 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor"],
     )
+    app.add_middleware(DBPoolUsageMiddleware)
 
     container: AsyncContainer = make_async_container(*get_providers())
     setup_dishka(container, app)
@@ -6,6 +6,8 @@ from application.exceptions import (
     BusinessRuleViolationError,
     FailedFetchArtifactMuseumAPIException,
     FailedPublishArtifactMessageBrokerException,
+    InvalidCursorError,
+    LLMTimeoutError,
 )
 from domain.exceptions import (
     DomainValidationError,
@@ -69,6 +71,16 @@ def setup_exception_handlers(app: FastAPI) -> None:
             content={"message": str(exc)},
         )
 
+    @app.exception_handler(InvalidCursorError)
+    async def invalid_cursor_error_handler(
+        request: Request,
+        exc: InvalidCursorError,
+    ) -> JSONResponse:
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={"message": str(exc)},
+        )
+
     @app.exception_handler(BusinessRuleViolationError)
     async def business_rule_violation_error_handler(
         request: Request,
@@ -79,6 +91,16 @@ def setup_exception_handlers(app: FastAPI) -> None:
             content={"message": str(exc)},
         )
 
+    @app.exception_handler(LLMTimeoutError)
+    async def llm_timeout_error_handler(
+        request: Request,
+        exc: LLMTimeoutError,
+    ) -> JSONResponse:
+        return JSONResponse(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            content={"message": str(exc)},
+        )
+
     @app.exception_handler(UserAlreadyExistsError)
     async def user_already_exists_error_handler(
         request: Request,
@@ -1 +1,58 @@
-# TODO
+import logging
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infrastructures.db.pool_metrics import end_request_usage, start_request_usage
+
+logger = logging.getLogger(__name__)
+
+
+class DBPoolUsageMiddleware:
+    """
+    Mede a ocupação do pool de conexões por requisição: quantas conexões foram pegas,
+    por quanto tempo ficaram presas e o pico de conexões em uso no pool.
+
+    O resultado vai no header Server-Timing (db-pool) e no log; requisições que seguram
+    conexões por mais de slow_hold_ms geram um warning.
+    """
+
+    def __init__(self, app: ASGIApp, slow_hold_ms: float = 1000.0):
+        self.app = app
+        self.slow_hold_ms = slow_hold_ms
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        usage, token = start_request_usage()
+        started = time.perf_counter()
+
+        async def send_with_usage(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    f'db-pool;dur={usage.held_ms:.1f};desc="{usage.checkouts} checkouts, peak {usage.peak_pool_in_use}"',
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_usage)
+        finally:
+            end_request_usage(token)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            level = logging.WARNING if usage.held_ms > self.slow_hold_ms else logging.DEBUG
+            logger.log(
+                level,
+                "%s %s: %d checkouts, conexões presas %.1f ms de %.1f ms, pico no pool %d%s",
+                scope["method"],
+                scope["path"],
+                usage.checkouts,
+                usage.held_ms,
+                elapsed_ms,
+                usage.peak_pool_in_use,
+                f", {usage.open_connections} ainda abertas" if usage.open_connections else "",
+            )
@@ -3,6 +3,7 @@ from fastapi import APIRouter, Query, HTTPException
 # 1. Importe DishkaRoute aqui
 from dishka.integrations.fastapi import FromDishka, DishkaRoute 
 
+from application.exceptions import LLMTimeoutError
 from application.use_cases.candidates.analyze_candidates import AnalyzeCandidatesUseCase
 from presentation.api.rest.v1.schemas.candidates import AnalysisResponse
 
@@ -34,6 +35,9 @@ async def analyze_candidates(
     
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except LLMTimeoutError:
+        # Tratado pelo handler global (504)
+        raise
     except Exception as e:
         # Trata erros de negócio
         from application.exceptions import BusinessRuleViolationError
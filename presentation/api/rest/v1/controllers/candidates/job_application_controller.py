@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Query, Response
 from dishka.integrations.fastapi import FromDishka, inject
 from presentation.api.rest.v1.schemas.job_application import (
     CreateJobApplicationSchema,
@@ -8,6 +8,7 @@ from presentation.api.rest.v1.schemas.job_application import (
     StoredResumeAnalysisSchema,
 )
 from application.dtos.candidates.job_application import CreateJobApplicationDTO
+from application.dtos.pagination import MAX_PAGE_SIZE
 from application.use_cases.candidates.create_job_application import CreateJobApplicationUseCase
 from application.use_cases.candidates.list_job_applications import ListJobApplicationsUseCase
 from application.use_cases.candidates.update_job_application_status import UpdateJobApplicationStatusUseCase
@@ -50,10 +51,16 @@ async def create_job_application(
 @router.get("/", response_model=list[JobApplicationSchema])
 @inject
 async def list_job_applications(
+    response: Response,
     use_case: FromDishka[ListJobApplicationsUseCase],
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(None),
     user=Depends(get_current_user),
 ):
-    results = await use_case(user.id)
+    # O corpo continua sendo uma lista; o cursor da próxima página vai no header X-Next-Cursor
+    page = await use_case(user.id, limit=limit, cursor=cursor)
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
     return [
         JobApplicationSchema(
             id=r.id,
@@ -66,7 +73,7 @@ async def list_job_applications(
             created_at=r.created_at.isoformat(),
             updated_at=r.updated_at.isoformat() if r.updated_at else None,
         )
-        for r in results
+        for r in page.items
     ]
 
 
@@ -1,8 +1,11 @@
 """Controller para análise de candidatos."""
-from fastapi import APIRouter, Query, HTTPException
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, HTTPException
 from dishka.integrations.fastapi import FromDishka, inject
 
 from application.use_cases.candidates.analyze import SearchCandidatesUseCase
+from presentation.api.rest.v1.dependencies import CurrentUser, get_optional_current_user
 from presentation.api.rest.v1.schemas.candidates import SearchResponseSchema, CandidateResultSchema
 
 router = APIRouter(prefix="/search", tags=["Candidates"])
@@ -12,12 +15,33 @@ router = APIRouter(prefix="/search", tags=["Candidates"])
 @inject
 async def analyze_candidates(
     query: str = Query(..., description="Descrição da Vaga"),
-    index_id: str = Query(..., description="ID do índice"),
+    index_id: str | None = Query(None, description="ID do índice"),
+    index_ids: list[str] | None = Query(None, description="IDs de vários índices (busca federada)"),
+    group_id: str | None = Query(
+        None, description="Analisa só os currículos deste grupo, em todos os índices dele (requer login)"
+    ),
+    sections: list[str] | None = Query(None, description="Busca só nestas seções do currículo"),
     use_case: FromDishka[SearchCandidatesUseCase] = None,
+    current_user: CurrentUser | None = Depends(get_optional_current_user),
 ):
     """Analisa candidatos baseado em descrição da vaga."""
+    user_id = None
+    if group_id is not None:
+        if current_user is None:
+            raise HTTPException(status_code=401, detail="Login necessário para analisar um grupo")
+        try:
+            user_id = UUID(current_user.id)
+        except (ValueError, TypeError):
+            raise HTTPException(status_code=401, detail="Usuário inválido")
     try:
-        result = await use_case.execute(query, index_id)
+        result = await use_case.execute(
+            query,
+            index_id,
+            group_id=group_id,
+            user_id=user_id,
+            sections=frozenset(sections) if sections else None,
+            index_ids=index_ids,
+        )
         
         return SearchResponseSchema(
             query=result.query,
@@ -1,8 +1,9 @@
 from dishka.integrations.fastapi import FromDishka, inject
-from fastapi import APIRouter, status, HTTPException, Query
+from fastapi import APIRouter, status, HTTPException, Query, Response
 from typing import List
 from uuid import UUID
 
+from application.dtos.pagination import MAX_PAGE_SIZE
 from application.services.chat.chat_service import ChatService
 from presentation.api.rest.v1.schemas.requests import CreateChatSessionRequest, AddMessageRequest, UpdateChatSessionRequest
 from presentation.api.rest.v1.schemas.responses import ChatSessionResponse, ChatMessageResponse
@@ -93,14 +94,19 @@ async def add_message(
     "/sessions/{session_id}/messages",
     response_model=List[ChatMessageResponse],
     status_code=status.HTTP_200_OK,
-    summary="Get all messages for a chat session",
+    summary="Get messages for a chat session (oldest first; cursor-paginated when limit or cursor is given)",
 )
 @inject
 async def get_session_messages(
     session_id: str,
+    response: Response,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: str | None = Query(None, description="Value of X-Next-Cursor from the previous page"),
     chat_service: FromDishka[ChatService] = None,
 ) -> List[ChatMessageResponse]:
-    messages = await chat_service.get_session_messages(UUID(session_id))
+    page = await chat_service.get_session_messages_page(UUID(session_id), limit=limit, cursor=cursor)
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
     return [
         ChatMessageResponse(
             message_id=str(m.message_id),
@@ -109,7 +115,7 @@ async def get_session_messages(
             text=m.text,
             timestamp=m.timestamp,
         )
-        for m in messages
+        for m in page.items
     ]
 
 
@@ -3,10 +3,11 @@ from uuid import UUID
 import dataclasses
 
 from dishka.integrations.fastapi import FromDishka, inject
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from presentation.api.rest.v1.dependencies import get_current_user, CurrentUser
 
 from application.dtos.jobs.job import CreateJobDTO, UpdateJobDTO, JobTypeDTO, JobStatusDTO
+from application.dtos.pagination import MAX_PAGE_SIZE
 from application.use_cases.jobs.job import (
     CreateJobUseCase,
     ListJobsUseCase,
@@ -14,9 +15,16 @@ from application.use_cases.jobs.job import (
     UpdateJobUseCase,
     DeleteJobUseCase,
     UpdateJobStatusUseCase,
+    SearchJobsUseCase,
 )
+from application.dtos.search import MAX_SEARCH_LIMIT
 from presentation.api.rest.v1.schemas.requests import CreateJobRequest, UpdateJobRequest
-from presentation.api.rest.v1.schemas.responses import JobResponseSchema, JobListResponseSchema
+from presentation.api.rest.v1.schemas.responses import (
+    JobResponseSchema,
+    JobListResponseSchema,
+    SearchHitSchema,
+    SearchResponseSchema,
+)
 
 
 router = APIRouter(prefix="/jobs", tags=["Jobs"])
@@ -56,16 +64,44 @@ async def create_job(
 )
 @inject
 async def list_jobs(
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
     current_user: CurrentUser = Depends(get_current_user),
     use_case: FromDishka[ListJobsUseCase] = None,
 ) -> JobListResponseSchema:
-    """List all jobs created by the authenticated user."""
+    """List the jobs created by the authenticated user, newest first, one page at a time."""
     user_id = UUID(current_user.id)
-    job_list_dto = await use_case(user_id)
+    job_list_dto = await use_case(user_id, limit=limit, cursor=cursor)
 
     return JobListResponseSchema(
         jobs=[JobResponseSchema.model_validate(dataclasses.asdict(job)) for job in job_list_dto.jobs],
-        total=job_list_dto.total
+        total=job_list_dto.total,
+        next_cursor=job_list_dto.next_cursor,
+    )
+
+
+@router.get(
+    "/search",
+    response_model=SearchResponseSchema,
+    status_code=status.HTTP_200_OK,
+    summary="Search jobs by keyword",
+)
+@inject
+async def search_jobs(
+    q: str = Query(..., min_length=1, max_length=200, description="Keywords, e.g. 'react senior'"),
+    limit: int | None = Query(None, ge=1, le=MAX_SEARCH_LIMIT, description="Maximum number of results"),
+    current_user: CurrentUser = Depends(get_current_user),
+    use_case: FromDishka[SearchJobsUseCase] = None,
+) -> SearchResponseSchema:
+    """Full-text search over the user's jobs (title, description, requirements, location), ranked."""
+    hits = await use_case(UUID(current_user.id), q, limit)
+
+    return SearchResponseSchema(
+        query=q,
+        results=[
+            SearchHitSchema(id=hit.doc_id, title=hit.title, score=hit.score, snippet=hit.snippet)
+            for hit in hits
+        ],
     )
 
 
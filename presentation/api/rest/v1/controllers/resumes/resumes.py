@@ -2,11 +2,12 @@ from typing import Annotated
 from pathlib import Path
 from uuid import UUID
 import os
+import hashlib
 import logging
 import urllib.parse
 
-from fastapi import APIRouter, UploadFile, File, HTTPException, Depends
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Request, Query
+from fastapi.responses import Response
 from dishka.integrations.fastapi import FromDishka, inject
 from presentation.api.rest.v1.dependencies import get_current_user, CurrentUser
 
@@ -19,7 +20,13 @@ from application.use_cases.resumes.ensure_upload_user import (
 )
 from application.use_cases.resumes.list_indexes import ListIndexesUseCase
 from application.use_cases.resumes.list_resumes import ListResumesUseCase
+from application.use_cases.resumes.get_resume import GetResumeUseCase
 from application.use_cases.resumes.delete_resume import DeleteResumeUseCase
+from application.use_cases.resumes.search_resumes import SearchResumesUseCase
+from application.interfaces.storage import BlobStoreProtocol
+from application.dtos.pagination import MAX_PAGE_SIZE
+from application.dtos.search import MAX_SEARCH_LIMIT
+from infrastructures.storage.content_types import get_content_type
 from presentation.api.rest.v1.schemas.resumes import (
     UploadResponse, 
     ListIndexesResponse, 
@@ -27,6 +34,7 @@ from presentation.api.rest.v1.schemas.resumes import (
     ListResumesResponse,
     ResumeSchema
 )
+from presentation.api.rest.v1.schemas.responses import SearchHitSchema, SearchResponseSchema
 
 router = APIRouter(prefix="/resumes", tags=["Resumes"])
 
@@ -81,9 +89,15 @@ async def upload_resumes(
         result = await use_case.execute(file_data, user_id)
     except Exception as e:
         # Trata erros de negócio e outros
-        from application.exceptions import BusinessRuleViolationError
+        from application.exceptions import BusinessRuleViolationError, StorageBatchError
         if isinstance(e, BusinessRuleViolationError):
             raise HTTPException(status_code=400, detail=str(e))
+        elif isinstance(e, StorageBatchError):
+            logger.error(f"Erro ao armazenar currículos: {e}")
+            raise HTTPException(
+                status_code=502,
+                detail={"message": "Falha ao armazenar alguns arquivos", "failed_files": e.failures}
+            )
         else:
             # Log do erro e resposta genérica
             logger.error(f"Erro ao fazer upload de currículos: {e}")
@@ -109,15 +123,16 @@ async def upload_resumes(
 @router.get("/indexes", response_model=ListIndexesResponse)
 @inject
 async def list_indexes(
+    include_resumes: bool = Query(False, description="Inclui os currículos de cada índice"),
     use_case: FromDishka[ListIndexesUseCase] = None,
     current_user: CurrentUser = Depends(get_current_user)
 ):
-    """Lista todos os índices vetoriais salvos com seus currículos"""
+    """Lista os índices vetoriais salvos (contagem e data; currículos só com include_resumes=true)"""
     try:
         user_id = UUID(current_user.id)
     except (ValueError, TypeError):
         raise HTTPException(status_code=400, detail="ID do usuário inválido")
-    indexes_dict = await use_case.execute(user_id=user_id)
+    indexes_dict = await use_case.execute(user_id=user_id, include_resumes=include_resumes)
     
     # Converte para o formato de resposta
     indexes_response = {
@@ -127,35 +142,37 @@ async def list_indexes(
     
     return ListIndexesResponse(indexes=indexes_response)
 
+@router.get("/indexes/{index_id}/resumes", response_model=list[ResumeSchema])
+@inject
+async def list_index_resumes(
+    index_id: str,
+    use_case: FromDishka[ListIndexesUseCase] = None,
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    """Lista os currículos de um índice vetorial do usuário"""
+    try:
+        user_id = UUID(current_user.id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="ID do usuário inválido")
+    resumes = await use_case.list_index_resumes(index_id, user_id)
+    return [ResumeSchema(**r, vector_index_id=index_id) for r in resumes]
+
 @router.get("", response_model=ListResumesResponse)
 @inject
 async def list_resumes(
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Tamanho da página"),
+    cursor: str | None = Query(None, description="next_cursor da página anterior"),
     use_case: FromDishka[ListResumesUseCase] = None,
     current_user: CurrentUser = Depends(get_current_user)
 ):
-    """Lista todos os currículos salvos"""
+    """Lista os currículos salvos do usuário, paginados por cursor (mais recentes primeiro)"""
     try:
         user_id = UUID(current_user.id)
     except (ValueError, TypeError):
         raise HTTPException(status_code=400, detail="ID do usuário inválido")
     
-    print(f"\n{'='*80}")
-    print(f"📋 LIST RESUMES REQUEST")
-    print(f"   User ID from token: {user_id}")
-    print(f"   User type: {current_user.type}")
-    print(f"{'='*80}\n")
-    
-    resumes_dto = await use_case.execute(user_id=user_id)
-    
-    print(f"📊 CURRÍCULOS ENCONTRADOS: {len(resumes_dto)}")
-    for idx, r in enumerate(resumes_dto, 1):
-        print(f"   {idx}. Resume ID: {r.resume_id}")
-        print(f"      Nome: {r.candidate_name}")
-        print(f"      Arquivo: {r.file_name}")
-        print(f"      Indexado: {r.is_indexed}")
-        print(f"      Vector Index: {r.vector_index_id}")
-        print()
-    print(f"{'='*80}\n")
+    page = await use_case.execute_page(user_id=user_id, limit=limit, cursor=cursor)
+    logger.info(f"Listagem de currículos: usuário {user_id}, {len(page.items)} de {page.total}")
     
     resumes_schema = [
         ResumeSchema(
@@ -166,151 +183,159 @@ async def list_resumes(
             is_indexed=r.is_indexed,
             vector_index_id=r.vector_index_id
         )
-        for r in resumes_dto
+        for r in page.items
     ]
     
     return ListResumesResponse(
         resumes=resumes_schema,
-        total=len(resumes_schema)
+        total=page.total,
+        next_cursor=page.next_cursor
+    )
+
+@router.get("/search", response_model=SearchResponseSchema)
+@inject
+async def search_resumes(
+    q: str = Query(..., min_length=1, max_length=200, description="Palavras-chave, ex.: 'react senior'"),
+    limit: int | None = Query(None, ge=1, le=MAX_SEARCH_LIMIT, description="Número máximo de resultados"),
+    use_case: FromDishka[SearchResumesUseCase] = None,
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    """Busca por palavras-chave no texto dos currículos do usuário, ordenada por relevância"""
+    try:
+        user_id = UUID(current_user.id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="ID do usuário inválido")
+    
+    hits = await use_case.execute(user_id, q, limit)
+    return SearchResponseSchema(
+        query=q,
+        results=[
+            SearchHitSchema(id=hit.doc_id, title=hit.title, score=hit.score, snippet=hit.snippet)
+            for hit in hits
+        ],
     )
 
 @router.get("/{resume_id}/download")
 @inject
 async def download_resume(
     resume_id: str,
-    use_case: FromDishka[ListResumesUseCase] = None,
+    request: Request,
+    use_case: FromDishka[GetResumeUseCase] = None,
+    blob_store: FromDishka[BlobStoreProtocol] = None,
     current_user: CurrentUser = Depends(get_current_user)
 ):
-    """Download um currículo específico"""
+    """Download um currículo específico (suporta Range/206, ETag e If-None-Match/304)"""
     try:
         user_id = UUID(current_user.id)
         resume_uuid = UUID(resume_id)
     except (ValueError, TypeError) as e:
         raise HTTPException(status_code=400, detail=f"ID inválido: {str(e)}")
     
-    print(f"\n{'='*80}")
-    print(f"🔍 DOWNLOAD REQUEST")
-    print(f"   User ID: {user_id}")
-    print(f"   Resume ID: {resume_uuid}")
-    print(f"{'='*80}\n")
-    
-    # Buscar todos os currículos do usuário
-    resumes_dto = await use_case.execute(user_id=user_id)
-    
-    print(f"📊 CURRÍCULOS DO USUÁRIO: {len(resumes_dto)} encontrado(s)")
-    for idx, r in enumerate(resumes_dto, 1):
-        print(f"   {idx}. ID: {r.resume_id}")
-        print(f"      Nome: {r.candidate_name}")
-        print(f"      Arquivo: {r.file_name}")
-        print(f"      Path: {r.file_path}")
-        print(f"      Indexado: {r.is_indexed}")
-        print(f"      Vector Index: {r.vector_index_id}")
-        print()
-    
-    # Buscar o currículo específico
-    resume = next((r for r in resumes_dto if r.resume_id == resume_uuid), None)
-    
+    # Uma consulta por (resume_id, dono) em vez de carregar todos os currículos do usuário
+    resume = await use_case.execute(resume_uuid, user_id)
     if not resume:
-        print(f"❌ CURRÍCULO NÃO ENCONTRADO!")
-        print(f"   Procurado: {resume_uuid}")
-        print(f"   Disponíveis: {[r.resume_id for r in resumes_dto]}")
-        print(f"{'='*80}\n")
         raise HTTPException(
             status_code=404, 
-            detail=f"Currículo {resume_id} não encontrado ou não pertence a você. Total de currículos: {len(resumes_dto)}"
+            detail=f"Currículo {resume_id} não encontrado ou não pertence a você"
         )
+    logger.info(f"Download do currículo {resume.resume_id} ({resume.file_name}) por {user_id}")
     
-    print(f"✅ CURRÍCULO ENCONTRADO:")
-    print(f"   Nome: {resume.candidate_name}")
-    print(f"   Arquivo: {resume.file_name}")
-    print(f"   Path: {resume.file_path}")
-    print(f"{'='*80}\n")
+    # No Windows, path pode estar como sqlite:\pdf\...; normalizar para a chave do storage
+    location = str(resume.file_path).replace("\\", "/")
+    if location.startswith("sqlite:/") and not location.startswith("sqlite://"):
+        location = "sqlite://" + location[len("sqlite:"):].lstrip("/")
     
-    file_path_str = str(resume.file_path)
-    # No Windows, path pode estar como sqlite:\pdf\...; normalizar para detectar storage remoto
-    file_path_norm = file_path_str.replace("\\", "/")
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Cache-Control": "private, no-cache",
+        "Content-Disposition": f"attachment; filename*=UTF-8''{urllib.parse.quote(resume.file_name)}",
+    }
     
-    if file_path_norm.startswith("sqlite://") or file_path_norm.startswith("sqlite:/"):
-        try:
-            from config.ai.ai import AISettings
-            from infrastructures.storage.sqlite_storage import SQLiteFileStorageService, HTTPFileStorageService
-            from fastapi.responses import StreamingResponse
-            import io
-            
-            ai_settings = AISettings()
-            if not ai_settings.use_sqlite_storage:
-                raise HTTPException(status_code=500, detail="SQLite storage não configurado")
-            
-            storage_url = ai_settings.sqlite_storage_url.strip()
-            
-            if storage_url.startswith(('http://', 'https://')):
-                print(f"📥 Download via PythonAnywhere HTTP: {file_path_norm}")
-                sqlite_storage = HTTPFileStorageService(storage_url)
-            else:
-                print(f"📥 Download via SQLite local: {file_path_norm}")
-                sqlite_storage = SQLiteFileStorageService(storage_url)
-            
-            # Chave no formato sqlite://ext/filename (download_file aceita com ou sem prefixo)
-            download_key = file_path_norm if file_path_norm.startswith("sqlite://") else "sqlite://" + file_path_norm.lstrip("sqlite:/")
-            file_content = await sqlite_storage.download_file(download_key)
-            print(f"✅ Download concluído: {len(file_content)} bytes")
-            
-            return StreamingResponse(
-                io.BytesIO(file_content),
-                media_type='application/octet-stream',
-                headers={"Content-Disposition": f"attachment; filename*=UTF-8''{urllib.parse.quote(resume.file_name)}"}
-            )
-            
-        except FileNotFoundError:
-            raise HTTPException(status_code=404, detail=f"Arquivo não encontrado no SQLite: {file_path_str}")
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Erro ao fazer download do SQLite: {str(e)}")
+    # Blobs endereçados por conteúdo já trazem o SHA-256 no path: 304 sem ler o storage
+    digest = blob_store.content_digest(location)
+    if digest:
+        headers["ETag"] = f'"{digest}"'
+        if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+            return Response(status_code=304, headers=headers)
     
-    elif file_path_str.startswith("s3://"):
-        # Download do S3
-        try:
-            from config.ai.ai import AISettings
-            from infrastructures.storage.s3_storage import S3StorageService
-            from fastapi.responses import StreamingResponse
-            import io
-            
-            ai_settings = AISettings()
-            if not ai_settings.use_s3_storage:
-                raise HTTPException(status_code=500, detail="S3 não configurado")
-                
-            s3_storage = S3StorageService(
-                endpoint_url=ai_settings.s3_endpoint_url,
-                region=ai_settings.s3_region,
-                access_key=ai_settings.s3_access_key,
-                secret_key=ai_settings.s3_secret_key,
-                bucket_name=ai_settings.s3_bucket_name,
-                folder_prefix=ai_settings.s3_folder_prefix
-            )
-            
-            s3_key = file_path_str[5:] 
-            file_content = s3_storage.download_file(s3_key)
-            
-            return StreamingResponse(
-                io.BytesIO(file_content),
-                media_type='application/octet-stream',
-                headers={"Content-Disposition": f"attachment; filename*=UTF-8''{urllib.parse.quote(resume.file_name)}"}
+    try:
+        file_content = await blob_store.get(location)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail=f"Arquivo não encontrado: {resume.file_path}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erro ao fazer download do arquivo: {str(e)}")
+    
+    if not digest:
+        # Arquivos antigos (chave por nome): ETag forte a partir do conteúdo
+        headers["ETag"] = f'"{hashlib.sha256(file_content).hexdigest()}"'
+        if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+    
+    media_type = get_content_type(Path(resume.file_name).suffix)
+    total = len(file_content)
+    
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and (not if_range or if_range.strip() == headers["ETag"]):
+        byte_range = _parse_byte_range(range_header, total)
+        if byte_range is not None:
+            start, end = byte_range
+            return Response(
+                content=file_content[start:end + 1],
+                status_code=206,
+                media_type=media_type,
+                headers={**headers, "Content-Range": f"bytes {start}-{end}/{total}"},
             )
-            
-        except FileNotFoundError:
-            raise HTTPException(status_code=404, detail=f"Arquivo não encontrado no S3: {s3_key}")
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Erro ao fazer download do S3: {str(e)}")
-    else:
-        file_path = Path(file_path_str)
-        if not file_path.exists():
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            raise HTTPException(status_code=404, detail=f"Arquivo não encontrado: {resume.file_path}")
-        
-        return FileResponse(
-            path=resume.file_path,
-            filename=urllib.parse.quote(resume.file_name),
-            media_type='application/octet-stream'
+    
+    return Response(content=file_content, media_type=media_type, headers=headers)
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Compara If-None-Match com o ETag (aceita lista, '*' e prefixo fraco W/)"""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def _parse_byte_range(range_header: str, total: int):
+    """
+    Interpreta um único intervalo 'bytes=inicio-fim' / 'bytes=inicio-' / 'bytes=-sufixo'.
+    
+    Returns:
+        (inicio, fim) inclusivos, ou None se o header deve ser ignorado
+        (múltiplos intervalos ou formato inválido, como fim < início -> resposta 200 completa)
+    
+    Raises:
+        HTTPException 416 se o intervalo não é satisfazível
+    """
+    unit, _, spec = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    start_str, sep, end_str = spec.strip().partition("-")
+    if not sep:
+        return None
+    try:
+        if start_str == "":
+            suffix = int(end_str)
+            start, end = max(total - suffix, 0), total - 1
+            satisfiable = suffix > 0
+        else:
+            start = int(start_str)
+            end = int(end_str) if end_str else total - 1
+            if end_str and start > end:
+                # Sintaticamente inválido (RFC 9110 14.1.1): ignora o header
+                return None
+            satisfiable = True
+    except ValueError:
+        return None
+    if not satisfiable or start >= total:
+        raise HTTPException(
+            status_code=416,
+            detail="Intervalo solicitado inválido",
+            headers={"Content-Range": f"bytes */{total}"}
         )
+    return start, min(end, total - 1)
 
 @router.delete("/{resume_id}")
 @inject
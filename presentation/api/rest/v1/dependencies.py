@@ -18,6 +18,7 @@ def _get_secret_key() -> str:
 ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/users/login")
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/users/login", auto_error=False)
 
 @dataclass
 class CurrentUser:
@@ -47,4 +48,13 @@ async def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]) -> Cur
         return CurrentUser(id=user_id, type=user_type)
 
     except jwt.InvalidTokenError:
-        raise credentials_exception
\ No newline at end of file
+        raise credentials_exception
+
+
+async def get_optional_current_user(
+    token: Annotated[str | None, Depends(optional_oauth2_scheme)],
+) -> CurrentUser | None:
+    """Como get_current_user, mas devolve None quando a requisição não tem token."""
+    if token is None:
+        return None
+    return await get_current_user(token)
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Optional
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -87,6 +88,29 @@ class JobListResponseSchema(BaseModel):
 
     jobs: list[JobResponseSchema] = Field(..., description="List of jobs")
     total: int = Field(..., description="Total number of jobs")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, null on the last page")
+
+
+class SearchHitSchema(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+    )
+
+    id: str = Field(..., description="Job or resume ID")
+    title: str = Field(..., description="Job title or candidate name")
+    score: float = Field(..., description="Relevance, higher is better")
+    snippet: str = Field(..., description="Excerpt around the first match")
+
+
+class SearchResponseSchema(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+    )
+
+    query: str = Field(..., description="Search terms")
+    results: list[SearchHitSchema] = Field(..., description="Results, most relevant first")
 
 
 # Chat schemas
@@ -22,7 +22,7 @@ class IndexInfoResponse(BaseModel):
     vector_index_id: str
     resume_count: int
     first_uploaded_at: str
-    resumes: list[ResumeSchema]
+    resumes: list[ResumeSchema] = []
 
 class ListIndexesResponse(BaseModel):
     """Resposta com lista de índices."""
@@ -32,6 +32,7 @@ class ListResumesResponse(BaseModel):
     """Resposta com lista de currículos."""
     resumes: list[ResumeSchema]
     total: int
+    next_cursor: Optional[str] = None
 
 
 class ResumeGroupSchema(BaseModel):
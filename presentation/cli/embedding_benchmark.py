@@ -0,0 +1,108 @@
+"""
+Mede tamanho e recall dos embeddings quantizados (float16, int8, int8 com rescore)
+contra a busca exata em float32, usando os próprios vetores de um índice local.
+
+As consultas são vetores de chunks sorteados do índice e retirados do conjunto
+buscado (senão cada consulta acharia a si mesma e o recall sairia inflado); o
+gabarito é o top-k exato em float32 sobre os vetores restantes. Não chama o
+modelo de embedding.
+
+Uso:
+    python -m presentation.cli.embedding_benchmark 20250101120000
+    python -m presentation.cli.embedding_benchmark ./vector_stores/resumes/20250101120000 --queries 500 --top-k 10
+"""
+import argparse
+import io
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+
+from config.ai.ai import AISettings
+from infrastructures.search.quantized_vectors import FULL_PRECISION_FILENAME, QuantizedVectors
+
+_VECTOR_STORE_FILENAME = "default__vector_store.json"
+
+
+def _load_embeddings(persist_dir: Path) -> dict[str, list[float]]:
+    full_path = persist_dir / FULL_PRECISION_FILENAME
+    quantized = QuantizedVectors.load(persist_dir)
+    if quantized is not None:
+        if not full_path.exists():
+            raise SystemExit("O índice só tem vetores quantizados; não há float32 para comparar.")
+        return dict(zip(quantized.node_ids, np.load(full_path).tolist()))
+    data = json.loads((persist_dir / _VECTOR_STORE_FILENAME).read_text(encoding="utf-8"))
+    return data["embedding_dict"]
+
+
+def _saved_size(vectors: QuantizedVectors) -> int:
+    buffer = io.BytesIO()
+    arrays = {"node_ids": np.array(vectors.node_ids), "codes": vectors.codes}
+    if vectors.scales is not None:
+        arrays["scales"] = vectors.scales
+    np.savez(buffer, **arrays)
+    return buffer.tell() + (vectors.full.nbytes if vectors.full is not None else 0)
+
+
+def run(persist_dir: Path, queries: int, top_k: int, rescore_factor: int, seed: int) -> None:
+    embeddings = _load_embeddings(persist_dir)
+    node_ids = list(embeddings)
+    rng = np.random.default_rng(seed)
+    # Metade do índice no máximo vira consulta; o resto é o conjunto buscado
+    held_out = set(rng.choice(len(node_ids), size=min(queries, len(node_ids) // 2), replace=False).tolist())
+    searched = {node_id: embeddings[node_id] for i, node_id in enumerate(node_ids) if i not in held_out}
+    if len(searched) <= top_k or not held_out:
+        raise SystemExit(f"Índice com {len(embeddings)} vetores: pequeno demais para top-{top_k}.")
+
+    exact = QuantizedVectors.build("float16", searched, keep_full_precision=True)
+    full = np.asarray(exact.full)
+    queries_matrix = np.asarray([embeddings[node_ids[i]] for i in sorted(held_out)], dtype=np.float32)
+    queries_matrix /= np.maximum(np.linalg.norm(queries_matrix, axis=1, keepdims=True), 1e-12)
+
+    def ground_truth(query: np.ndarray) -> set[str]:
+        best = np.argsort(-(full @ query))[:top_k]
+        return {exact.node_ids[int(i)] for i in best}
+
+    truths = [ground_truth(query) for query in queries_matrix]
+    json_size = len(json.dumps({k: list(map(float, v)) for k, v in searched.items()}))
+    print(
+        f"{len(searched)} vetores de {full.shape[1]} dimensões, {len(queries_matrix)} consultas "
+        f"(fora do conjunto buscado), top-{top_k}"
+    )
+    print(f"{'formato':<16}{'bytes salvos':>14}{'redução':>9}{'memória':>12}{'recall':>8}{'ms/consulta':>13}")
+    print(f"{'float32 (JSON)':<16}{json_size:>14}{'1.0x':>9}{'-':>12}{'1.000':>8}{'-':>13}")
+
+    variants = [("float16", False), ("int8", False), ("int8 + rescore", True)]
+    for name, rescore in variants:
+        vectors = QuantizedVectors.build(name.split()[0], searched, keep_full_precision=rescore)
+        vectors.rescore_factor = rescore_factor
+        started = time.perf_counter()
+        found = [{node_id for node_id, _ in vectors.search(query, top_k)} for query in queries_matrix]
+        elapsed_ms = (time.perf_counter() - started) * 1000 / len(queries_matrix)
+        recall = float(np.mean([len(f & t) / top_k for f, t in zip(found, truths)]))
+        size = _saved_size(vectors)
+        print(
+            f"{name:<16}{size:>14}{json_size / size:>8.1f}x{vectors.nbytes:>12}{recall:>8.3f}{elapsed_ms:>13.2f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Recall e tamanho dos embeddings quantizados de um índice")
+    parser.add_argument("index", help="ID do índice (em vector_store_dir) ou caminho do diretório")
+    parser.add_argument("--queries", type=int, default=200, help="Vetores sorteados do índice e usados como consulta")
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--rescore-factor", type=int, default=4, help="Candidatos reordenados = top_k * fator")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    persist_dir = Path(args.index)
+    if not persist_dir.is_dir():
+        persist_dir = Path(AISettings().vector_store_dir) / args.index
+    if not persist_dir.is_dir():
+        raise SystemExit(f"Índice não encontrado: {args.index}")
+    run(persist_dir, args.queries, args.top_k, args.rescore_factor, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Reconstrói o índice de texto completo (vagas e currículos).
+
+Uso:
+    python -m presentation.cli.search_reindex
+    python -m presentation.cli.search_reindex --batch-size 100
+"""
+import argparse
+import asyncio
+
+from dishka import make_async_container
+
+from config.ioc.di import get_providers
+from infrastructures.search.reindexer import FullTextReindexer
+
+
+async def run(batch_size: int | None) -> None:
+    container = make_async_container(*get_providers())
+    try:
+        reindexer = await container.get(FullTextReindexer)
+        if batch_size is not None:
+            reindexer.batch_size = max(1, batch_size)
+
+        report = await reindexer.run()
+    finally:
+        await container.close()
+
+    print(report.summary())
+    for resume_id, error in report.errors.items():
+        print(f"  erro: {resume_id}: {error}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Reconstrói o índice de busca por palavras-chave")
+    parser.add_argument("--batch-size", type=int, default=None, help="Documentos por lote")
+    args = parser.parse_args()
+    asyncio.run(run(args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Coleta de lixo do storage (arquivos, índices e registros de blob sem currículo que os referencie).
+
+Uso:
+    python -m presentation.cli.storage_gc --dry-run
+    python -m presentation.cli.storage_gc --min-age-hours 24 --batch-size 200
+"""
+import argparse
+import asyncio
+import json
+from dataclasses import asdict
+from datetime import timedelta
+
+from dishka import make_async_container
+
+from config.ioc.di import get_providers
+from infrastructures.storage.garbage_collector import StorageGarbageCollector
+
+
+async def run(dry_run: bool, min_age_hours: float | None, batch_size: int | None, as_json: bool) -> None:
+    container = make_async_container(*get_providers())
+    try:
+        collector = await container.get(StorageGarbageCollector)
+        if min_age_hours is not None:
+            collector.min_age = timedelta(hours=min_age_hours)
+        if batch_size is not None:
+            collector.batch_size = max(1, batch_size)
+
+        report = await collector.run(dry_run=dry_run)
+    finally:
+        await container.close()
+
+    if as_json:
+        print(json.dumps(asdict(report), indent=2, ensure_ascii=False))
+        return
+
+    print(("[DRY-RUN] " if dry_run else "") + report.summary())
+    for location in report.orphaned_files:
+        print(f"  arquivo: {location}")
+    for directory in report.orphaned_index_dirs:
+        print(f"  índice:  {directory}")
+    for name, error in report.errors.items():
+        print(f"  erro:    {name}: {error}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Remove arquivos e índices órfãos do storage")
+    parser.add_argument("--dry-run", action="store_true", help="Apenas lista o que seria removido")
+    parser.add_argument("--min-age-hours", type=float, default=None, help="Idade mínima dos objetos removidos")
+    parser.add_argument("--batch-size", type=int, default=None, help="Quantidade de remoções por lote")
+    parser.add_argument("--json", action="store_true", help="Imprime o relatório em JSON")
+    args = parser.parse_args()
+    asyncio.run(run(args.dry_run, args.min_age_hours, args.batch_size, args.json))
+
+
+if __name__ == "__main__":
+    main()
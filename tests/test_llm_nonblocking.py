@@ -0,0 +1,123 @@
+"""Chamadas ao LLM não bloqueiam o event loop e respeitam o timeout (504 na API)."""
+import asyncio
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from llama_index.core import Settings as LlamaSettings
+from llama_index.core.llms import CompletionResponse, CustomLLM, LLMMetadata
+from llama_index.core.llms.callbacks import llm_completion_callback
+
+from application.exceptions import LLMTimeoutError
+from infrastructures.ai.location_analyzer import LocationAnalyzer
+from infrastructures.ai.ollama_analyzer import OllamaAnalyzer
+from presentation.api.rest.error_handling import setup_exception_handlers
+from presentation.api.rest.v1.controllers.candidates.candidates import analyze_candidates
+
+LLM_DELAY = 0.3
+TICK = 0.01
+
+_RESPONSE = (
+    "TIPO_VAGA: PRESENCIAL\nLOCALIZAÇÃO_VAGA: Recife\nLOCALIZAÇÃO: Recife\nDISPOSIÇÃO_MUDANÇA: NAO\n"
+    '{"candidato": "Ana", "nota": 70, "pontos_fortes": ["Python"], "pontos_fracos": [], "justificativa": "ok"}'
+)
+
+
+class SlowLLM(CustomLLM):
+    """LLM falso: acomplete espera sem bloquear; complete (síncrono) não deve ser usado"""
+
+    delay: float = LLM_DELAY
+    calls: int = 0
+
+    @property
+    def metadata(self) -> LLMMetadata:
+        return LLMMetadata()
+
+    @llm_completion_callback()
+    def complete(self, prompt: str, formatted: bool = False, **kwargs) -> CompletionResponse:
+        raise AssertionError("chamada síncrona ao LLM bloquearia o event loop")
+
+    @llm_completion_callback()
+    async def acomplete(self, prompt: str, formatted: bool = False, **kwargs) -> CompletionResponse:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return CompletionResponse(text=_RESPONSE)
+
+    def stream_complete(self, prompt: str, formatted: bool = False, **kwargs):
+        raise NotImplementedError
+
+
+@pytest.fixture
+def llm():
+    # Os analisadores também leem LlamaSettings.llm (logs); evita resolver o LLM padrão
+    previous = LlamaSettings._llm
+    fake = SlowLLM()
+    LlamaSettings.llm = fake
+    yield fake
+    LlamaSettings._llm = previous
+
+
+async def _ticker(stop: asyncio.Event) -> tuple[int, float]:
+    """Conta ticks de TICK segundos e o maior atraso do event loop"""
+    ticks, worst = 0, 0.0
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(TICK)
+        worst = max(worst, time.perf_counter() - started - TICK)
+        ticks += 1
+    return ticks, worst
+
+
+def test_llm_calls_do_not_block_event_loop(llm):
+    async def scenario():
+        stop = asyncio.Event()
+        ticker = asyncio.create_task(_ticker(stop))
+        started = time.perf_counter()
+        result, location = await asyncio.gather(
+            OllamaAnalyzer(llm=llm).analyze_candidate(["Python, Django"], "Vaga de desenvolvedor Python"),
+            LocationAnalyzer(llm=llm).analyze_location("Vaga presencial em Recife", "Mora em Recife - PE"),
+        )
+        elapsed = time.perf_counter() - started
+        stop.set()
+        ticks, worst_lag = await ticker
+        return result, location, elapsed, ticks, worst_lag
+
+    result, location, elapsed, ticks, worst_lag = asyncio.run(scenario())
+    assert result.score == 70
+    assert location.match_status == "LOCATION_MATCH"
+    # Os dois analisadores correram em paralelo e o ticker continuou rodando durante eles
+    assert llm.calls >= 2
+    assert elapsed < llm.calls * LLM_DELAY
+    assert ticks >= (LLM_DELAY / TICK) / 2
+    assert worst_lag < LLM_DELAY / 2
+
+
+def test_analyze_candidate_timeout_raises(llm):
+    analyzer = OllamaAnalyzer(llm=llm, timeout=LLM_DELAY / 10)
+    with pytest.raises(LLMTimeoutError):
+        asyncio.run(analyzer.analyze_candidate(["Python"], "Vaga de desenvolvedor Python"))
+
+
+def test_llm_timeout_returns_504(llm):
+    app = FastAPI()
+    setup_exception_handlers(app)
+
+    @app.get("/analyze")
+    async def analyze():
+        analyzer = OllamaAnalyzer(llm=llm, timeout=LLM_DELAY / 10)
+        await analyzer.analyze_candidate(["Python"], "Vaga de desenvolvedor Python")
+
+    response = TestClient(app).get("/analyze")
+    assert response.status_code == 504
+    assert response.json()["message"]
+
+
+def test_candidates_controller_lets_timeout_reach_handler(llm):
+    class TimingOutUseCase:
+        async def execute(self, job_description: str, index_id: str):
+            await OllamaAnalyzer(llm=llm, timeout=LLM_DELAY / 10).analyze_candidate(["Python"], job_description)
+
+    # Não pode virar HTTPException 500 no controller
+    with pytest.raises(LLMTimeoutError):
+        asyncio.run(analyze_candidates(use_case=TimingOutUseCase(), job_description="Vaga de desenvolvedor Python", index_id="idx"))
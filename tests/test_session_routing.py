@@ -0,0 +1,100 @@
+"""Roteamento primário/réplica da RoutingSession com um par de bancos SQLite."""
+import asyncio
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, String, select
+from sqlalchemy.orm import declarative_base
+
+from infrastructures.db.pagination import fetch_keyset_page
+from infrastructures.db.session import READ_ONLY_KEY, WROTE_KEY, create_engine, get_session_factory
+
+Base = declarative_base()
+
+
+class Marker(Base):
+    __tablename__ = "markers"
+
+    id = Column(Integer, primary_key=True)
+    origin = Column(String(16), nullable=False)
+    created_at = Column(DateTime, nullable=False)
+
+
+async def _engines(tmp_path):
+    primary = create_engine(f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}", is_echo=False)
+    replica = create_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}", is_echo=False)
+    for engine, origin in ((primary, "primary"), (replica, "replica")):
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(
+                Marker.__table__.insert().values(id=1, origin=origin, created_at=datetime(2024, 1, 1))
+            )
+    return primary, replica
+
+
+def _origin_query():
+    return select(Marker.origin).where(Marker.id == 1)
+
+
+def test_read_only_session_reads_replica_until_first_write(tmp_path):
+    async def scenario():
+        primary, replica = await _engines(tmp_path)
+        factory = get_session_factory(primary, [replica])
+        origins = []
+        async with factory(info={READ_ONLY_KEY: True}) as session:
+            origins.append(await session.scalar(_origin_query()))
+            # Paginação lê o dialeto da sessão: não pode fixar a sessão no primário
+            page = await fetch_keyset_page(
+                session,
+                select(Marker),
+                timestamp_column=Marker.created_at,
+                id_column=Marker.id,
+                limit=10,
+                cursor=None,
+                to_entity=lambda model: model.origin,
+            )
+            origins.extend(page.items)
+            # get_bind() sem statement (só para ler o dialeto) também não
+            session.sync_session.get_bind()
+            pinned_before_write = session.info.get(WROTE_KEY, False)
+
+            session.add(Marker(id=2, origin="primary", created_at=datetime(2024, 1, 2)))
+            await session.flush()
+            origins.append(await session.scalar(_origin_query()))
+            await session.commit()
+        await primary.dispose()
+        await replica.dispose()
+        return origins, pinned_before_write
+
+    origins, pinned_before_write = asyncio.run(scenario())
+    assert origins == ["replica", "replica", "primary"]
+    assert pinned_before_write is False
+
+
+def test_write_session_reads_primary(tmp_path):
+    async def scenario():
+        primary, replica = await _engines(tmp_path)
+        factory = get_session_factory(primary, [replica])
+        async with factory(info={READ_ONLY_KEY: False}) as session:
+            origin = await session.scalar(_origin_query())
+        await primary.dispose()
+        await replica.dispose()
+        return origin
+
+    assert asyncio.run(scenario()) == "primary"
+
+
+def test_connection_released_after_reads_only_in_read_only_sessions(tmp_path):
+    async def scenario():
+        primary, replica = await _engines(tmp_path)
+        factory = get_session_factory(primary)
+        in_transaction = {}
+        for read_only in (True, False):
+            async with factory(info={READ_ONLY_KEY: read_only}) as session:
+                await session.scalar(_origin_query())
+                in_transaction[read_only] = session.in_transaction()
+        await primary.dispose()
+        await replica.dispose()
+        return in_transaction
+
+    # Sessões de escrita mantêm a leitura e a escrita seguinte na mesma transação
+    assert asyncio.run(scenario()) == {True: False, False: True}